@@ -1,7 +1,8 @@
 from django.contrib import admin
-from .models import Course, FacultyCourseAssignment, Enrollment, Grade
+from .models import Course, FacultyCourseAssignment, Enrollment, Grade, Semester
 
 admin.site.register(Course)
 admin.site.register(FacultyCourseAssignment)
 admin.site.register(Enrollment)
 admin.site.register(Grade)
+admin.site.register(Semester)
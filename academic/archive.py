@@ -0,0 +1,91 @@
+"""
+Semester archival.
+
+archive_semester() moves a closed semester's Enrollment and Grade rows into
+ArchivedEnrollment / ArchivedGrade: per table one INSERT ... SELECT and one
+DELETE, in one transaction, with the rows keeping their ids. The hot tables
+then only hold the terms still in progress, which is what the enrollment,
+grade, schedule and dashboard queries read.
+
+Per-student reads that span every term (academic history, transcript, GPA)
+read both tables; see student_grades() and academic.dashboard.history_rows.
+"""
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef, Value
+from django.utils import timezone
+
+from config.cache import bump_version
+from config.counts import invalidate_counts
+from .models import ArchivedEnrollment, ArchivedGrade, Enrollment, Grade, Semester
+
+# archive model -> (hot model, columns copied as is)
+ARCHIVES = {
+    ArchivedEnrollment: (Enrollment, ['id', 'student_id', 'course_id', 'enrolled_at', 'status']),
+    ArchivedGrade: (Grade, ['id', 'student_id', 'course_id', 'grade', 'gpa', 'graded_by_id', 'version']),
+}
+
+
+def _move(archive_model, semester):
+    model, columns = ARCHIVES[archive_model]
+    rows = model.objects.filter(course__semester=semester.name)
+    # A student who re-enrolled in (or was regraded for) a course of an archived
+    # semester: the newer row replaces the archived one, as the hot table's
+    # (student, course) key would have.
+    archive_model.objects.filter(semester=semester).filter(
+        Exists(rows.filter(student_id=OuterRef('student_id'), course_id=OuterRef('course_id')))
+    ).delete()
+    select, params = (
+        rows.annotate(archive_semester_id=Value(semester.pk))
+        .values_list(*columns, 'archive_semester_id')
+        .order_by()
+        .query.sql_with_params()
+    )
+    quote = connection.ops.quote_name
+    archive_table, table = quote(archive_model._meta.db_table), quote(model._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {archive_table} ({', '.join(map(quote, columns))}, {quote('semester_id')}) {select}",
+            params,
+        )
+        moved = cursor.rowcount
+        # Exactly the rows just copied; raw SQL so no per-row delete signals fire.
+        cursor.execute(
+            f"DELETE FROM {table} WHERE {quote('id')} IN "
+            f"(SELECT {quote('id')} FROM {archive_table} WHERE {quote('semester_id')} = %s)",
+            [semester.pk],
+        )
+    return moved
+
+
+def archive_semester(name):
+    """
+    Move semester `name`'s enrollments and grades to the archive tables.
+    Returns {'enrollments': n, 'grades': n}. Running it again moves only
+    rows added since, replacing archived rows for the same student and course.
+    """
+    with transaction.atomic():
+        semester, _ = Semester.objects.get_or_create(name=name)
+        student_ids = set(
+            Enrollment.objects.filter(course__semester=name).values_list('student_id', flat=True)
+        )
+        moved = {
+            'enrollments': _move(ArchivedEnrollment, semester),
+            'grades': _move(ArchivedGrade, semester),
+        }
+        if semester.archived_at is None:
+            semester.archived_at = timezone.now()
+            semester.save(update_fields=['archived_at'])
+
+    # What the Enrollment / Grade delete receivers would have done.
+    bump_version(*(f'{prefix}:student:{pk}' for pk in student_ids for prefix in ('schedule', 'scope')))
+    invalidate_counts(Enrollment, Grade)
+    return moved
+
+
+def student_grades(student):
+    """The student's current and archived grades with their courses, by semester."""
+    grades = [
+        *ArchivedGrade.objects.filter(student=student).superseded_excluded().for_transcript(),
+        *Grade.objects.filter(student=student).for_transcript(),
+    ]
+    return sorted(grades, key=lambda grade: grade.course.semester)
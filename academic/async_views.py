@@ -0,0 +1,82 @@
+"""
+Async versions of the hottest read endpoints, served when ASYNC_VIEWS is on.
+
+Each class has the same name, URL, permissions and payload as its sync
+counterpart in academic.views (so QUERY_BUDGETS and the metrics registry
+treat them the same), but is an AsyncAPIView using the async ORM. The
+async ORM runs every query on the one thread-sensitive executor thread, so
+a view's queries still run one after another; what the event loop gains is
+serving other requests while they run.
+"""
+import datetime
+
+from django.db.models import Count
+from rest_framework.response import Response
+
+from config.async_views import AsyncAPIView
+from users.models import Faculty, Student
+from users.permissions import IsAdminUser, IsFacultyUser, IsStudentUser
+from .dashboard import history_rows, history_summary, student_stats
+from .models import Course, Enrollment
+from .schedule import aget_today_schedule
+from .scope import access_scope
+
+
+class ScheduleTodayView(AsyncAPIView):
+    """
+    GET /api/academic/schedules/today/?role=faculty|student
+    Returns today's and tomorrow's class schedules.
+    """
+
+    async def get(self, request):
+        return Response(await aget_today_schedule(request.user, datetime.date.today()))
+
+
+class AcademicHistorySummaryView(AsyncAPIView):
+    """
+    GET /api/academic/history/summary/?student=current
+    Returns cumulative academic summary stats.
+    """
+    permission_classes = [IsStudentUser]
+
+    async def get(self, request):
+        rows = [row async for row in history_rows(request.user.student_profile)]
+        return Response(history_summary(rows))
+
+
+# ─── Dashboard stats ───────────────────────────────────────────────────────
+
+class AdminDashboardStatsView(AsyncAPIView):
+    """GET /api/dashboard/admin/stats/"""
+    permission_classes = [IsAdminUser]
+
+    async def get(self, request):
+        return Response({
+            'total_students': await Student.objects.acount(),
+            'total_faculty': await Faculty.objects.acount(),
+            'total_courses': await Course.objects.acount(),
+        })
+
+
+class FacultyDashboardStatsView(AsyncAPIView):
+    """GET /api/dashboard/faculty/stats/"""
+    permission_classes = [IsFacultyUser]
+
+    async def get(self, request):
+        course_ids = await access_scope(request.user).aget('assigned_course_ids')
+        total_students = await Enrollment.objects.filter(
+            course_id__in=course_ids, status='Active'
+        ).aaggregate(n=Count('student', distinct=True))
+        return Response({
+            'assigned_courses_count': len(course_ids),
+            'total_students_count': total_students['n'],
+        })
+
+
+class StudentDashboardStatsView(AsyncAPIView):
+    """GET /api/dashboard/student/stats/"""
+    permission_classes = [IsStudentUser]
+
+    async def get(self, request):
+        scope = access_scope(request.user)
+        return Response(student_stats(scope.student, await scope.aget('enrolled_course_ids')))
@@ -0,0 +1,133 @@
+"""
+Dashboard payloads, shared by the per-widget endpoints and the bootstrap
+endpoint that returns them all at once.
+
+The bootstrap view shares the user's access scope (academic.scope) across
+every section, then caches the whole composite per user under a versioned
+key that depends on the tables the sections read (see config.cache /
+config.counts), so any write that could change a number on the dashboard
+makes the next request rebuild it.
+"""
+import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+
+from config.cache import versioned_key
+from config.counts import count_namespaces
+from users.models import Faculty, Student
+from .models import ArchivedGrade, Course, Enrollment, FacultyCourseAssignment, Grade
+from .schedule import get_today_schedule, schedule_namespaces
+from .scope import access_scope
+from .serializers import CourseSerializer
+
+
+# ─── Sections ──────────────────────────────────────────────────────────────
+
+def admin_stats():
+    return {
+        'total_students': Student.objects.count(),
+        'total_faculty': Faculty.objects.count(),
+        'total_courses': Course.objects.count(),
+    }
+
+
+def faculty_stats(course_ids):
+    total_students = Enrollment.objects.filter(
+        course_id__in=course_ids, status='Active'
+    ).values('student').distinct().count()
+    return {
+        'assigned_courses_count': len(course_ids),
+        'total_students_count': total_students,
+    }
+
+
+def student_stats(student, course_ids):
+    return {
+        'enrolled_courses_count': len(course_ids),
+        'current_gpa': str(student.current_gpa),
+    }
+
+
+def history_rows(student):
+    """(gpa, credits, semester) for each of the student's grades, archived ones included."""
+    columns = ('gpa', 'course__credits', 'course__semester')
+    return Grade.objects.filter(student=student).values_list(*columns).union(
+        ArchivedGrade.objects.filter(student=student).superseded_excluded().values_list(*columns), all=True,
+    )
+
+
+def history_summary(rows):
+    """Cumulative GPA, credits, semesters and course count from history_rows()."""
+    total_credits = 0
+    total_points = 0
+    semesters = set()
+    completed = 0
+    for gpa, credits, semester in rows:
+        completed += 1
+        total_credits += credits
+        total_points += float(gpa or 0) * credits
+        if semester:
+            semesters.add(semester)
+
+    cgpa = round(total_points / total_credits, 2) if total_credits > 0 else 0.0
+    return {
+        'cumulative_gpa': cgpa,
+        'total_credits': total_credits,
+        'semesters_count': len(semesters),
+        'courses_completed': completed,
+    }
+
+
+def course_list(course_ids=None, limit=None):
+    """CourseSerializer rows (with students_count), by code."""
+    queryset = Course.objects.for_listing()
+    if course_ids is not None:
+        queryset = queryset.filter(id__in=course_ids)
+    if limit is not None:
+        queryset = queryset[:limit]
+    return CourseSerializer(queryset, many=True).data
+
+
+# ─── Bootstrap ─────────────────────────────────────────────────────────────
+
+# Tables each role's composite reads; a write to any of them rebuilds it.
+BOOTSTRAP_MODELS = {
+    'admin': (Student, Faculty, Course, Enrollment),
+    'faculty': (Course, FacultyCourseAssignment, Enrollment),
+    'student': (Student, Course, Enrollment, Grade),
+}
+ADMIN_COURSE_LIMIT = 5  # first page of the admin course list
+
+
+def build_bootstrap(user, role, today):
+    if role == 'admin':
+        return {
+            'stats': admin_stats(),
+            'courses': course_list(limit=ADMIN_COURSE_LIMIT),
+        }
+    scope = access_scope(user)
+    if role == 'faculty':
+        return {
+            'stats': faculty_stats(scope.assigned_course_ids),
+            'schedule_today': get_today_schedule(user, today),
+            'courses': course_list(scope.assigned_course_ids),
+        }
+    return {
+        'stats': student_stats(scope.student, scope.enrolled_course_ids),
+        'schedule_today': get_today_schedule(user, today),
+        'history_summary': history_summary(history_rows(scope.student)),
+        'courses': course_list(scope.enrolled_course_ids),
+    }
+
+
+def get_bootstrap(user, role, today=None):
+    """Every dashboard widget's payload for `role`, cached per user per day."""
+    today = today or datetime.date.today()
+    namespaces = [*schedule_namespaces(user), *count_namespaces(*BOOTSTRAP_MODELS[role])]
+    key = versioned_key('dashboard:bootstrap', namespaces, user.pk, role, today.isoformat())
+    payload = cache.get(key)
+    if payload is None:
+        payload = build_bootstrap(user, role, today)
+        cache.set(key, payload, settings.DASHBOARD_CACHE_TIMEOUT)
+    return payload
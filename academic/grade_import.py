@@ -0,0 +1,151 @@
+"""
+Grade import from an uploaded CSV or XLSX sheet.
+
+The sheet needs `student_id` and `grade` header columns (any order, any
+case; other columns are ignored). Rows are streamed and handled in chunks
+of GRADE_IMPORT_CHUNK_SIZE: one Enrollment query validates a chunk and one
+set-based upsert (academic.models.upsert_grades) writes its grades and GPAs, so
+memory and query count depend on the chunk size, not the section size.
+Each chunk commits on its own, so a large import never holds SQLite's write
+lock for the whole sheet; re-running a sheet is safe because unchanged grades
+are left alone. Rejected rows go to an error CSV in default_storage that the
+faculty member can download; everything else is applied.
+"""
+import codecs
+import csv
+import io
+import itertools
+import os
+import tempfile
+import uuid
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+from .models import Enrollment, Grade, upsert_grades
+
+try:
+    import openpyxl
+except ImportError:  # In requirements.txt; without it only CSV sheets import
+    openpyxl = None
+
+ERROR_DIR = 'grade-imports'
+ERROR_HEADER = ['row', 'student_id', 'grade', 'error']
+
+
+class ImportFileError(Exception):
+    pass
+
+
+# ─── Reading ──────────────────────────────────────────────────────────────
+
+def _csv_rows(upload):
+    # Iterating an UploadedFile yields lines chunk by chunk, never the whole file.
+    try:
+        yield from csv.reader(codecs.iterdecode(upload, 'utf-8-sig'))
+    except (UnicodeDecodeError, csv.Error) as exc:
+        raise ImportFileError(f'Could not read CSV: {exc}')
+
+
+def _xlsx_rows(upload):
+    if openpyxl is None:
+        raise ImportFileError('XLSX import needs the openpyxl package; upload a CSV instead.')
+    try:
+        # read_only streams rows from the zip instead of loading the whole workbook.
+        workbook = openpyxl.load_workbook(upload, read_only=True, data_only=True)
+    except Exception as exc:
+        raise ImportFileError(f'Could not read XLSX: {exc}')
+    try:
+        for row in workbook.worksheets[0].iter_rows(values_only=True):
+            yield ['' if cell is None else str(cell) for cell in row]
+    finally:
+        workbook.close()
+
+
+def read_sheet(upload):
+    """Yield (row number, student_id, grade) from an uploaded sheet."""
+    name = (upload.name or '').lower()
+    if name.endswith('.xlsx'):
+        rows = _xlsx_rows(upload)
+    elif name.endswith('.csv'):
+        rows = _csv_rows(upload)
+    else:
+        raise ImportFileError('Upload a .csv or .xlsx file.')
+
+    header = [cell.strip().lower() for cell in next(rows, [])]
+    if 'student_id' not in header or 'grade' not in header:
+        raise ImportFileError('The first row must name the student_id and grade columns.')
+    student_col, grade_col = header.index('student_id'), header.index('grade')
+    width = max(student_col, grade_col) + 1
+
+    for number, row in enumerate(rows, start=2):
+        if not any(cell.strip() for cell in row):
+            continue
+        row = row + [''] * (width - len(row))
+        yield number, row[student_col].strip(), row[grade_col].strip().upper()
+
+
+# ─── Importing ────────────────────────────────────────────────────────────
+
+def import_grades(upload, course, faculty):
+    """
+    Validate and apply every row of `upload` for `course`. Returns
+    {'imported': n, 'rejected': n, 'error_file': storage name or None}.
+    Raises ImportFileError if the file itself can't be read; chunks before an
+    unreadable row further down the file stay applied.
+    """
+    rows = read_sheet(upload)
+    imported = rejected = 0
+    with tempfile.TemporaryFile() as error_bytes:
+        errors = io.TextIOWrapper(error_bytes, encoding='utf-8', newline='')
+        writer = csv.writer(errors)
+        writer.writerow(ERROR_HEADER)
+        while True:
+            chunk = list(itertools.islice(rows, settings.GRADE_IMPORT_CHUNK_SIZE))
+            if not chunk:
+                break
+            with transaction.atomic():
+                applied, failed = _apply_chunk(chunk, course, faculty)
+            imported += applied
+            rejected += len(failed)
+            writer.writerows(failed)
+        error_file = None
+        if rejected:
+            errors.flush()
+            error_bytes.seek(0)
+            error_file = default_storage.save(
+                error_file_name(faculty, f'{uuid.uuid4().hex}.csv'), File(error_bytes),
+            )
+        errors.detach()
+    return {'imported': imported, 'rejected': rejected, 'error_file': error_file}
+
+
+def _apply_chunk(chunk, course, faculty):
+    """Upsert a chunk's valid rows; returns (rows applied, error rows)."""
+    enrolled = dict(
+        Enrollment.objects.filter(
+            course=course, student__student_id__in={student_id for _, student_id, _ in chunk},
+        ).values_list('student__student_id', 'student_id')
+    )
+    grades, failed = {}, []
+    for number, student_id, grade in chunk:
+        if not student_id:
+            failed.append([number, student_id, grade, 'Missing student_id.'])
+        elif grade not in Grade.GPA_MAP:
+            failed.append([number, student_id, grade, f'Invalid grade: {grade or "(blank)"}'])
+        elif student_id not in enrolled:
+            failed.append([number, student_id, grade, f'Student {student_id} is not enrolled in {course.code}.'])
+        else:
+            # A later row for the same student wins, as in a spreadsheet edit.
+            grades[enrolled[student_id]] = grade
+
+    if grades:
+        upsert_grades(course, faculty, grades, 'import')
+    return len(chunk) - len(failed), failed
+
+
+def error_file_name(faculty, name):
+    """Storage name of an error file; the faculty pk in the path scopes downloads."""
+    return f'{ERROR_DIR}/{faculty.pk}/{os.path.basename(name)}'
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from config.schema import build_schema_artifacts, schema_fingerprint, write_schema_artifacts
+
+
+class Command(BaseCommand):
+    help = 'Pre-build the OpenAPI schema (JSON + YAML) served by /api/schema/.'
+
+    def handle(self, *args, **options):
+        fingerprint = schema_fingerprint()
+        artifacts = build_schema_artifacts()
+        write_schema_artifacts(fingerprint, artifacts)
+        for fmt, (content, etag) in artifacts.items():
+            self.stdout.write(f'{fmt}: {len(content)} bytes, ETag {etag}')
+        self.stdout.write(self.style.SUCCESS(f'Schema cache written (fingerprint {fingerprint}).'))
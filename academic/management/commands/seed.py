@@ -0,0 +1,48 @@
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from academic.seeding import UNIT, Seeder
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed the database with the demo accounts plus generated data. '
+        '--scale 1 is about 100 students; --scale 1000 is 100k.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=int, default=1, help=f'multiplier for {UNIT}')
+        parser.add_argument('--seed', type=int, default=0, help='RNG seed (same seed, same data)')
+        parser.add_argument('--students', type=int, help='override the scaled student count')
+        parser.add_argument('--faculty', type=int, help='override the scaled faculty count')
+        parser.add_argument('--courses', type=int, help='override the scaled course count')
+        parser.add_argument('--grades-per-student', type=int, default=4)
+        parser.add_argument('--active-per-student', type=int, default=5)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--no-demo', action='store_true', help='skip the readme demo accounts')
+        parser.add_argument('--flush', action='store_true', help='delete all existing data first')
+
+    def handle(self, *args, **options):
+        if options['flush']:
+            call_command('flush', interactive=False, verbosity=0)
+        elif User.objects.exists():
+            raise CommandError('Database already has users; use --flush to reseed it.')
+
+        counts = {name: options[name] if options[name] is not None else count * options['scale']
+                  for name, count in UNIT.items()}
+        self.stdout.write(f"Seeding {counts} (seed {options['seed']})")
+        Seeder(
+            **counts,
+            grades_per_student=options['grades_per_student'],
+            active_per_student=options['active_per_student'],
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            demo=not options['no_demo'],
+            log=self.stdout.write,
+        ).run()
+        if not options['no_demo']:
+            self.stdout.write(self.style.SUCCESS(
+                'Login: admin@university.edu / admin123, '
+                'rahman@university.edu / faculty123, ayesha@university.edu / student123'
+            ))
@@ -0,0 +1,41 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from config.snapshots import SnapshotError, restore_snapshot, save_snapshot, unapplied_migrations
+
+
+class Command(BaseCommand):
+    help = (
+        'Save the database to a compressed snapshot, or restore one. '
+        'The codec follows the extension: .zst, .gz, or uncompressed.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['save', 'restore'])
+        parser.add_argument('path', help='snapshot file, e.g. fixtures/large.sqlite3.gz')
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args, **options):
+        path, alias = options['path'], options['database']
+        started = time.perf_counter()
+        try:
+            if options['action'] == 'save':
+                size = save_snapshot(path, alias)
+                self.stdout.write(self.style.SUCCESS(
+                    f'Saved {path} ({size / 1e6:.1f} MB) in {time.perf_counter() - started:.1f}s'
+                ))
+                return
+            restore_snapshot(path, alias)
+        except SnapshotError as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Restored {os.path.basename(path)} in {time.perf_counter() - started:.1f}s'
+        ))
+        pending = unapplied_migrations(alias)
+        if pending:
+            self.stdout.write(self.style.WARNING(
+                f"Snapshot predates {len(pending)} migration(s) ({', '.join(pending)}); run migrate."
+            ))
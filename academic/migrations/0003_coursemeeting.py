@@ -0,0 +1,51 @@
+# Generated by Django 6.0.2 on 2026-10-19 05:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+WEEKDAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+
+def backfill_meetings(apps, schema_editor):
+    Course = apps.get_model('academic', 'Course')
+    CourseMeeting = apps.get_model('academic', 'CourseMeeting')
+    meetings = []
+    for course in Course.objects.all():
+        for day in dict.fromkeys(course.days or []):
+            if day in WEEKDAYS:
+                meetings.append(CourseMeeting(
+                    course=course,
+                    weekday=WEEKDAYS.index(day),
+                    start_time=course.start_time,
+                    end_time=course.end_time,
+                    room=course.room,
+                    building=course.building,
+                ))
+    CourseMeeting.objects.bulk_create(meetings, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseMeeting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weekday', models.PositiveSmallIntegerField()),
+                ('start_time', models.TimeField(blank=True, null=True)),
+                ('end_time', models.TimeField(blank=True, null=True)),
+                ('room', models.CharField(blank=True, max_length=50)),
+                ('building', models.CharField(blank=True, max_length=100)),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='meetings', to='academic.course')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['weekday', 'course'], name='academic_co_weekday_e23998_idx')],
+                'unique_together': {('course', 'weekday')},
+            },
+        ),
+        migrations.RunPython(backfill_meetings, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-19 05:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0003_coursemeeting'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='grade',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.2 on 2026-10-19 05:47
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0004_grade_version'),
+        ('users', '0002_passwordresetotp'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GradeAuditLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('old_grade', models.CharField(blank=True, max_length=5)),
+                ('new_grade', models.CharField(max_length=5)),
+                ('source', models.CharField(choices=[('update', 'Single update'), ('bulk', 'Bulk submission'), ('import', 'Sheet import')], max_length=10)),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('changed_by', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='users.faculty')),
+                ('course', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='academic.course')),
+                ('grade', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='audit_log', to='academic.grade')),
+                ('student', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='users.student')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['grade', '-changed_at'], name='gradeaudit_grade_idx'), models.Index(fields=['changed_by', '-changed_at'], name='gradeaudit_faculty_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 6.0.2 on 2026-10-19 06:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_semesters(apps, schema_editor):
+    Course = apps.get_model('academic', 'Course')
+    Semester = apps.get_model('academic', 'Semester')
+    names = Course.objects.exclude(semester='').values_list('semester', flat=True).distinct()
+    Semester.objects.bulk_create([Semester(name=name) for name in names])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0005_gradeauditlog'),
+        ('users', '0003_user_must_change_password'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Semester',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('archived_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedGrade',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('grade', models.CharField(choices=[('A', 'A'), ('A-', 'A-'), ('B+', 'B+'), ('B', 'B'), ('B-', 'B-'), ('C+', 'C+'), ('C', 'C'), ('C-', 'C-'), ('D', 'D'), ('F', 'F')], max_length=5)),
+                ('gpa', models.DecimalField(blank=True, decimal_places=2, max_digits=4, null=True)),
+                ('version', models.PositiveIntegerField(default=1)),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_grades', to='academic.course')),
+                ('graded_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='users.faculty')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_grades', to='users.student')),
+                ('semester', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='archived_grades', to='academic.semester')),
+            ],
+            options={
+                'unique_together': {('student', 'course')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedEnrollment',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('enrolled_at', models.DateTimeField()),
+                ('status', models.CharField(choices=[('Active', 'Active'), ('Enrolled', 'Enrolled'), ('Dropped', 'Dropped'), ('Completed', 'Completed')], max_length=20)),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_enrollments', to='academic.course')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_enrollments', to='users.student')),
+                ('semester', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='archived_enrollments', to='academic.semester')),
+            ],
+            options={
+                'unique_together': {('student', 'course')},
+            },
+        ),
+        migrations.RunPython(backfill_semesters, migrations.RunPython.noop),
+    ]
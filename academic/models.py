@@ -1,7 +1,123 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, Exists, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
 from django.core.validators import MinValueValidator, MaxValueValidator
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
+from django.utils import timezone
+
+from config.cache import bump_version
+from config.counts import invalidate_counts
+from config.deferred import defer_create
+
+
+# ─── QuerySets ────────────────────────────────────────────────────────────
+# Role scoping (visible_to / taught_by) and named prefetch profiles: each
+# for_*() loads exactly the relations its serializer or view reads, so the
+# query count doesn't depend on the number of rows.
+
+def _scope(user):
+    from .scope import access_scope
+    return access_scope(user)
+
+
+def active_students_count():
+    """Active enrollments of the outer course, for annotate()."""
+    return Coalesce(Subquery(
+        Enrollment.objects.filter(course=OuterRef('pk'), status='Active')
+        .order_by().values('course').annotate(n=Count('pk')).values('n')
+    ), 0)
+
+
+def instructor_prefetch():
+    """course.prefetched_assignments: the course's assignments with faculty users, by pk."""
+    return Prefetch(
+        'course__assignments',
+        queryset=FacultyCourseAssignment.objects.select_related('faculty__user').order_by('pk'),
+        to_attr='prefetched_assignments',
+    )
+
+
+class CourseQuerySet(models.QuerySet):
+
+    def taught_by(self, user):
+        """Courses the user is assigned to teach (none for non-faculty)."""
+        return _scope(user).taught(self)
+
+    def for_listing(self):
+        """CourseSerializer: own columns + students_count."""
+        return self.annotate(students_count=active_students_count()).order_by('code')
+
+
+class AssignmentQuerySet(models.QuerySet):
+
+    def for_listing(self):
+        """FacultyCourseAssignmentSerializer: faculty name and course."""
+        return self.select_related('faculty__user', 'course')
+
+
+class EnrollmentQuerySet(models.QuerySet):
+
+    def visible_to(self, user):
+        """Students see only their own enrollments; staff see all of them."""
+        student = _scope(user).student
+        if user.role == 'student':
+            return self.filter(student=student) if student is not None else self.none()
+        return self
+
+    def taught_by(self, user):
+        """Enrollments in the courses the user teaches (none for non-faculty)."""
+        return _scope(user).taught(self, 'course_id')
+
+    def for_listing(self):
+        """EnrollmentSerializer: student name/id, course and its first instructor."""
+        return self.select_related('student__user', 'course').prefetch_related(instructor_prefetch())
+
+    def transition(self, status):
+        """
+        Set every matched enrollment not already in `status` to it with one
+        UPDATE, then do the post_save receivers' work once for all of them:
+        the students' schedule and access-scope caches and the enrollment
+        counts. Returns the number of rows changed.
+        """
+        changing = self.exclude(status=status)
+        with transaction.atomic():
+            student_ids = set(changing.values_list('student_id', flat=True))
+            updated = changing.update(status=status)
+        if updated:
+            bump_version(*(f'{prefix}:student:{pk}' for pk in student_ids for prefix in ('schedule', 'scope')))
+            invalidate_counts(Enrollment)
+        return updated
+
+
+class GradeQuerySet(models.QuerySet):
+
+    def visible_to(self, user):
+        """Students see their own grades, faculty the grades they gave, admins all."""
+        scope = _scope(user)
+        if user.role == 'student':
+            return self.filter(student=scope.student) if scope.student is not None else self.none()
+        if user.role == 'faculty':
+            return self.filter(graded_by=scope.faculty) if scope.faculty is not None else self.none()
+        return self
+
+    def for_listing(self):
+        """GradeSerializer: student name/id and course."""
+        return self.select_related('student__user', 'course')
+
+    def for_transcript(self):
+        """History and transcript rows: the grade and its course, by semester."""
+        return self.select_related('course').order_by('course__semester')
+
+    def superseded_excluded(self):
+        """
+        ArchivedGrade rows the student has no current Grade for. A student
+        regraded in an archived semester's course has both until the
+        semester is archived again; the current Grade is the one that counts.
+        """
+        return self.exclude(Exists(
+            Grade.objects.filter(student_id=OuterRef('student_id'), course_id=OuterRef('course_id'))
+        ))
 
 
 class Course(models.Model):
@@ -24,15 +140,58 @@ class Course(models.Model):
     room = models.CharField(max_length=50, blank=True)
     building = models.CharField(max_length=100, blank=True)
 
+    objects = CourseQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.code} - {self.name}"
 
 
+class CourseMeeting(models.Model):
+    """
+    One weekly meeting of a course, derived from Course.days/start_time/...
+    Kept in sync by sync_course_meetings(); never edit directly.
+    Lets schedule queries filter by weekday with an index instead of
+    scanning every course's days list in Python.
+    """
+    WEEKDAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='meetings')
+    weekday = models.PositiveSmallIntegerField()  # 0 = Mon ... 6 = Sun
+    start_time = models.TimeField(null=True, blank=True)
+    end_time = models.TimeField(null=True, blank=True)
+    room = models.CharField(max_length=50, blank=True)
+    building = models.CharField(max_length=100, blank=True)
+
+    class Meta:
+        unique_together = ('course', 'weekday')
+        indexes = [models.Index(fields=['weekday', 'course'])]
+
+    def __str__(self):
+        return f"{self.course.code} {self.WEEKDAYS[self.weekday]}"
+
+    @classmethod
+    def from_course(cls, course):
+        return [
+            cls(
+                course=course,
+                weekday=cls.WEEKDAYS.index(day),
+                start_time=course.start_time,
+                end_time=course.end_time,
+                room=course.room,
+                building=course.building,
+            )
+            for day in dict.fromkeys(course.days or [])
+            if day in cls.WEEKDAYS
+        ]
+
+
 class FacultyCourseAssignment(models.Model):
     """Links a faculty member to a course they teach."""
     faculty = models.ForeignKey('users.Faculty', on_delete=models.CASCADE, related_name='assignments')
     course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='assignments')
 
+    objects = AssignmentQuerySet.as_manager()
+
     class Meta:
         unique_together = ('faculty', 'course')
 
@@ -54,6 +213,8 @@ class Enrollment(models.Model):
     # Enrollment er status (Active, Dropped, Completed) manage kora hocche.
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='Active')
 
+    objects = EnrollmentQuerySet.as_manager()
+
     class Meta:
         unique_together = ('student', 'course')
 
@@ -80,6 +241,10 @@ class Grade(models.Model):
     grade = models.CharField(max_length=5, choices=GRADE_CHOICES)
     gpa = models.DecimalField(max_digits=4, decimal_places=2, null=True, blank=True)
     graded_by = models.ForeignKey('users.Faculty', on_delete=models.SET_NULL, null=True, related_name='graded')
+    # Bumped on every change; clients send it back in If-Match (GradeUpdateView).
+    version = models.PositiveIntegerField(default=1)
+
+    objects = GradeQuerySet.as_manager()
 
     class Meta:
         unique_together = ('student', 'course')
@@ -87,30 +252,250 @@ class Grade(models.Model):
     def save(self, *args, **kwargs):
         # Grade save korar somoy GPA automatically calculate kora hocche.
         self.gpa = self.GPA_MAP.get(self.grade, 0.0)
+        if not self._state.adding:
+            self.version += 1
         super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.student} - {self.course} - {self.grade}"
 
 
+class GradeAuditLog(models.Model):
+    """
+    Append-only history of grade changes, written behind the request by
+    config.deferred (see record_grade_changes). References have no DB
+    constraints so the history outlives deleted grades, students and staff.
+    """
+    SOURCES = (('update', 'Single update'), ('bulk', 'Bulk submission'), ('import', 'Sheet import'))
+
+    grade = models.ForeignKey(Grade, on_delete=models.DO_NOTHING, db_constraint=False,
+                              related_name='audit_log')
+    student = models.ForeignKey('users.Student', on_delete=models.DO_NOTHING, db_constraint=False,
+                                null=True, related_name='+')
+    course = models.ForeignKey(Course, on_delete=models.DO_NOTHING, db_constraint=False,
+                               null=True, related_name='+')
+    old_grade = models.CharField(max_length=5, blank=True)  # blank: the grade was created
+    new_grade = models.CharField(max_length=5)
+    changed_by = models.ForeignKey('users.Faculty', on_delete=models.DO_NOTHING, db_constraint=False,
+                                   null=True, related_name='+')
+    source = models.CharField(max_length=10, choices=SOURCES)
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            # "History of this grade" and "all changes by faculty X", newest first.
+            models.Index(fields=['grade', '-changed_at'], name='gradeaudit_grade_idx'),
+            models.Index(fields=['changed_by', '-changed_at'], name='gradeaudit_faculty_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError('Grade audit rows are append-only.')
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValueError('Grade audit rows are append-only.')
+
+    def __str__(self):
+        return f"{self.grade_id}: {self.old_grade or '-'} -> {self.new_grade}"
+
+
+# ─── Semesters and the archive ────────────────────────────────────────────
+# Closed semesters' enrollments and grades move out of the hot Enrollment /
+# Grade tables into ArchivedEnrollment / ArchivedGrade (academic.archive),
+# keeping their ids, so current-term queries only scan the current terms.
+
+class Semester(models.Model):
+    """A term, named as in Course.semester ("Fall 2025")."""
+    name = models.CharField(max_length=50, unique=True)
+    # Set once archive_semester() has moved the term's rows to the archive tables.
+    archived_at = models.DateTimeField(null=True, blank=True)
+
+    @property
+    def is_archived(self):
+        return self.archived_at is not None
+
+    def __str__(self):
+        return self.name
+
+
+class ArchivedEnrollment(models.Model):
+    """An Enrollment of an archived semester, same id and columns."""
+    id = models.BigIntegerField(primary_key=True)
+    semester = models.ForeignKey(Semester, on_delete=models.PROTECT, related_name='archived_enrollments')
+    student = models.ForeignKey('users.Student', on_delete=models.CASCADE, related_name='archived_enrollments')
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='archived_enrollments')
+    enrolled_at = models.DateTimeField()
+    status = models.CharField(max_length=20, choices=Enrollment.STATUS_CHOICES)
+
+    class Meta:
+        unique_together = ('student', 'course')
+
+    def __str__(self):
+        return f"{self.student} - {self.course} ({self.semester})"
+
+
+class ArchivedGrade(models.Model):
+    """A Grade of an archived semester, same id and columns; GradeAuditLog rows still point at it."""
+    id = models.BigIntegerField(primary_key=True)
+    semester = models.ForeignKey(Semester, on_delete=models.PROTECT, related_name='archived_grades')
+    student = models.ForeignKey('users.Student', on_delete=models.CASCADE, related_name='archived_grades')
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='archived_grades')
+    grade = models.CharField(max_length=5, choices=Grade.GRADE_CHOICES)
+    gpa = models.DecimalField(max_digits=4, decimal_places=2, null=True, blank=True)
+    graded_by = models.ForeignKey('users.Faculty', on_delete=models.SET_NULL, null=True, related_name='+')
+    version = models.PositiveIntegerField(default=1)
+
+    objects = GradeQuerySet.as_manager()
+
+    class Meta:
+        unique_together = ('student', 'course')
+
+    def __str__(self):
+        return f"{self.student} - {self.course} - {self.grade} ({self.semester})"
+
+
+def record_grade_changes(changes, faculty, source):
+    """Queue audit rows for [(grade, old letter)]; unchanged grades are skipped."""
+    now = timezone.now()
+    defer_create(
+        GradeAuditLog(grade_id=grade.pk, student_id=grade.student_id, course_id=grade.course_id,
+                      old_grade=old or '', new_grade=grade.grade, changed_by=faculty,
+                      source=source, changed_at=now)
+        for grade, old in changes
+        if old != grade.grade
+    )
+
+
+def recalculate_gpas(student_ids):
+    """
+    Recompute current_gpa for these students: one SELECT + one bulk UPDATE.
+    bulk_update sends no post_save, so caches over grades and students
+    (e.g. the dashboard bootstrap) are invalidated here.
+    """
+    from users.models import Student
+
+    totals = {pk: [0, 0] for pk in student_ids}
+    # Archived semesters count towards the GPA too (one UNION ALL query).
+    rows = Grade.objects.filter(
+        student_id__in=totals, gpa__isnull=False
+    ).values_list('student_id', 'gpa', 'course__credits').union(
+        ArchivedGrade.objects.filter(student_id__in=totals, gpa__isnull=False).superseded_excluded()
+        .values_list('student_id', 'gpa', 'course__credits'),
+        all=True,
+    )
+    for student_id, gpa, credits in rows:
+        totals[student_id][0] += float(gpa) * credits
+        totals[student_id][1] += credits
+
+    students = [
+        Student(pk=pk, current_gpa=round(points / credits, 2) if credits > 0 else 0.0)
+        for pk, (points, credits) in totals.items()
+    ]
+    Student.objects.bulk_update(students, ['current_gpa'])
+    invalidate_counts(Grade, Student)
+
+
+def upsert_grades(course, faculty, grades, source):
+    """
+    Write {student pk: letter grade} for one course as a single upsert, bump
+    the version of every grade it changed or created, recalculate those
+    students' GPAs and queue the audit rows. Resubmitting a grade unchanged
+    leaves its version alone, so clients' If-Match tags stay valid.
+    bulk_create sends no post_save, so this does the signal's work.
+    """
+    old = dict(
+        Grade.objects.filter(course=course, student_id__in=list(grades)).values_list('student_id', 'grade')
+    )
+    # New rows start at 0 so the shared bump below leaves them at 1.
+    written = Grade.objects.bulk_create(
+        [
+            Grade(student_id=student_pk, course=course, grade=grade,
+                  gpa=Grade.GPA_MAP.get(grade, 0.0), graded_by=faculty, version=0)
+            for student_pk, grade in grades.items()
+        ],
+        update_conflicts=True,
+        unique_fields=['student', 'course'],
+        update_fields=['grade', 'gpa', 'graded_by'],
+    )
+    changed = [student_pk for student_pk, grade in grades.items() if old.get(student_pk) != grade]
+    if changed:
+        Grade.objects.filter(course=course, student_id__in=changed).update(version=models.F('version') + 1)
+        recalculate_gpas(changed)
+    record_grade_changes([(grade, old.get(grade.student_id)) for grade in written], faculty, source)
+
+
 @receiver(post_save, sender=Grade)
 def update_student_gpa(sender, instance, **kwargs):
     """Recalculate student's cumulative GPA whenever a grade is saved."""
     # Jokhon e kono notun grade add hobe, student er total GPA update hobe.
-    student = instance.student
-    grades = Grade.objects.filter(student=student).select_related('course')
-
-    total_points = 0
-    total_credits = 0
-
-    for g in grades:
-        if g.gpa is not None:
-            credits = g.course.credits
-            total_points += float(g.gpa) * credits
-            total_credits += credits
-
-    if total_credits > 0:
-        student.current_gpa = round(total_points / total_credits, 2)
-    else:
-        student.current_gpa = 0.0
-    student.save(update_fields=['current_gpa'])
+    recalculate_gpas([instance.student_id])
+
+
+# ─── Schedule sync + cache invalidation ───────────────────────────────────
+# Schedule caches are keyed on the 'schedule' namespace (anything that changes
+# what a course looks like) and 'schedule:student:<id>' (one student's
+# enrollments); see academic.schedule.
+
+SCHEDULE_FIELDS = {'days', 'start_time', 'end_time', 'room', 'building'}
+
+
+@receiver(post_save, sender=Course)
+def sync_course_meetings(sender, instance, update_fields=None, **kwargs):
+    """Rebuild the CourseMeeting rows whenever a course's schedule may have changed."""
+    # Course er schedule change hole meeting table abar banano hocche.
+    if update_fields is None or SCHEDULE_FIELDS & set(update_fields):
+        CourseMeeting.objects.filter(course=instance).delete()
+        CourseMeeting.objects.bulk_create(CourseMeeting.from_course(instance))
+    bump_version('schedule')
+
+
+@receiver(post_delete, sender=Course)
+@receiver(post_save, sender=FacultyCourseAssignment)
+@receiver(post_delete, sender=FacultyCourseAssignment)
+def invalidate_schedules(sender, **kwargs):
+    bump_version('schedule')
+
+
+@receiver(post_save, sender=Enrollment)
+@receiver(post_delete, sender=Enrollment)
+def invalidate_student_schedule(sender, instance, **kwargs):
+    bump_version(f'schedule:student:{instance.student_id}')
+
+
+# ─── Semesters ────────────────────────────────────────────────────────────
+
+@receiver(post_save, sender=Course)
+def ensure_semester(sender, instance, **kwargs):
+    """Every semester name a course uses has its Semester row."""
+    if instance.semester:
+        Semester.objects.get_or_create(name=instance.semester)
+
+
+# ─── Access scope invalidation (see academic.scope) ───────────────────────
+
+@receiver(post_save, sender=FacultyCourseAssignment)
+@receiver(post_delete, sender=FacultyCourseAssignment)
+def invalidate_faculty_scope(sender, instance, **kwargs):
+    bump_version(f'scope:faculty:{instance.faculty_id}')
+
+
+@receiver(post_save, sender=Enrollment)
+@receiver(post_delete, sender=Enrollment)
+def invalidate_student_scope(sender, instance, **kwargs):
+    # Status change o ekhane ashe; shudhu Active enrollment scope e thake.
+    bump_version(f'scope:student:{instance.student_id}')
+
+
+# ─── Paginated count invalidation (see config.counts) ─────────────────────
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+@receiver(post_save, sender=FacultyCourseAssignment)
+@receiver(post_delete, sender=FacultyCourseAssignment)
+@receiver(post_save, sender=Enrollment)
+@receiver(post_delete, sender=Enrollment)
+@receiver(post_save, sender=Grade)
+@receiver(post_delete, sender=Grade)
+def invalidate_academic_counts(sender, **kwargs):
+    invalidate_counts(sender)
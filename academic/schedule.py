@@ -0,0 +1,268 @@
+"""
+Class schedule lookups backed by the CourseMeeting table.
+
+A user's meetings for any set of weekdays come from one indexed query
+(weekday plus an IN list of the course ids in the user's access scope, see
+academic.scope), and per-user results are cached under versioned keys that
+Course / Assignment / Enrollment signals invalidate (see academic.models).
+The same data feeds the weekly timetable and the per-user iCalendar feed.
+"""
+import datetime
+import hashlib
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.db.models import OuterRef, Subquery
+
+from config.cache import versioned_key
+from .models import CourseMeeting, FacultyCourseAssignment
+from .scope import access_scope
+
+DAY_NAMES = CourseMeeting.WEEKDAYS
+
+
+def schedule_course_ids(user):
+    """
+    Course ids whose meetings belong on this user's schedule (see
+    academic.scope): assigned courses for faculty, Active enrollments for
+    students. Returns None for users with no schedule (admins, missing profiles).
+    """
+    return access_scope(user).course_ids
+
+
+def schedule_namespaces(user):
+    """Cache namespaces a user's schedule depends on."""
+    namespaces = ['schedule']
+    if user.role == 'student' and hasattr(user, 'student_profile'):
+        namespaces.append(f'schedule:student:{user.student_profile.pk}')
+    return namespaces
+
+
+def _instructor(field):
+    # First assigned faculty (by pk), same as FacultyCourseAssignment...first().
+    return Subquery(
+        FacultyCourseAssignment.objects.filter(course=OuterRef('course_id'))
+        .order_by('pk').values(f'faculty__user__{field}')[:1]
+    )
+
+
+def meetings_for(course_ids, weekdays):
+    """CourseMeeting rows (with course + instructor name) for the given weekdays."""
+    return (
+        CourseMeeting.objects
+        .filter(weekday__in=weekdays, course_id__in=course_ids)
+        .select_related('course')
+        .only('weekday', 'start_time', 'end_time', 'room', 'building',
+              'course__code', 'course__name', 'course__days', 'course__semester')
+        .annotate(
+            instructor_first_name=_instructor('first_name'),
+            instructor_last_name=_instructor('last_name'),
+        )
+        .order_by('course_id')
+    )
+
+
+def serialize_meeting(meeting):
+    instructor = ''
+    if meeting.instructor_first_name is not None:
+        instructor = f"{meeting.instructor_first_name} {meeting.instructor_last_name}".strip()
+    return {
+        'courseCode': meeting.course.code,
+        'courseName': meeting.course.name,
+        'startTime': meeting.start_time.strftime('%H:%M') if meeting.start_time else '',
+        'endTime': meeting.end_time.strftime('%H:%M') if meeting.end_time else '',
+        'days': meeting.course.days,
+        'room': meeting.room,
+        'building': meeting.building,
+        'type': 'Lecture',
+        'status': 'Scheduled',
+        'instructor': instructor,
+    }
+
+
+def _group_by_day(meetings, weekdays):
+    schedules = {weekday: [] for weekday in weekdays}
+    for meeting in meetings:
+        schedules[meeting.weekday].append(serialize_meeting(meeting))
+    for items in schedules.values():
+        items.sort(key=lambda x: x['startTime'])
+    return schedules
+
+
+def build_day_schedules(user, weekdays):
+    """{weekday: [meeting dicts sorted by start time]} from a single query."""
+    course_ids = schedule_course_ids(user)
+    meetings = meetings_for(course_ids, weekdays) if course_ids is not None else []
+    return _group_by_day(meetings, weekdays)
+
+
+async def abuild_day_schedules(user, weekdays):
+    """build_day_schedules() for async views; `user` must have its profiles loaded."""
+    course_ids = await access_scope(user).aget('course_ids')
+    meetings = []
+    if course_ids is not None:
+        meetings = [meeting async for meeting in meetings_for(course_ids, weekdays)]
+    return _group_by_day(meetings, weekdays)
+
+
+def _today_key(user, today):
+    return versioned_key('schedule:today', schedule_namespaces(user), user.pk, today.isoformat())
+
+
+def _today_payload(schedules, today_idx, tomorrow_idx):
+    return {
+        'today': schedules[today_idx],
+        'tomorrow': schedules[tomorrow_idx],
+        'today_day': DAY_NAMES[today_idx],
+        'tomorrow_day': DAY_NAMES[tomorrow_idx],
+    }
+
+
+def get_today_schedule(user, today):
+    """Today's and tomorrow's classes for the widget, cached per user per day."""
+    key = _today_key(user, today)
+    payload = cache.get(key)
+    if payload is None:
+        today_idx = today.weekday()
+        tomorrow_idx = (today_idx + 1) % 7
+        schedules = build_day_schedules(user, [today_idx, tomorrow_idx])
+        payload = _today_payload(schedules, today_idx, tomorrow_idx)
+        cache.set(key, payload, settings.SCHEDULE_CACHE_TIMEOUT)
+    return payload
+
+
+async def aget_today_schedule(user, today):
+    """get_today_schedule() for async views; shares its cache entries."""
+    key = _today_key(user, today)
+    payload = await cache.aget(key)
+    if payload is None:
+        today_idx = today.weekday()
+        tomorrow_idx = (today_idx + 1) % 7
+        schedules = await abuild_day_schedules(user, [today_idx, tomorrow_idx])
+        payload = _today_payload(schedules, today_idx, tomorrow_idx)
+        await cache.aset(key, payload, settings.SCHEDULE_CACHE_TIMEOUT)
+    return payload
+
+
+def get_week_schedule(user):
+    """{'Mon': [...], ..., 'Sun': [...]} for the weekly timetable, cached per user."""
+    key = versioned_key('schedule:week', schedule_namespaces(user), user.pk)
+    payload = cache.get(key)
+    if payload is None:
+        schedules = build_day_schedules(user, list(range(7)))
+        payload = {DAY_NAMES[weekday]: items for weekday, items in schedules.items()}
+        cache.set(key, payload, settings.SCHEDULE_CACHE_TIMEOUT)
+    return payload
+
+
+# ─── iCalendar feed ────────────────────────────────────────────────────────
+
+FEED_TOKEN_SALT = 'academic.schedule.feed'
+ICAL_DAYS = ['MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU']
+
+
+def _password_fingerprint(user):
+    # Changing the password revokes previously issued feed URLs.
+    return hashlib.sha256(user.password.encode()).hexdigest()[:8]
+
+
+def feed_token(user):
+    return signing.dumps([user.pk, _password_fingerprint(user)], salt=FEED_TOKEN_SALT)
+
+
+def user_from_feed_token(token):
+    """The feed owner, or None for a bad, tampered or revoked token."""
+    from users.models import User
+
+    try:
+        user_pk, fingerprint = signing.loads(token, salt=FEED_TOKEN_SALT)
+        user = User.objects.select_related('student_profile', 'faculty_profile').get(pk=user_pk)
+    except (signing.BadSignature, ValueError, TypeError, User.DoesNotExist):
+        return None
+    if not user.is_active or fingerprint != _password_fingerprint(user):
+        return None
+    return user
+
+
+def _ical_escape(text):
+    return (
+        str(text).replace('\\', '\\\\').replace(';', '\\;')
+        .replace(',', '\\,').replace('\n', '\\n')
+    )
+
+
+def _ical_fold(line):
+    # RFC 5545 3.1: lines longer than 75 octets continue on a line starting with a space.
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    while encoded:
+        cut = 75 if not parts else 74
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1  # don't split a multi-byte character
+        parts.append(encoded[:cut].decode('utf-8'))
+        encoded = encoded[cut:]
+    return '\r\n '.join(parts)
+
+
+def render_ical(user, meetings, today):
+    """
+    VCALENDAR with one weekly-recurring VEVENT per course meeting. Times are
+    floating (no TZID or X-WR-TIMEZONE) so calendar apps show them as the
+    campus's wall-clock time; settings.TIME_ZONE is the server's, not the campus's.
+    """
+    week_start = today - datetime.timedelta(days=today.weekday())
+    stamp = datetime.datetime.combine(today, datetime.time()).strftime('%Y%m%dT%H%M%SZ')
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        'PRODID:-//University Management System//Class Schedule//EN',
+        'CALSCALE:GREGORIAN',
+        f'X-WR-CALNAME:{_ical_escape(f"Class Schedule - {user.get_full_name() or user.email}")}',
+    ]
+    for meeting in meetings:
+        if not (meeting.start_time and meeting.end_time):
+            continue
+        day = week_start + datetime.timedelta(days=meeting.weekday)
+        start = datetime.datetime.combine(day, meeting.start_time)
+        end = datetime.datetime.combine(day, meeting.end_time)
+        item = serialize_meeting(meeting)
+        location = ', '.join(part for part in (item['room'], item['building']) if part)
+        lines += [
+            'BEGIN:VEVENT',
+            f'UID:course-{meeting.course_id}-{ICAL_DAYS[meeting.weekday]}@ums',
+            f'DTSTAMP:{stamp}',
+            f'DTSTART:{start.strftime("%Y%m%dT%H%M%S")}',
+            f'DTEND:{end.strftime("%Y%m%dT%H%M%S")}',
+            f'RRULE:FREQ=WEEKLY;BYDAY={ICAL_DAYS[meeting.weekday]}',
+            f"SUMMARY:{_ical_escape(item['courseCode'] + ' - ' + item['courseName'])}",
+        ]
+        if location:
+            lines.append(f'LOCATION:{_ical_escape(location)}')
+        description = [meeting.course.semester]
+        if item['instructor']:
+            description.append(f"Instructor: {item['instructor']}")
+        description = '\n'.join(part for part in description if part)
+        lines += [
+            f'DESCRIPTION:{_ical_escape(description)}',
+            'END:VEVENT',
+        ]
+    lines.append('END:VCALENDAR')
+    return ('\r\n'.join(_ical_fold(line) for line in lines) + '\r\n').encode('utf-8')
+
+
+def get_ical_feed(user):
+    """(ics bytes, strong ETag), rendered once per user until a schedule change."""
+    key = versioned_key('schedule:ics', schedule_namespaces(user), user.pk)
+    feed = cache.get(key)
+    if feed is None:
+        course_ids = schedule_course_ids(user)
+        meetings = []
+        if course_ids is not None:
+            meetings = meetings_for(course_ids, range(7)).order_by('weekday', 'start_time', 'course_id')
+        content = render_ical(user, meetings, datetime.date.today())
+        feed = (content, f'"{hashlib.sha256(content).hexdigest()[:32]}"')
+        cache.set(key, feed, settings.SCHEDULE_CACHE_TIMEOUT)
+    return feed
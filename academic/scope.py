@@ -0,0 +1,111 @@
+"""
+Per-user access scope: the courses a faculty member teaches and the courses
+a student is actively enrolled in.
+
+Views, the schedule and the dashboard all restrict their querysets to these
+course ids. access_scope(user) computes each set at most once per request
+(the scope is memoized on the request's user object) and keeps it in the
+cache under a versioned key, so later requests usually need no query at
+all. FacultyCourseAssignment / Enrollment signals bump the owner's
+namespace (see academic.models):
+    scope:faculty:<faculty pk>   assigned course ids
+    scope:student:<student pk>   Active enrollment course ids
+
+The cached sets only narrow what a user reads. Authorization for writes
+(teaches()) reads the database once per request instead: a bump_version()
+on one worker's local cache doesn't reach the others, and a stale set
+there would keep letting a removed instructor submit grades.
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.functional import cached_property
+
+from config.cache import versioned_key
+from .models import Enrollment, FacultyCourseAssignment
+
+
+def access_scope(user):
+    """The AccessScope for `user`, built once per user object (i.e. per request)."""
+    scope = user.__dict__.get('_access_scope')
+    if scope is None:
+        scope = user.__dict__['_access_scope'] = AccessScope(user)
+    return scope
+
+
+def _cached_ids(namespace, load):
+    key = versioned_key('scope', [namespace], namespace)
+    ids = cache.get(key)
+    if ids is None:
+        ids = frozenset(load())
+        cache.set(key, ids, settings.ACCESS_SCOPE_CACHE_TIMEOUT)
+    return ids
+
+
+class AccessScope:
+
+    def __init__(self, user):
+        self.user = user
+
+    @cached_property
+    def faculty(self):
+        """The user's Faculty profile, or None."""
+        if self.user.role == 'faculty' and hasattr(self.user, 'faculty_profile'):
+            return self.user.faculty_profile
+        return None
+
+    @cached_property
+    def student(self):
+        """The user's Student profile, or None."""
+        if self.user.role == 'student' and hasattr(self.user, 'student_profile'):
+            return self.user.student_profile
+        return None
+
+    @cached_property
+    def assigned_course_ids(self):
+        """Ids of the courses this faculty member is assigned to (empty for everyone else)."""
+        if self.faculty is None:
+            return frozenset()
+        return _cached_ids(
+            f'scope:faculty:{self.faculty.pk}',
+            lambda: FacultyCourseAssignment.objects.filter(faculty=self.faculty).values_list('course_id', flat=True),
+        )
+
+    @cached_property
+    def enrolled_course_ids(self):
+        """Ids of the courses this student is actively enrolled in (empty for everyone else)."""
+        if self.student is None:
+            return frozenset()
+        return _cached_ids(
+            f'scope:student:{self.student.pk}',
+            lambda: Enrollment.objects.filter(student=self.student, status='Active').values_list('course_id', flat=True),
+        )
+
+    @property
+    def course_ids(self):
+        """Assigned ids for faculty, enrolled ids for students, None for anyone else."""
+        if self.faculty is not None:
+            return self.assigned_course_ids
+        if self.student is not None:
+            return self.enrolled_course_ids
+        return None
+
+    async def aget(self, name):
+        """`await scope.aget('assigned_course_ids')` from async code, where the lookup may query."""
+        return await sync_to_async(getattr)(self, name)
+
+    @cached_property
+    def authorized_course_ids(self):
+        """assigned_course_ids read from the database, never the cache; for write checks."""
+        if self.faculty is None:
+            return frozenset()
+        return frozenset(
+            FacultyCourseAssignment.objects.filter(faculty=self.faculty).values_list('course_id', flat=True)
+        )
+
+    def teaches(self, course):
+        return course.pk in self.authorized_course_ids
+
+    def taught(self, queryset, field='pk'):
+        """`queryset` restricted to rows whose `field` is one of the assigned course ids."""
+        return queryset.filter(**{f'{field}__in': self.assigned_course_ids})
@@ -0,0 +1,314 @@
+"""
+Bulk seeding engine.
+
+Builds the demo university (the accounts listed in readme.md) plus any number
+of generated faculty, students, courses, assignments, enrollments and grades
+entirely in memory from a seeded RNG, then writes each table with batched
+bulk_create inside one transaction. Used by `manage.py seed`, seed_data.py
+and benchmarks.dataset.
+"""
+import datetime
+import random
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from users.models import Faculty, Student, User
+from .models import Course, CourseMeeting, Enrollment, FacultyCourseAssignment, Grade
+
+CURRENT_SEMESTER = 'Fall 2025'
+PAST_SEMESTERS = ['Spring 2023', 'Fall 2023', 'Spring 2024', 'Fall 2024', 'Spring 2025']
+
+# Rows per generated unit for Seeder.for_scale(): scale=1 is roughly the
+# old seed_data.py, scale=1000 is 100k students.
+UNIT = {'students': 100, 'faculty': 10, 'courses': 20}
+
+PASSWORDS = {'admin': 'admin123', 'faculty': 'faculty123', 'student': 'student123'}
+
+DEPARTMENTS = [('CSE', 'Computer Science'), ('BBA', 'BBA'), ('EEE', 'EEE')]
+COURSE_TITLES = {
+    'Computer Science': ['Intro to CS', 'Programming Fundamentals', 'OOP', 'Operating Systems',
+                         'Networking', 'Artificial Intelligence', 'Machine Learning', 'Web Development'],
+    'BBA': ['Intro to Business', 'Accounting', 'Marketing', 'Finance', 'HRM', 'Business Law', 'Strategy'],
+    'EEE': ['Circuit Theory', 'Electronics I', 'Signals', 'Electromagnetics', 'Microprocessors',
+            'Power Systems', 'Control Systems'],
+}
+FIRST_NAMES = ['Ali', 'Tahmid', 'Sadia', 'Nusrat', 'Farhan', 'Mahmud', 'Rubel', 'Sakib', 'Tamim',
+               'Mehedi', 'Taskin', 'Zakir', 'Ebadot', 'Suma', 'Tariq', 'Hasan', 'Rina', 'Mina',
+               'Tina', 'Bina', 'Joti', 'Rumi', 'Sumi', 'Lima']
+LAST_NAMES = ['Rahman', 'Hossain', 'Islam', 'Uddin', 'Ahmed', 'Khan', 'Chowdhury', 'Ali', 'Hasan',
+              'Mahmud', 'Sikder', 'Mirza', 'Sheikh', 'Talukder', 'Molla']
+TIMESLOTS = [('08:00', '09:30'), ('10:00', '11:30'), ('12:00', '13:30'), ('14:00', '15:30'), ('16:00', '17:30')]
+DAYS_OPTIONS = [['Mon', 'Wed'], ['Tue', 'Thu']]
+ROOMS = ['101', '102', '103', '201', '202', '301', '302']
+BUILDINGS = ['Academic Block A', 'Arts Block C', 'Science Block B']
+GRADE_CHOICES = ['A', 'A-', 'B+', 'B', 'B-', 'C+', 'C', 'D', 'F']
+
+# ─── Demo data (the accounts in readme.md) ─────────────────────────────────
+
+DEMO_ADMIN = {'email': 'admin@university.edu', 'first_name': 'Dr. Harun Ur', 'last_name': 'Rashid'}
+DEMO_FACULTY = [
+    ('rahman@university.edu', 'Prof.', 'Rahman', 'FAC001', 'Computer Science', 'Database Systems', '2020-01-15'),
+    ('karim@university.edu', 'Dr.', 'Karim', 'FAC002', 'Mathematics', 'Linear Algebra', '2019-06-01'),
+    ('ahmed@university.edu', 'Prof.', 'Ahmed', 'FAC003', 'Physics', 'Quantum Mechanics', '2021-09-01'),
+]
+DEMO_STUDENTS = [
+    ('ayesha@university.edu', 'Ayesha', 'Siddiqua', 'STU001', 'Computer Science', '3rd', '3.75'),
+    ('rahim@university.edu', 'Rahim', 'Uddin', 'STU002', 'Computer Science', '2nd', '3.50'),
+    ('fatima@university.edu', 'Fatima', 'Begum', 'STU003', 'Mathematics', '4th', '3.80'),
+    ('kamal@university.edu', 'Kamal', 'Hasan', 'STU004', 'Physics', '1st', '3.20'),
+    ('nadia@university.edu', 'Nadia', 'Islam', 'STU005', 'Computer Science', '3rd', '3.60'),
+]
+DEMO_COURSES = [
+    ('CS301', 'Database Systems', 'Computer Science', 3, 'Fall 2025', ['Mon', 'Wed'], '10:00', '11:30', '301', 'Academic Block A'),
+    ('CS302', 'Algorithms', 'Computer Science', 3, 'Fall 2025', ['Tue', 'Thu'], '14:00', '15:30', '302', 'Academic Block A'),
+    ('MATH201', 'Linear Algebra', 'Mathematics', 4, 'Fall 2025', ['Mon', 'Wed', 'Fri'], '09:00', '10:00', '201', 'Science Block B'),
+    ('PHY101', 'Physics I', 'Physics', 4, 'Fall 2025', ['Tue', 'Thu'], '11:00', '12:30', '101', 'Science Block B'),
+    ('ENG202', 'Technical Writing', 'English', 3, 'Fall 2025', ['Wed', 'Fri'], '13:00', '14:30', '205', 'Arts Block C'),
+    ('CS201', 'Data Structures', 'Computer Science', 3, 'Spring 2025', ['Mon', 'Wed'], '10:00', '11:30', '301', 'Academic Block A'),
+    ('MATH101', 'Calculus I', 'Mathematics', 4, 'Spring 2025', ['Tue', 'Thu'], '09:00', '10:30', '201', 'Science Block B'),
+]
+DEMO_ASSIGNMENTS = [
+    ('FAC001', 'CS301'), ('FAC001', 'CS302'), ('FAC001', 'CS201'),
+    ('FAC002', 'MATH201'), ('FAC002', 'MATH101'), ('FAC003', 'PHY101'),
+]
+DEMO_ENROLLMENTS = [
+    ('STU001', 'CS301'), ('STU001', 'MATH201'), ('STU001', 'CS302'), ('STU001', 'PHY101'),
+    ('STU001', 'ENG202'), ('STU002', 'CS301'), ('STU002', 'CS302'), ('STU002', 'MATH201'),
+    ('STU003', 'MATH201'), ('STU003', 'PHY101'), ('STU004', 'PHY101'), ('STU004', 'ENG202'),
+    ('STU005', 'CS301'), ('STU005', 'CS302'),
+    # Past semester (for history)
+    ('STU001', 'CS201'), ('STU001', 'MATH101'), ('STU002', 'CS201'), ('STU003', 'MATH101'),
+]
+DEMO_GRADES = [
+    ('STU001', 'CS201', 'A', 'FAC001'), ('STU001', 'MATH101', 'A-', 'FAC002'),
+    ('STU002', 'CS201', 'B+', 'FAC001'), ('STU003', 'MATH101', 'A', 'FAC002'),
+]
+
+
+def _time(value):
+    return datetime.time.fromisoformat(value)
+
+
+class Seeder:
+    """
+    Generates `students`, `faculty` and `courses` rows on top of the demo
+    data. Roughly half the generated courses run in CURRENT_SEMESTER; each
+    generated student takes 3 to `active_per_student` non-clashing current
+    courses in their major and has `grades_per_student` graded past courses.
+    The same `seed` always produces the same database.
+    """
+
+    def __init__(self, students=0, faculty=0, courses=0, grades_per_student=4,
+                 active_per_student=5, seed=0, batch_size=5000, demo=True, log=print):
+        self.students = students
+        self.faculty = faculty
+        self.courses = courses
+        self.grades_per_student = grades_per_student
+        self.active_per_student = active_per_student
+        self.batch_size = batch_size
+        self.demo = demo
+        self.log = log
+        self.rng = random.Random(seed)
+        self._hashes = {}
+
+    @classmethod
+    def for_scale(cls, scale, **kwargs):
+        return cls(**{name: count * scale for name, count in UNIT.items()}, **kwargs)
+
+    def password(self, raw):
+        # Hashing is the slowest step per user; hash each distinct password once.
+        if raw not in self._hashes:
+            self._hashes[raw] = make_password(raw)
+        return self._hashes[raw]
+
+    def name(self):
+        return self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+
+    def write(self, label, model, objs):
+        started = time.perf_counter()
+        objs = model.objects.bulk_create(objs, batch_size=self.batch_size)
+        self.log(f'  {label:<12} {len(objs):>9,} rows  {time.perf_counter() - started:6.1f}s')
+        return objs
+
+    def run(self):
+        started = time.perf_counter()
+        with transaction.atomic():
+            users = self.write('users', User, self.build_users())
+            faculty = self.write('faculty', Faculty, self.build_faculty())
+            courses = self.write('courses', Course, self.build_courses())
+            # bulk_create skips the post_save signal that builds meetings.
+            self.write('meetings', CourseMeeting,
+                       [m for course in courses for m in CourseMeeting.from_course(course)])
+            self.write('assignments', FacultyCourseAssignment, self.build_assignments(faculty, courses))
+            students = self.build_students()
+            enrollments, grades = self.build_enrollments(students, courses)
+            self.write('students', Student, students)
+            self.write('enrollments', Enrollment, enrollments)
+            self.write('grades', Grade, grades)
+        self.log(f'  done in {time.perf_counter() - started:.1f}s')
+
+    # ─── Builders ──────────────────────────────────────────────────────────
+
+    def build_users(self):
+        self._users = {'faculty': [], 'student': []}
+        users = []
+        if self.demo:
+            users.append(User(
+                username=DEMO_ADMIN['email'], email=DEMO_ADMIN['email'], role='admin',
+                first_name=DEMO_ADMIN['first_name'], last_name=DEMO_ADMIN['last_name'],
+                is_staff=True, is_superuser=True, password=self.password(PASSWORDS['admin']),
+            ))
+            for email, first, last, *_ in DEMO_FACULTY:
+                self._users['faculty'].append(User(username=email, email=email, first_name=first, last_name=last))
+            for email, first, last, *_ in DEMO_STUDENTS:
+                self._users['student'].append(User(username=email, email=email, first_name=first, last_name=last))
+        offsets = {'faculty': len(self._users['faculty']), 'student': len(self._users['student'])}
+        for role, count in (('faculty', self.faculty), ('student', self.students)):
+            for i in range(offsets[role] + 1, offsets[role] + count + 1):
+                first, last = self.name()
+                if role == 'faculty':
+                    first, last = 'Dr.', f'{first} {last}'
+                email = f'{role}{i}@university.edu'
+                self._users[role].append(User(username=email, email=email, first_name=first, last_name=last))
+        for role, role_users in self._users.items():
+            for user in role_users:
+                user.role = role
+                user.password = self.password(PASSWORDS[role])
+            users.extend(role_users)
+        return users
+
+    def build_faculty(self):
+        rows = []
+        demo = {row[0]: row for row in DEMO_FACULTY} if self.demo else {}
+        for i, user in enumerate(self._users['faculty'], start=1):
+            if user.email in demo:
+                _, _, _, faculty_id, department, specialization, join_date = demo[user.email]
+                rows.append(Faculty(user=user, faculty_id=faculty_id, department=department,
+                                    specialization=specialization, join_date=join_date))
+            else:
+                rows.append(Faculty(
+                    user=user, faculty_id=f'FAC{i:03d}', department=self.rng.choice(DEPARTMENTS)[1],
+                    specialization='General', join_date=datetime.date(self.rng.randint(2010, 2024), 1, 1),
+                ))
+        return rows
+
+    def build_courses(self):
+        rows = []
+        if self.demo:
+            for code, name, dept, credits, semester, days, start, end, room, building in DEMO_COURSES:
+                rows.append(Course(code=code, name=name, department=dept, credits=credits, semester=semester,
+                                   days=days, start_time=_time(start), end_time=_time(end),
+                                   room=room, building=building))
+        for i in range(self.courses):
+            prefix, dept = DEPARTMENTS[i % len(DEPARTMENTS)]
+            titles = COURSE_TITLES[dept]
+            start, end = self.rng.choice(TIMESLOTS)
+            rows.append(Course(
+                code=f'{prefix}{1001 + i}', name=titles[i // len(DEPARTMENTS) % len(titles)],
+                department=dept, credits=self.rng.choice([3, 3, 3, 4]),
+                semester=CURRENT_SEMESTER if i % 2 == 0 else self.rng.choice(PAST_SEMESTERS),
+                days=self.rng.choice(DAYS_OPTIONS), start_time=_time(start), end_time=_time(end),
+                room=self.rng.choice(ROOMS), building=self.rng.choice(BUILDINGS),
+            ))
+        return rows
+
+    def build_assignments(self, faculty, courses):
+        by_id = {f.faculty_id: f for f in faculty}
+        by_dept = {}
+        for f in faculty:
+            by_dept.setdefault(f.department, []).append(f)
+        rows, assigned = [], set()
+        if self.demo:
+            by_code = {c.code: c for c in courses}
+            for faculty_id, code in DEMO_ASSIGNMENTS:
+                rows.append(FacultyCourseAssignment(faculty=by_id[faculty_id], course=by_code[code]))
+                assigned.add(code)
+        # Every other course goes to someone from its department when possible.
+        for course in courses:
+            if course.code not in assigned and faculty:
+                rows.append(FacultyCourseAssignment(
+                    faculty=self.rng.choice(by_dept.get(course.department) or faculty), course=course,
+                ))
+        self._faculty = by_id
+        self._instructor = {row.course.code: row.faculty for row in rows}
+        return rows
+
+    def build_students(self):
+        rows = []
+        demo = {row[0]: row for row in DEMO_STUDENTS} if self.demo else {}
+        for i, user in enumerate(self._users['student'], start=1):
+            if user.email in demo:
+                _, _, _, student_id, major, year, gpa = demo[user.email]
+                rows.append(Student(user=user, student_id=student_id, major=major, year=year, current_gpa=gpa))
+            else:
+                rows.append(Student(
+                    user=user, student_id=f'STU{i:03d}', major=self.rng.choice(DEPARTMENTS)[1],
+                    year=self.rng.choice(['1st', '2nd', '3rd', '4th']),
+                    current_gpa=f'{self.rng.uniform(2.5, 4.0):.2f}',
+                ))
+        return rows
+
+    def build_enrollments(self, students, courses):
+        current, past = {}, {}
+        for course in courses[len(DEMO_COURSES) if self.demo else 0:]:
+            bucket = current if course.semester == CURRENT_SEMESTER else past
+            bucket.setdefault(course.department, []).append(course)
+
+        enrollments, grades = [], []
+        if self.demo:
+            by_student = {s.student_id: s for s in students}
+            by_code = {c.code: c for c in courses}
+            for student_id, code in DEMO_ENROLLMENTS:
+                enrollments.append(Enrollment(student=by_student[student_id], course=by_code[code]))
+            for student_id, code, letter, faculty_id in DEMO_GRADES:
+                grades.append(self.grade(by_student[student_id], by_code[code], letter,
+                                         self._faculty[faculty_id]))
+        demo_ids = {row[3] for row in DEMO_STUDENTS} if self.demo else set()
+
+        for student in students:
+            if student.student_id in demo_ids:
+                continue
+            # Current semester: non-clashing courses in the student's major.
+            options = current.get(student.major, [])
+            target = self.rng.randint(min(3, self.active_per_student), self.active_per_student)
+            taken = set()
+            for course in self.rng.sample(options, min(len(options), target * 3)):
+                slots = {(day, course.start_time) for day in course.days}
+                if not slots & taken:
+                    taken |= slots
+                    enrollments.append(Enrollment(student=student, course=course))
+                    target -= 1
+                    if not target:
+                        break
+            # Past semesters: completed and graded.
+            options = past.get(student.major, [])
+            completed = self.rng.sample(options, min(len(options), self.grades_per_student))
+            for course in completed:
+                enrollments.append(Enrollment(student=student, course=course, status='Completed'))
+                grades.append(self.grade(student, course, self.rng.choice(GRADE_CHOICES),
+                                         self._instructor.get(course.code)))
+            if completed:
+                points = sum(float(g.gpa) * g.course.credits for g in grades[-len(completed):])
+                credits = sum(g.course.credits for g in grades[-len(completed):])
+                student.current_gpa = round(points / credits, 2)
+
+        # Same value update_student_gpa() would store for graded demo students.
+        if self.demo:
+            totals = {}
+            for g in grades:
+                if g.student.student_id in demo_ids:
+                    points, credits = totals.get(g.student.student_id, (0, 0))
+                    totals[g.student.student_id] = (points + float(g.gpa) * g.course.credits,
+                                                    credits + g.course.credits)
+            for student in students:
+                if student.student_id in totals:
+                    points, credits = totals[student.student_id]
+                    student.current_gpa = round(points / credits, 2)
+        return enrollments, grades
+
+    @staticmethod
+    def grade(student, course, letter, faculty):
+        return Grade(student=student, course=course, grade=letter,
+                     gpa=Grade.GPA_MAP[letter], graded_by=faculty)
@@ -1,10 +1,24 @@
 from rest_framework import serializers
-from .models import Course, FacultyCourseAssignment, Enrollment, Grade
+from .models import Course, FacultyCourseAssignment, Enrollment, Grade, active_students_count, instructor_prefetch
 from users.models import Student, Faculty
+from config.fieldsets import SparseFieldsetSerializerMixin
+from config.serializers import ValuesSerializer, decimal_string, full_name, iso_datetime
 
 
-class CourseSerializer(serializers.ModelSerializer):
+class CourseSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """Flat course+schedule payload matching ManageCourses.jsx form."""
+    field_sources = {
+        'id': (), 'code': ('code',), 'name': ('name',), 'department': ('department',),
+        'credits': ('credits',), 'semester': ('semester',), 'days': ('days',),
+        'start_time': ('start_time',), 'end_time': ('end_time',), 'room': ('room',),
+        'building': ('building',), 'description': ('description',),
+        'schedule': ('days', 'start_time', 'end_time'),
+        'location': ('room', 'building'),
+        'students_count': (),
+    }
+    field_annotations = {
+        'students_count': {'students_count': active_students_count()},
+    }
 
     class Meta:
         model = Course
@@ -13,26 +27,42 @@ class CourseSerializer(serializers.ModelSerializer):
             'days', 'start_time', 'end_time', 'room', 'building', 'description',
         ]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Sparse fieldset: drop model fields that weren't requested.
+        requested = self.context.get('fields')
+        if requested:
+            for name in set(self.fields) - set(requested):
+                self.fields.pop(name)
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
-        # Format schedule string for table display: "Mon, Wed 10:00-11:30"
-        days_str = ', '.join(instance.days) if instance.days else ''
-        time_str = ''
-        if instance.start_time and instance.end_time:
-            time_str = f"{instance.start_time.strftime('%H:%M')}-{instance.end_time.strftime('%H:%M')}"
-        data['schedule'] = f"{days_str} {time_str}".strip() if days_str or time_str else ''
-        # Format location string: "Building - Room"
-        data['location'] = ''
-        if instance.building and instance.room:
-            data['location'] = f"{instance.building} - {instance.room}"
-        elif instance.building:
-            data['location'] = instance.building
-        elif instance.room:
-            data['location'] = instance.room
-
-        # Include students_count for faculty cards
-        # Ei course e kotojon student enroll kora ache ta count kora hocche.
-        data['students_count'] = instance.enrollments.filter(status='Active').count()
+        requested = self.requested_fields()
+        if 'schedule' in requested:
+            # Format schedule string for table display: "Mon, Wed 10:00-11:30"
+            days_str = ', '.join(instance.days) if instance.days else ''
+            time_str = ''
+            if instance.start_time and instance.end_time:
+                time_str = f"{instance.start_time.strftime('%H:%M')}-{instance.end_time.strftime('%H:%M')}"
+            data['schedule'] = f"{days_str} {time_str}".strip() if days_str or time_str else ''
+        if 'location' in requested:
+            # Format location string: "Building - Room"
+            data['location'] = ''
+            if instance.building and instance.room:
+                data['location'] = f"{instance.building} - {instance.room}"
+            elif instance.building:
+                data['location'] = instance.building
+            elif instance.room:
+                data['location'] = instance.room
+
+        if 'students_count' in requested:
+            # Include students_count for faculty cards
+            # Ei course e kotojon student enroll kora ache ta count kora hocche.
+            # List views annotate it; single objects fall back to a query.
+            if hasattr(instance, 'students_count'):
+                data['students_count'] = instance.students_count
+            else:
+                data['students_count'] = instance.enrollments.filter(status='Active').count()
         return data
 
 
@@ -91,11 +121,27 @@ class FacultyCourseAssignmentSerializer(serializers.Serializer):
         }
 
 
-class EnrollmentSerializer(serializers.Serializer):
+class EnrollmentSerializer(SparseFieldsetSerializerMixin, serializers.Serializer):
     """Accepts { student_id, course_code } from StudentEnrollment.jsx."""
     student_id = serializers.CharField()
     course_code = serializers.CharField()
 
+    field_sources = {
+        'id': (),
+        'studentName': ('student__user__first_name', 'student__user__last_name'),
+        'studentId': ('student__student_id',),
+        'courseCode': ('course__code',),
+        'courseName': ('course__name',),
+        'semester': ('course__semester',),
+        'instructor': ('course__id',),
+        'status': ('status',),
+        'enrollment_date': ('enrolled_at',),
+        'credits': ('course__credits',),
+        'schedule': ('course__days', 'course__start_time', 'course__end_time'),
+        'room': ('course__room', 'course__building'),
+    }
+    field_prefetches = {'instructor': lambda: [instructor_prefetch()]}
+
     def validate(self, attrs):
         try:
             attrs['student_obj'] = Student.objects.get(student_id=attrs['student_id'])
@@ -123,25 +169,31 @@ class EnrollmentSerializer(serializers.Serializer):
         )
 
     def to_representation(self, instance):
-        # Resolve instructor from FacultyCourseAssignment
-        assignment = FacultyCourseAssignment.objects.filter(course=instance.course).first()
-        instructor = assignment.faculty.user.get_full_name() if assignment else 'Not Assigned'
-
-        return {
-            'id': instance.id,
-            'studentName': instance.student.user.get_full_name(),
-            'studentId': instance.student.student_id,
-            'courseCode': instance.course.code,
-            'courseName': instance.course.name,
-            'semester': instance.course.semester,
-            'instructor': instructor,
-            'status': instance.status,
-            'enrollment_date': instance.enrolled_at.strftime('%Y-%m-%d') if instance.enrolled_at else '',
+        values = {
+            'id': lambda: instance.id,
+            'studentName': lambda: instance.student.user.get_full_name(),
+            'studentId': lambda: instance.student.student_id,
+            'courseCode': lambda: instance.course.code,
+            'courseName': lambda: instance.course.name,
+            'semester': lambda: instance.course.semester,
+            'instructor': lambda: self._get_instructor(instance.course),
+            'status': lambda: instance.status,
+            'enrollment_date': lambda: instance.enrolled_at.strftime('%Y-%m-%d') if instance.enrolled_at else '',
             # Extra fields for student enrollment view
-            'credits': instance.course.credits,
-            'schedule': self._format_schedule(instance.course),
-            'room': self._format_location(instance.course),
+            'credits': lambda: instance.course.credits,
+            'schedule': lambda: self._format_schedule(instance.course),
+            'room': lambda: self._format_location(instance.course),
         }
+        return {name: values[name]() for name in self.requested_fields()}
+
+    def _get_instructor(self, course):
+        # Resolve instructor from FacultyCourseAssignment (prefetched on list views)
+        assignments = getattr(course, 'prefetched_assignments', None)
+        if assignments is None:
+            assignment = FacultyCourseAssignment.objects.filter(course=course).first()
+        else:
+            assignment = assignments[0] if assignments else None
+        return assignment.faculty.user.get_full_name() if assignment else 'Not Assigned'
 
     def _format_schedule(self, course):
         days_str = ', '.join(course.days) if course.days else ''
@@ -156,6 +208,41 @@ class EnrollmentSerializer(serializers.Serializer):
         return course.room or course.building or ''
 
 
+class EnrollmentTransitionSerializer(serializers.Serializer):
+    """
+    Accepts { status, from_status?, course_code?, semester?, archive? }:
+    moves the enrollments of a course and/or semester to `status`. At least
+    one of course_code / semester is required; `archive` (closing a whole
+    semester) also needs semester and no course_code.
+    """
+    STATUSES = [choice for choice, _ in Enrollment.STATUS_CHOICES]
+
+    status = serializers.ChoiceField(choices=STATUSES)
+    from_status = serializers.ListField(child=serializers.ChoiceField(choices=STATUSES), required=False)
+    course_code = serializers.CharField(required=False)
+    semester = serializers.CharField(required=False)
+    archive = serializers.BooleanField(default=False)
+
+    def validate(self, attrs):
+        if not attrs.get('course_code') and not attrs.get('semester'):
+            raise serializers.ValidationError("Give a course_code, a semester or both.")
+        if attrs['archive'] and (attrs.get('course_code') or not attrs.get('semester')):
+            raise serializers.ValidationError("archive closes a whole semester: give a semester and no course_code.")
+        if attrs.get('course_code') and not Course.objects.filter(code=attrs['course_code']).exists():
+            raise serializers.ValidationError(f"Course {attrs['course_code']} not found.")
+        return attrs
+
+    def get_queryset(self):
+        queryset = Enrollment.objects.all()
+        if self.validated_data.get('course_code'):
+            queryset = queryset.filter(course__code=self.validated_data['course_code'])
+        if self.validated_data.get('semester'):
+            queryset = queryset.filter(course__semester=self.validated_data['semester'])
+        if self.validated_data.get('from_status'):
+            queryset = queryset.filter(status__in=self.validated_data['from_status'])
+        return queryset
+
+
 class BulkGradeSerializer(serializers.Serializer):
     """Accepts { course_code, grades: [{student_id, grade}] } from SubmitGrades.jsx."""
     course_code = serializers.CharField()
@@ -173,11 +260,29 @@ class BulkGradeSerializer(serializers.Serializer):
                 raise serializers.ValidationError("Each grade entry must have student_id and grade.")
             if entry['grade'] not in valid_grades:
                 raise serializers.ValidationError(f"Invalid grade: {entry['grade']}")
-            try:
-                Student.objects.get(student_id=entry['student_id'])
-            except Student.DoesNotExist:
-                raise serializers.ValidationError(f"Student {entry['student_id']} not found.")
 
+        # Look every student up in one query.
+        student_ids = [entry['student_id'] for entry in attrs['grades']]
+        existing = set(
+            Student.objects.filter(student_id__in=student_ids).values_list('student_id', flat=True)
+        )
+        for student_id in student_ids:
+            if student_id not in existing:
+                raise serializers.ValidationError(f"Student {student_id} not found.")
+
+        return attrs
+
+
+class GradeImportSerializer(serializers.Serializer):
+    """Accepts a multipart upload: course_code + a CSV/XLSX `file` (see academic.grade_import)."""
+    course_code = serializers.CharField()
+    file = serializers.FileField()
+
+    def validate(self, attrs):
+        try:
+            attrs['course_obj'] = Course.objects.get(code=attrs['course_code'])
+        except Course.DoesNotExist:
+            raise serializers.ValidationError(f"Course {attrs['course_code']} not found.")
         return attrs
 
 
@@ -195,7 +300,38 @@ class GradeSerializer(serializers.ModelSerializer):
         model = Grade
         fields = [
             'id', 'student_id', 'student_name', 'course_code', 'course_name',
-            'grade', 'grade_points', 'credits', 'semester',
+            'grade', 'grade_points', 'credits', 'semester', 'version',
         ]
         read_only_fields = ['id', 'student_id', 'student_name', 'course_code',
-                            'course_name', 'grade_points', 'credits', 'semester']
+                            'course_name', 'grade_points', 'credits', 'semester', 'version']
+
+
+class GradeValuesSerializer(ValuesSerializer):
+    """Read-only GradeSerializer output built from values_list() rows."""
+    fields = (
+        ('id', 'id'),
+        ('student_id', 'student__student_id'),
+        ('student_name', ('student__user__first_name', 'student__user__last_name'), full_name),
+        ('course_code', 'course__code'),
+        ('course_name', 'course__name'),
+        ('grade', 'grade'),
+        ('grade_points', 'gpa', decimal_string(2)),
+        ('credits', 'course__credits'),
+        ('semester', 'course__semester'),
+        ('version', 'version'),
+    )
+
+
+class GradeAuditValuesSerializer(ValuesSerializer):
+    """Rows of GradeAuditLog for the admin audit list."""
+    fields = (
+        ('id', 'id'),
+        ('grade_id', 'grade_id'),
+        ('student_id', 'student__student_id'),
+        ('course_code', 'course__code'),
+        ('old_grade', 'old_grade'),
+        ('new_grade', 'new_grade'),
+        ('changed_by', 'changed_by__faculty_id'),
+        ('source', 'source'),
+        ('changed_at', 'changed_at', iso_datetime),
+    )
@@ -0,0 +1,184 @@
+"""
+Shared fixtures for the academic and users tests: a small seeded data set,
+JWT headers per role and the query-count harness built on them.
+"""
+import contextlib
+import datetime
+import json
+from urllib.parse import urlsplit
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache, caches
+from django.db import DEFAULT_DB_ALIAS, connection, connections, transaction
+from django.test import TestCase, override_settings
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from academic.models import Course, Enrollment, FacultyCourseAssignment, Grade, GradeAuditLog
+from users.models import Faculty, Student, User
+
+N = 3
+ROLES = ('admin', 'faculty', 'student')
+PASSWORD = 'secret123'
+GRADES = list(Grade.GPA_MAP)
+
+
+def seed(n, start, faculty, student):
+    """
+    Add n courses, n students and n faculty members (numbered from `start`),
+    each seeded student enrolled and graded in one course. The demo faculty
+    teaches every course and the demo student takes every course, so their
+    own lists grow with the data too.
+    """
+    numbers = range(start, start + n)
+    # create(), not bulk_create(): the post_save signal builds CourseMeeting rows.
+    courses = [
+        Course.objects.create(
+            code=f'T{i:04d}', name=f'Course {i}', department='CSE', credits=1 + i % 4,
+            semester=('Fall 2025', 'Spring 2026')[i % 2], days=['Mon', 'Wed'],
+            start_time=datetime.time(8 + i % 8), end_time=datetime.time(9 + i % 8),
+            room=f'R{i}', building='Main',
+        )
+        for i in numbers
+    ]
+    users = User.objects.bulk_create(
+        [
+            User(username=f'{role}{i}', email=f'{role}{i}@test.edu', first_name=role.title(),
+                 last_name=str(i), role=role, password=make_password(None))
+            for role in ('student', 'faculty') for i in numbers
+        ]
+    )
+    students = Student.objects.bulk_create([
+        Student(user=user, student_id=f'S{i:05d}', major='CSE', year='2nd')
+        for i, user in zip(numbers, users[:n])
+    ])
+    faculty_members = Faculty.objects.bulk_create([
+        Faculty(user=user, faculty_id=f'F{i:05d}', department='CSE',
+                join_date=datetime.date(2020, 1, 1))
+        for i, user in zip(numbers, users[n:])
+    ])
+    FacultyCourseAssignment.objects.bulk_create(
+        [FacultyCourseAssignment(faculty=faculty, course=course) for course in courses]
+        + [FacultyCourseAssignment(faculty=f, course=c) for f, c in zip(faculty_members, courses)]
+    )
+    pairs = [(student, course) for course in courses] + list(zip(students, courses))
+    Enrollment.objects.bulk_create([Enrollment(student=s, course=c) for s, c in pairs])
+    grades = Grade.objects.bulk_create([
+        Grade(student=s, course=c, grade=GRADES[i % len(GRADES)],
+              gpa=Grade.GPA_MAP[GRADES[i % len(GRADES)]], graded_by=faculty)
+        for i, (s, c) in enumerate(pairs)
+    ])
+    GradeAuditLog.objects.bulk_create([
+        GradeAuditLog(grade=g, student=g.student, course=g.course, new_grade=g.grade,
+                      changed_by=faculty, source='bulk')
+        for g in grades
+    ])
+
+
+@override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+    QUERY_BUDGET_ACTION='raise',
+)
+class QueryCountTestCase(TestCase):
+    """
+    Base class: subclasses return their requests from endpoint_calls() as
+    (role, method, path, data, expected status) and call
+    assertQueriesConstant(). Each request runs in a rolled-back savepoint
+    with a cold cache, so writes don't leak into later requests.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            username='admin', email='admin@test.edu', password=PASSWORD,
+            first_name='Ada', last_name='Admin', role='admin',
+        )
+        cls.faculty = Faculty.objects.create(
+            user=User.objects.create_user(
+                username='faculty', email='faculty@test.edu', password=PASSWORD,
+                first_name='Fahim', last_name='Rahman', role='faculty',
+            ),
+            faculty_id='FAC001', department='CSE', specialization='Systems',
+            join_date=datetime.date(2019, 7, 1),
+        )
+        cls.student = Student.objects.create(
+            user=User.objects.create_user(
+                username='student', email='student@test.edu', password=PASSWORD,
+                first_name='Ayesha', last_name='Siddiqua', role='student',
+            ),
+            student_id='STU001', major='CSE', year='3rd',
+        )
+        seed(N, 0, cls.faculty, cls.student)
+
+    def setUp(self):
+        # Cached values (and throttle buckets) outlive each test's rolled-back transaction.
+        cache.clear()
+        caches[settings.THROTTLE_CACHE].clear()
+        users = {'admin': self.admin, 'faculty': self.faculty.user, 'student': self.student.user}
+        self.headers = {
+            role: {'HTTP_AUTHORIZATION': f'Bearer {RefreshToken.for_user(user).access_token}'}
+            for role, user in users.items()
+        }
+        self.headers[None] = {}
+
+    def endpoint_calls(self):
+        raise NotImplementedError
+
+    def reads(self, path, *allowed):
+        """GET `path` as every role; roles not in `allowed` expect 403."""
+        return [
+            (role, 'GET', path, None, 200 if role in allowed else 403)
+            for role in ROLES
+        ]
+
+    def count_queries(self):
+        counts = {}
+        for role, method, path, data, expected in self.endpoint_calls():
+            cache.clear()
+            savepoint = transaction.savepoint()
+            if isinstance(data, dict) and any(hasattr(value, 'read') for value in data.values()):
+                body, content_type = encode_multipart(BOUNDARY, data), MULTIPART_CONTENT
+            else:
+                body, content_type = json.dumps(data) if data is not None else '', 'application/json'
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.generic(
+                    method, path, body, content_type=content_type, **self.headers[role],
+                )
+            transaction.savepoint_rollback(savepoint)
+            label = f'{method} {path} as {role or "anonymous"}'
+            self.assertEqual(response.status_code, expected, label)
+            counts[label] = len(ctx)
+        return counts
+
+    def assertQueriesConstant(self):
+        small = self.count_queries()
+        seed(9 * N, N, self.faculty, self.student)
+        large = self.count_queries()
+        for label, queries in small.items():
+            with self.subTest(label):
+                self.assertEqual(large[label], queries, f'{label}: query count grew with the data')
+
+    def assertRoutesCovered(self, route_names):
+        called = {resolve(urlsplit(path).path).url_name for _, _, path, _, _ in self.endpoint_calls()}
+        self.assertEqual(set(route_names) - called, set(), 'routes without a query-count check')
+
+
+DASHBOARD_ROUTES = (
+    'admin-dashboard-stats', 'faculty-dashboard-stats', 'student-dashboard-stats',
+    'admin-dashboard-bootstrap', 'faculty-dashboard-bootstrap', 'student-dashboard-bootstrap',
+)
+
+
+@contextlib.asynccontextmanager
+async def capture_queries():
+    # Connections are per thread: capture on the one the async ORM runs its queries in.
+    ctx = CaptureQueriesContext(await sync_to_async(connections.__getitem__)(DEFAULT_DB_ALIAS))
+    await sync_to_async(ctx.__enter__)()
+    try:
+        yield ctx
+    finally:
+        await sync_to_async(ctx.__exit__)(None, None, None)
@@ -0,0 +1,46 @@
+import asyncio
+import json
+import re
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.test.client import AsyncRequestFactory
+from django.urls import resolve, reverse
+
+from academic import async_views
+from .base import DASHBOARD_ROUTES, ROLES, QueryCountTestCase, capture_queries
+
+
+class AsyncViewTests(QueryCountTestCase):
+    """academic.async_views must answer exactly like the sync views they stand in for."""
+
+    routes = ('schedule-today', 'academic-history-summary', *DASHBOARD_ROUTES[:3])
+
+    async def test_async_views_match_sync_views(self):
+        factory = AsyncRequestFactory()
+        for name in self.routes:
+            path = reverse(name)
+            view = getattr(async_views, resolve(path).func.view_class.__name__).as_view()
+            for role in (*ROLES, None):
+                headers = {k[5:].lower(): v for k, v in self.headers[role].items()}
+                with self.subTest(name, role=role):
+                    await cache.aclear()
+                    async with capture_queries() as sync_queries:
+                        expected = await self.async_client.get(path, headers=headers)
+                    await cache.aclear()
+                    async with capture_queries() as async_queries:
+                        response = await view(factory.get(path, headers=headers))
+                    self.assertEqual(response.status_code, expected.status_code)
+                    self.assertEqual(json.loads(response.content), json.loads(expected.content))
+                    self.assertEqual(response.get('WWW-Authenticate'), expected.get('WWW-Authenticate'))
+                    self.assertLessEqual(len(async_queries), len(sync_queries))
+
+    @override_settings(SERVER_TIMING=True)
+    async def test_concurrent_requests_count_only_their_own_queries(self):
+        path = reverse('academic-history-summary')
+        headers = {k[5:].lower(): v for k, v in self.headers['student'].items()}
+        queries = lambda response: int(re.search(r'queries=(\d+)', response['Server-Timing']).group(1))
+        await self.async_client.get(path, headers=headers)
+        alone = queries(await self.async_client.get(path, headers=headers))
+        responses = await asyncio.gather(*[self.async_client.get(path, headers=headers) for _ in range(4)])
+        self.assertEqual([queries(response) for response in responses], [alone] * 4)
@@ -0,0 +1,53 @@
+from django.urls import reverse
+
+from academic.models import Enrollment, Grade, recalculate_gpas
+from users.models import Student
+from .base import QueryCountTestCase
+
+
+class DashboardTests(QueryCountTestCase):
+
+    def test_bootstrap_matches_the_widget_endpoints_and_is_cached(self):
+        get = lambda name: self.client.get(reverse(name), **self.headers['student']).json()['data']
+        bootstrap = get('student-dashboard-bootstrap')
+        self.assertEqual(bootstrap['stats'], get('student-dashboard-stats'))
+        self.assertEqual(bootstrap['schedule_today'], get('schedule-today'))
+        self.assertEqual(bootstrap['history_summary'], get('academic-history-summary'))
+        self.assertEqual(len(bootstrap['courses']), bootstrap['stats']['enrolled_courses_count'])
+
+        # Auth only: the user and the student profile the cache key depends on.
+        with self.assertNumQueries(2):
+            self.assertEqual(get('student-dashboard-bootstrap'), bootstrap)
+
+        Enrollment.objects.filter(student=self.student).first().delete()
+        self.assertEqual(
+            get('student-dashboard-bootstrap')['stats']['enrolled_courses_count'],
+            bootstrap['stats']['enrolled_courses_count'] - 1,
+        )
+
+    def test_grade_update_refreshes_the_bootstrap(self):
+        get = lambda: self.client.get(reverse('student-dashboard-bootstrap'), **self.headers['student']).json()['data']
+        recalculate_gpas([self.student.pk])
+        before = get()
+        grade = Grade.objects.filter(student=self.student).exclude(grade='F').first()
+        response = self.client.put(reverse('grade-update', args=[grade.pk]), {'grade': 'F'},
+                                   content_type='application/json', **self.headers['faculty'])
+        self.assertEqual(response.status_code, 200)
+
+        after = get()
+        self.assertLess(float(after['stats']['current_gpa']), float(before['stats']['current_gpa']))
+        self.assertEqual(after['stats']['current_gpa'], str(Student.objects.get(pk=self.student.pk).current_gpa))
+        self.assertEqual(after['history_summary'], self.client.get(
+            reverse('academic-history-summary'), **self.headers['student']).json()['data'])
+        self.assertNotEqual(after['history_summary'], before['history_summary'])
+
+    def test_profile_changes_refresh_the_student_bootstrap(self):
+        get = lambda: self.client.get(reverse('student-dashboard-bootstrap'), **self.headers['student']).json()['data']
+        self.assertEqual(get()['stats']['current_gpa'], '0.00')
+        # An admin's edit of the profile (current_gpa is editable on the student form).
+        response = self.client.put(reverse('student-detail', args=[self.student.student_id]), {
+            'student_id': self.student.student_id, 'name': 'Ayesha Siddiqua', 'email': self.student.user.email,
+            'major': 'CSE', 'year': '3rd', 'gpa': '3.25',
+        }, content_type='application/json', **self.headers['admin'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get()['stats']['current_gpa'], '3.25')
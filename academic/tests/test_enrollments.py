@@ -0,0 +1,110 @@
+from unittest import mock
+
+from django.db import DatabaseError, connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from academic.models import ArchivedEnrollment, ArchivedGrade, Enrollment, Grade, Semester, recalculate_gpas
+from users.models import Student
+from .base import QueryCountTestCase
+
+
+class EnrollmentStatusTests(QueryCountTestCase):
+
+    def test_status_transition_is_one_update_and_refreshes_caches(self):
+        url = reverse('enrollment-status-transition')
+        stats = lambda: self.client.get(reverse('student-dashboard-stats'), **self.headers['student']).json()['data']
+        before = stats()['enrolled_courses_count']
+        fall = Enrollment.objects.filter(course__semester='Fall 2025', status='Active')
+        expected = fall.count()
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(url, {'status': 'Completed', 'from_status': ['Active'],
+                                              'semester': 'Fall 2025'},
+                                        content_type='application/json', **self.headers['admin'])
+        self.assertEqual(response.json()['data']['updated'], expected)
+        self.assertEqual([q['sql'].split()[0] for q in ctx].count('UPDATE'), 1)
+        self.assertFalse(fall.exists())
+        student_fall = Enrollment.objects.filter(student=self.student, course__semester='Fall 2025').count()
+        self.assertEqual(stats()['enrolled_courses_count'], before - student_fall)
+
+        response = self.client.post(url, {'status': 'Completed'}, content_type='application/json',
+                                    **self.headers['admin'])
+        self.assertEqual(response.status_code, 400)
+
+    def test_archiving_a_semester_keeps_history_and_transcript(self):
+        url = reverse('enrollment-status-transition')
+        history = lambda: self.client.get(reverse('academic-history'), **self.headers['student']).json()['data']
+        summary = lambda: self.client.get(reverse('academic-history-summary'),
+                                          **self.headers['student']).json()['data']
+        before_history, before_summary = history(), summary()
+        recalculate_gpas([self.student.pk])
+        gpa = Student.objects.get(pk=self.student.pk).current_gpa
+        fall_grades = Grade.objects.filter(course__semester='Fall 2025').count()
+        fall_enrollments = Enrollment.objects.filter(course__semester='Fall 2025').count()
+        remaining = Grade.objects.exclude(course__semester='Fall 2025').count()
+
+        response = self.client.post(url, {'status': 'Completed', 'semester': 'Fall 2025', 'archive': True},
+                                    content_type='application/json', **self.headers['admin'])
+        self.assertEqual(response.json()['data']['archived'],
+                         {'enrollments': fall_enrollments, 'grades': fall_grades})
+        self.assertFalse(Enrollment.objects.filter(course__semester='Fall 2025').exists())
+        self.assertEqual(Grade.objects.count(), remaining)
+        self.assertEqual(ArchivedGrade.objects.count(), fall_grades)
+        self.assertEqual(set(ArchivedEnrollment.objects.values_list('status', flat=True)), {'Completed'})
+        self.assertTrue(Semester.objects.get(name='Fall 2025').is_archived)
+
+        # Reads across every term still see the archived grades.
+        self.assertEqual(history(), before_history)
+        self.assertEqual(summary(), before_summary)
+        recalculate_gpas([self.student.pk])
+        self.assertEqual(Student.objects.get(pk=self.student.pk).current_gpa, gpa)
+        response = self.client.get(reverse('transcript'), **self.headers['student'])
+        self.assertEqual(response.status_code, 200)
+
+        # A failed archive leaves the statuses as they were.
+        spring = Enrollment.objects.filter(course__semester='Spring 2026', status='Active')
+        active = spring.count()
+        with mock.patch('academic.views.archive_semester', side_effect=DatabaseError('disk full')), \
+                self.assertRaises(DatabaseError):
+            self.client.post(url, {'status': 'Completed', 'semester': 'Spring 2026', 'archive': True},
+                             content_type='application/json', **self.headers['admin'])
+        self.assertGreater(active, 0)
+        self.assertEqual(spring.count(), active)
+
+        # Re-enrolled and regraded after the archive: a second run replaces the archived rows.
+        archived = ArchivedEnrollment.objects.filter(student=self.student).first()
+        Enrollment.objects.create(student=self.student, course_id=archived.course_id, status='Active')
+        Grade.objects.create(student=self.student, course_id=archived.course_id, grade='C', gpa=Grade.GPA_MAP['C'])
+        response = self.client.post(url, {'status': 'Completed', 'semester': 'Fall 2025', 'archive': True},
+                                    content_type='application/json', **self.headers['admin'])
+        self.assertEqual(response.json()['data']['archived'], {'enrollments': 1, 'grades': 1})
+        self.assertEqual(ArchivedGrade.objects.count(), fall_grades)
+        self.assertEqual(ArchivedGrade.objects.get(student=self.student, course_id=archived.course_id).grade, 'C')
+
+        response = self.client.post(url, {'status': 'Completed', 'course_code': 'T0000', 'archive': True},
+                                    content_type='application/json', **self.headers['admin'])
+        self.assertEqual(response.status_code, 400)
+
+    def test_a_current_grade_supersedes_the_archived_one_for_the_same_course(self):
+        url = reverse('enrollment-status-transition')
+        self.client.post(url, {'status': 'Completed', 'semester': 'Fall 2025', 'archive': True},
+                         content_type='application/json', **self.headers['admin'])
+        summary = lambda: self.client.get(reverse('academic-history-summary'),
+                                          **self.headers['student']).json()['data']
+        before = summary()
+        archived = ArchivedGrade.objects.filter(student=self.student).exclude(grade='F').first()
+
+        # Regraded before the semester is archived again: the course counts once, with the new grade.
+        Grade.objects.create(student=self.student, course_id=archived.course_id, grade='F', gpa=Grade.GPA_MAP['F'])
+        after = summary()
+        self.assertEqual(after['courses_completed'], before['courses_completed'])
+        self.assertEqual(after['total_credits'], before['total_credits'])
+        self.assertLess(after['cumulative_gpa'], before['cumulative_gpa'])
+
+        history = self.client.get(reverse('academic-history'), **self.headers['student']).json()['data']
+        courses = [course for semester in history for course in semester['courses']]
+        self.assertEqual(len(courses), before['courses_completed'])
+        self.assertEqual([course['grade'] for course in courses if course['code'] == archived.course.code], ['F'])
+        recalculate_gpas([self.student.pk])
+        self.assertEqual(float(Student.objects.get(pk=self.student.pk).current_gpa), after['cumulative_gpa'])
@@ -0,0 +1,71 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from academic.serializers import CourseSerializer, EnrollmentSerializer, GradeValuesSerializer
+from .base import QueryCountTestCase
+
+
+class SparseFieldsetTests(QueryCountTestCase):
+    """?fields= on the course, enrollment, grade and records lists."""
+
+    def get(self, name, query=''):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse(name) + query, **self.headers['admin'])
+        # The first query is the JWT user lookup.
+        return response, [q['sql'] for q in ctx.captured_queries[1:]]
+
+    def rows(self, name, query=''):
+        response, _ = self.get(name, query)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data']
+
+    def test_narrow_requests_return_only_the_requested_keys(self):
+        lists = [
+            ('course-list-create', '?page_size=100&', CourseSerializer.field_names, 'name,code'),
+            ('enrollment-list-create', '?', EnrollmentSerializer.field_names, 'status,courseCode'),
+            ('grade-list', '?', GradeValuesSerializer.field_names, 'grade,student_id'),
+            ('academic-records', '?page_size=100&', GradeValuesSerializer.field_names, 'grade,student_id'),
+        ]
+        for name, query, field_names, fields in lists:
+            with self.subTest(name):
+                full = self.rows(name, query.rstrip('&?'))
+                self.assertEqual([list(row) for row in full], [list(field_names)] * len(full))
+                # Absent, empty, or every field: the same output.
+                self.assertEqual(self.rows(name, query + 'fields='), full)
+                self.assertEqual(self.rows(name, query + 'fields=' + ','.join(reversed(field_names))), full)
+
+                narrow = self.rows(name, query + 'fields=' + fields)
+                # Keys come back in the serializer's order, not the request's.
+                keys = [key for key in field_names if key in fields.split(',')]
+                self.assertEqual(narrow, [{key: row[key] for key in keys} for row in full])
+
+    def test_unknown_fields_are_a_400_listing_the_available_ones(self):
+        response, _ = self.get('course-list-create', '?fields=code,bogus,nope')
+        self.assertEqual(response.status_code, 400)
+        message = str(response.json())
+        self.assertIn('Unknown field(s): bogus, nope.', message)
+        self.assertIn(f"Available: {', '.join(CourseSerializer.field_names)}.", message)
+
+        response, _ = self.get('enrollment-list-create', '?fields=studentId,student_id')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('student_id', str(response.json()))
+
+    def test_narrow_requests_skip_unrequested_joins_and_subqueries(self):
+        _, full = self.get('course-list-create', '?page_size=100')
+        _, narrow = self.get('course-list-create', '?page_size=100&fields=code,name')
+        self.assertIn('academic_enrollment', full[-1])
+        self.assertNotIn('academic_enrollment', narrow[-1])
+        self.assertNotIn('"academic_course"."description"', narrow[-1])
+
+        _, full = self.get('enrollment-list-create')
+        _, narrow = self.get('enrollment-list-create', '?fields=courseCode,status')
+        self.assertTrue(any('users_user' in sql for sql in full))
+        self.assertFalse(any('users_user' in sql for sql in narrow))
+        # No instructor prefetch either.
+        self.assertEqual(len(narrow), len(full) - 1)
+
+        _, full = self.get('grade-list')
+        _, narrow = self.get('grade-list', '?fields=grade,course_code')
+        self.assertIn('users_user', full[-1])
+        self.assertNotIn('users_user', narrow[-1])
@@ -0,0 +1,216 @@
+import csv
+import io
+import shutil
+import tempfile
+from unittest import mock, skipUnless
+from urllib.parse import urlsplit
+
+from asgiref.sync import sync_to_async
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import DatabaseError, connection, transaction
+from django.http import HttpResponse
+from django.test import override_settings
+from django.test.client import AsyncRequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from academic import grade_import
+from academic.grade_import import openpyxl
+from academic.models import Course, Grade, GradeAuditLog
+from config import deferred, metrics
+from config.middleware import DeferredWritesMiddleware
+from .base import QueryCountTestCase
+
+
+class GradeTests(QueryCountTestCase):
+
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root))
+
+    def test_grade_update_checks_if_match(self):
+        grade = Grade.objects.get(student=self.student, course__code='T0000')
+        url = reverse('grade-update', args=[grade.pk])
+        put = lambda version: self.client.put(url, {'grade': 'B'}, content_type='application/json',
+                                              HTTP_IF_MATCH=f'"{version}"', **self.headers['faculty'])
+
+        response = put(grade.version)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['ETag'], f'"{grade.version + 1}"')
+        self.assertEqual(response.json()['data']['version'], grade.version + 1)
+
+        stale = put(grade.version)
+        self.assertEqual(stale.status_code, 412)
+        self.assertEqual(Grade.objects.get(pk=grade.pk).version, grade.version + 1)
+
+    def test_bulk_grade_retry_replays_the_first_response(self):
+        url = reverse('grade-bulk-create')
+        grade = Grade.objects.get(student=self.student, course__code='T0000')
+        # A real change, so the first request bumps the version once.
+        body = {'course_code': 'T0000', 'grades': [{'student_id': 'STU001', 'grade': 'D' if grade.grade != 'D' else 'A'}]}
+        post = lambda body: self.client.post(url, body, content_type='application/json',
+                                             HTTP_IDEMPOTENCY_KEY='retry-1', **self.headers['faculty'])
+        version = grade.version
+
+        first = post(body)
+        with CaptureQueriesContext(connection) as ctx:
+            retry = post(body)
+        self.assertEqual((first.status_code, retry.status_code), (201, 201))
+        self.assertEqual(retry.json(), first.json())
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertFalse([q for q in ctx.captured_queries if 'academic_grade' in q['sql']])
+        self.assertEqual(Grade.objects.get(student=self.student, course__code='T0000').version, version + 1)
+
+        self.assertEqual(post({**body, 'grades': []}).status_code, 422)
+
+    def test_resubmitting_an_unchanged_grade_keeps_its_version(self):
+        course = Course.objects.get(code='T0000')
+        grade = Grade.objects.get(student=self.student, course=course)
+        other = Grade.objects.get(student__student_id='S00000', course=course)
+        letter = 'F' if other.grade != 'F' else 'A'
+        response = self.client.post(reverse('grade-bulk-create'), {
+            'course_code': course.code,
+            'grades': [{'student_id': 'STU001', 'grade': grade.grade}, {'student_id': 'S00000', 'grade': letter}],
+        }, content_type='application/json', **self.headers['faculty'])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Grade.objects.get(pk=grade.pk).version, grade.version)
+        self.assertEqual(Grade.objects.get(pk=other.pk).version, other.version + 1)
+
+    def test_grade_changes_are_audited_after_the_response(self):
+        course = Course.objects.get(code='T0000')
+        grade = Grade.objects.get(student=self.student, course=course)
+        unchanged = Grade.objects.get(student__student_id='S00000', course=course)
+        GradeAuditLog.objects.all().delete()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.put(reverse('grade-update', args=[grade.pk]), {'grade': 'F'},
+                            content_type='application/json', **self.headers['faculty'])
+            self.client.post(reverse('grade-bulk-create'), {
+                'course_code': course.code,
+                'grades': [{'student_id': 'STU001', 'grade': 'A'}, {'student_id': 'S00000', 'grade': unchanged.grade}],
+            }, content_type='application/json', **self.headers['faculty'])
+            self.assertFalse(GradeAuditLog.objects.exists())
+
+        changes = list(GradeAuditLog.objects.filter(grade=grade).order_by('pk').values_list(
+            'old_grade', 'new_grade', 'source', 'changed_by__faculty_id'))
+        self.assertEqual(changes, [
+            (grade.grade, 'F', 'update', 'FAC001'),
+            ('F', 'A', 'bulk', 'FAC001'),
+        ])
+        # Resubmitting S00000's current grade is not a change.
+        self.assertFalse(GradeAuditLog.objects.filter(grade=unchanged).exists())
+
+    def test_failed_audit_writes_are_retried_then_counted(self):
+        grade = Grade.objects.get(student=self.student, course__code='T0000')
+        GradeAuditLog.objects.all().delete()
+        metrics.registry.reset()
+        bulk_create = GradeAuditLog.objects.bulk_create
+        put = lambda letter: self.client.put(reverse('grade-update', args=[grade.pk]), {'grade': letter},
+                                             content_type='application/json', **self.headers['faculty'])
+
+        # A transient failure: the next attempt writes the row.
+        attempts = []
+
+        def flaky(objs, **kwargs):
+            attempts.append(len(objs))
+            if len(attempts) == 1:
+                raise DatabaseError('database is locked')
+            return bulk_create(objs, **kwargs)
+
+        with mock.patch.object(GradeAuditLog.objects, 'bulk_create', side_effect=flaky), \
+                self.assertLogs('config.deferred', 'WARNING'), self.captureOnCommitCallbacks(execute=True):
+            put('F')
+        self.assertEqual(attempts, [1, 1])
+        self.assertEqual(GradeAuditLog.objects.filter(grade=grade).count(), 1)
+
+        with mock.patch.object(GradeAuditLog.objects, 'bulk_create', side_effect=DatabaseError('gone')), \
+                self.assertLogs('config.deferred', 'ERROR'), self.captureOnCommitCallbacks(execute=True):
+            put('A')
+        self.assertEqual(GradeAuditLog.objects.filter(grade=grade).count(), 1)
+        self.assertIn('ums_deferred_rows_failed_total{model="GradeAuditLog"} 1',
+                      metrics.registry.render_prometheus())
+
+    async def test_async_requests_write_audit_rows_when_the_response_closes(self):
+        written = []
+
+        async def view(request):
+            # The view's sync code runs on an executor thread, as the async ORM's does.
+            await sync_to_async(deferred.defer_create)([GradeAuditLog(source='update')])
+            return HttpResponse()
+
+        with mock.patch.object(deferred, '_write', lambda model, objs: written.append(len(objs))), \
+                mock.patch.object(transaction, 'on_commit', lambda callback: callback()):
+            response = await DeferredWritesMiddleware(view)(AsyncRequestFactory().get('/'))
+            self.assertEqual(written, [])
+            await sync_to_async(response.close)()
+            self.assertEqual(written, [1])
+            # Outside a request: written at commit.
+            deferred.defer_create([GradeAuditLog(source='update')])
+            self.assertEqual(written, [1, 1])
+
+    def test_grade_import_applies_valid_rows_and_reports_the_rest(self):
+        course = Course.objects.get(code='T0000')
+        sheet = SimpleUploadedFile('grades.csv', (
+            'Grade,Student_ID\nA-,STU001\nZ,S00000\nB,S00001\n\nC,S00000\n'
+        ).encode())
+        response = self.client.post(reverse('grade-import'), {'course_code': course.code, 'file': sheet},
+                                    **self.headers['faculty'])
+        self.assertEqual(response.status_code, 201)
+        body = response.json()['data']
+        self.assertEqual((body['imported'], body['rejected']), (2, 2))
+        self.assertEqual(Grade.objects.get(student=self.student, course=course).grade, 'A-')
+        self.assertEqual(Grade.objects.get(student__student_id='S00000', course=course).grade, 'C')
+
+        errors = self.client.get(urlsplit(body['error_file']).path, **self.headers['faculty'])
+        rows = list(csv.reader(b''.join(errors.streaming_content).decode().splitlines()))
+        self.assertEqual([row[0] for row in rows], ['row', '3', '4'])
+
+        response = self.client.post(reverse('grade-import'), {
+            'course_code': course.code, 'file': SimpleUploadedFile('grades.txt', b'x'),
+        }, **self.headers['faculty'])
+        self.assertEqual(response.status_code, 400)
+
+    @skipUnless(openpyxl, 'XLSX import needs openpyxl')
+    def test_grade_import_reads_xlsx(self):
+        course = Course.objects.get(code='T0000')
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        for row in [('Name', 'GRADE', 'student_id'), ('Ayesha', 'b+', 'STU001'), (None, None, None),
+                    ('', 3.5, 'S00000'), ('', 'A', None)]:
+            sheet.append(row)
+        content = io.BytesIO()
+        workbook.save(content)
+        upload = SimpleUploadedFile('grades.xlsx', content.getvalue())
+
+        response = self.client.post(reverse('grade-import'), {'course_code': course.code, 'file': upload},
+                                    **self.headers['faculty'])
+        self.assertEqual(response.status_code, 201)
+        body = response.json()['data']
+        self.assertEqual((body['imported'], body['rejected']), (1, 2))
+        self.assertEqual(Grade.objects.get(student=self.student, course=course).grade, 'B+')
+
+        errors = self.client.get(urlsplit(body['error_file']).path, **self.headers['faculty'])
+        rows = list(csv.reader(b''.join(errors.streaming_content).decode().splitlines()))
+        self.assertEqual([row[:3] for row in rows[1:]], [['4', 'S00000', '3.5'], ['5', '', 'A']])
+
+    @override_settings(GRADE_IMPORT_CHUNK_SIZE=1)
+    def test_grade_import_commits_each_chunk(self):
+        course = Course.objects.get(code='T0000')
+        Grade.objects.filter(course=course).update(grade='F', gpa=0)
+        sheet = SimpleUploadedFile('grades.csv', b'student_id,grade\nSTU001,A\nS00000,A\n')
+        upsert_grades = grade_import.upsert_grades
+        calls = []
+
+        def fail_second(*args):
+            calls.append(args)
+            if len(calls) == 2:
+                raise DatabaseError('database is locked')
+            return upsert_grades(*args)
+
+        with mock.patch.object(grade_import, 'upsert_grades', side_effect=fail_second), \
+                self.assertRaises(DatabaseError):
+            grade_import.import_grades(sheet, course, self.faculty)
+        self.assertEqual(Grade.objects.get(student=self.student, course=course).grade, 'A')
+        self.assertEqual(Grade.objects.get(student__student_id='S00000', course=course).grade, 'F')
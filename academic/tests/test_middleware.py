@@ -0,0 +1,96 @@
+import gzip
+import os
+from types import SimpleNamespace
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from config.middleware import CompressionMiddleware, strip_encoding_suffix
+
+BODY = b'{"data": [' + b', '.join(b'{"id": %d, "name": "Course"}' % i for i in range(100)) + b']}'
+
+
+@override_settings(COMPRESSION_ENCODINGS=['gzip'], COMPRESSION_MIN_SIZE=1024)
+class CompressionMiddlewareTests(SimpleTestCase):
+
+    def compress(self, response, accept_encoding='gzip'):
+        middleware = CompressionMiddleware(lambda request: response)
+        return middleware(RequestFactory().get('/', HTTP_ACCEPT_ENCODING=accept_encoding))
+
+    def test_negotiation_follows_server_order_q_values_and_wildcard(self):
+        middleware = CompressionMiddleware(lambda request: None)
+        middleware.codecs = [SimpleNamespace(name=name) for name in ('br', 'zstd', 'gzip')]
+        cases = {
+            '': None,
+            'identity': None,
+            'gzip': 'gzip',
+            'GZIP;q=0.8': 'gzip',
+            'gzip, br': 'br',
+            'gzip;q=1, br;q=0.1': 'br',
+            'br;q=0, gzip': 'gzip',
+            'gzip;q=oops': None,
+            '*': 'br',
+            'br;q=0, *': 'zstd',
+            '*;q=0, gzip': 'gzip',
+            '*;q=0': None,
+        }
+        for header, expected in cases.items():
+            with self.subTest(header):
+                codec = middleware.choose_codec(RequestFactory().get('/', HTTP_ACCEPT_ENCODING=header))
+                self.assertEqual(codec and codec.name, expected)
+
+    def test_compresses_and_tags_the_etag(self):
+        response = HttpResponse(BODY, content_type='application/json')
+        response['ETag'] = '"abc"'
+        response = self.compress(response)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), BODY)
+        self.assertEqual(response['Content-Length'], str(len(response.content)))
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(response['ETag'], '"abc-gzip"')
+        self.assertEqual(strip_encoding_suffix(response['ETag']), '"abc"')
+        self.assertEqual(strip_encoding_suffix('"abc"'), '"abc"')
+
+        # Weak ETags already allow a different encoding.
+        response = HttpResponse(BODY, content_type='application/json')
+        response['ETag'] = 'W/"abc"'
+        self.assertEqual(self.compress(response)['ETag'], 'W/"abc"')
+
+    def test_leaves_small_excluded_and_encoded_responses_alone(self):
+        cases = {
+            'below the threshold': HttpResponse(BODY[:1023], content_type='application/json'),
+            'HTML (BREACH)': HttpResponse(BODY, content_type='text/html; charset=utf-8'),
+            'already compressed media': HttpResponse(BODY, content_type='image/png'),
+            'incompressible': HttpResponse(os.urandom(4096), content_type='application/octet-stream'),
+            'not accepted': HttpResponse(BODY, content_type='application/json'),
+        }
+        encoded = HttpResponse(gzip.compress(BODY), content_type='application/json')
+        encoded['Content-Encoding'] = 'gzip'
+        cases['already encoded'] = encoded
+        for label, response in cases.items():
+            with self.subTest(label):
+                content = response.content
+                accept = 'identity' if label == 'not accepted' else 'gzip'
+                response = self.compress(response, accept)
+                self.assertEqual(response.content, content)
+                self.assertEqual(response.get('Content-Encoding'), 'gzip' if label == 'already encoded' else None)
+        self.assertEqual(self.compress(HttpResponse(BODY[:1024], content_type='application/json'))
+                         ['Content-Encoding'], 'gzip')
+
+    def test_streaming_responses_are_compressed_chunk_by_chunk(self):
+        chunks = [BODY[i:i + 100] for i in range(0, len(BODY), 100)]
+        response = StreamingHttpResponse(iter(chunks), content_type='text/csv')
+        response['Content-Length'] = str(len(BODY))
+        response = self.compress(response)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertFalse(response.has_header('Content-Length'))
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), BODY)
+
+    async def test_async_streaming_responses_are_compressed(self):
+        async def chunks():
+            for i in range(0, len(BODY), 100):
+                yield BODY[i:i + 100]
+
+        response = self.compress(StreamingHttpResponse(chunks(), content_type='text/csv'))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(b''.join([chunk async for chunk in response.streaming_content])), BODY)
@@ -0,0 +1,90 @@
+import contextlib
+import gzip
+import io
+import os
+import shutil
+import sqlite3
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+
+from config import schema
+from config.snapshots import SnapshotError, restore_snapshot, save_snapshot
+from users.models import User
+from .base import QueryCountTestCase
+
+
+class SnapshotTests(TransactionTestCase):
+
+    def test_save_writes_a_compressed_copy(self):
+        User.objects.create(username='snap', email='snap@test.edu', role='student')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'db.sqlite3.gz')
+            save_snapshot(path)
+            copy_path = os.path.join(tmp, 'copy.sqlite3')
+            with gzip.open(path) as src, open(copy_path, 'wb') as dst:
+                dst.write(src.read())
+            copy = sqlite3.connect(copy_path)
+            emails = [row[0] for row in copy.execute('SELECT email FROM users_user')]
+            copy.close()
+        self.assertIn('snap@test.edu', emails)
+
+    def test_restore_round_trips(self):
+        User.objects.create(username='snap', email='snap@test.edu', role='student')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'db.sqlite3.gz')
+            save_snapshot(path)
+            User.objects.all().delete()
+            restore_snapshot(path)
+        self.assertTrue(User.objects.filter(email='snap@test.edu').exists())
+
+    def test_refuses_inside_a_transaction(self):
+        with transaction.atomic(), self.assertRaises(SnapshotError):
+            save_snapshot(os.path.join(tempfile.gettempdir(), 'never-written.sqlite3'))
+
+
+class SchemaCacheTests(TestCase):
+
+    def setUp(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        self.enterContext(override_settings(SCHEMA_CACHE_DIR=Path(cache_dir)))
+        self.enterContext(mock.patch.dict(schema._schema_artifacts, clear=True))
+
+    def test_cached_schema_files_are_replaced_whole(self):
+        fingerprint = schema.schema_fingerprint()
+        with contextlib.redirect_stderr(io.StringIO()):  # drf-spectacular's warnings about the APIViews
+            artifacts = schema.get_schema_artifacts()
+        files = sorted(path.name for path in settings.SCHEMA_CACHE_DIR.iterdir())
+        self.assertEqual(files, [f'openapi-{fingerprint}.json', f'openapi-{fingerprint}.yaml'])
+        self.assertEqual(schema.read_schema_artifacts(fingerprint), artifacts)
+
+        # Stale files go; one another worker already removed is skipped.
+        (settings.SCHEMA_CACHE_DIR / 'openapi-old.json').write_bytes(b'{}')
+        schema.write_schema_artifacts(fingerprint, artifacts)
+        gone = settings.SCHEMA_CACHE_DIR / 'openapi-gone.json'
+        with mock.patch.object(Path, 'glob', return_value=[gone]):
+            schema.write_schema_artifacts(fingerprint, artifacts)
+        self.assertEqual(sorted(path.name for path in settings.SCHEMA_CACHE_DIR.iterdir()), files)
+
+        response = self.client.get(reverse('schema') + '?format=json')
+        self.assertEqual(response.content, artifacts['json'][0])
+        self.assertIn('filename=', response['Content-Disposition'])
+
+
+class OpsMetricsTests(QueryCountTestCase):
+
+    def test_metrics_need_the_token_or_an_admin(self):
+        url = reverse('ops-metrics')
+        self.assertEqual(self.client.get(url).status_code, 401)
+        self.assertEqual(self.client.get(url, **self.headers['student']).status_code, 403)
+        self.assertEqual(self.client.get(url, **self.headers['admin']).status_code, 200)
+        with override_settings(OPS_METRICS_TOKEN='scrape-me'):
+            self.assertEqual(self.client.get(url, HTTP_X_OPS_TOKEN='scrape-me').status_code, 200)
+            self.assertEqual(self.client.get(url, HTTP_X_OPS_TOKEN='guess').status_code, 401)
+        self.assertEqual(self.client.get(url, HTTP_X_OPS_TOKEN='').status_code, 401)
@@ -0,0 +1,47 @@
+from django.urls import reverse
+from django.utils import timezone
+
+from academic.models import Grade, GradeAuditLog
+from .base import N, QueryCountTestCase, seed
+
+
+class CursorPaginationTests(QueryCountTestCase):
+
+    def test_cursor_pages_match_page_numbers(self):
+        seed(9 * N, N, self.faculty, self.student)
+        url = reverse('academic-records') + '?page_size=4'
+
+        def walk(url, link):
+            rows, pages = [], []
+            while url:
+                body = self.client.get(url, **self.headers['admin']).json()
+                rows += body['data']
+                pages.append(body)
+                url = body['pagination'][link]
+            return rows, pages
+
+        by_number, _ = walk(url + '&page=1', 'next')
+        by_cursor, pages = walk(url + '&cursor=', 'next')
+        self.assertEqual(by_cursor, by_number)
+        self.assertIsNone(pages[0]['pagination']['count'])
+
+        # Walking back from the last page visits the same rows in reverse page order.
+        _, backwards = walk(pages[-1]['pagination']['previous'], 'previous')
+        self.assertEqual([body['data'] for body in reversed(backwards)], [body['data'] for body in pages[:-1]])
+
+    def test_cursor_keeps_rows_that_share_a_timestamp(self):
+        # Bulk grading writes every audit row with one `now`.
+        now = timezone.now().replace(microsecond=123456)
+        grades = list(Grade.objects.all()[:20])
+        GradeAuditLog.objects.bulk_create([
+            GradeAuditLog(grade=g, student=g.student, course=g.course, new_grade=g.grade,
+                          changed_by=self.faculty, source='bulk', changed_at=now)
+            for g in grades
+        ])
+        url = reverse('grade-audit-log') + '?page_size=5&cursor='
+        ids = []
+        while url:
+            body = self.client.get(url, **self.headers['admin']).json()
+            ids += [row['id'] for row in body['data']]
+            url = body['pagination']['next']
+        self.assertEqual(sorted(ids), sorted(GradeAuditLog.objects.values_list('pk', flat=True)))
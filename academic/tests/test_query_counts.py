@@ -0,0 +1,128 @@
+"""
+Query-count regression tests.
+
+Every route is called as each role against a small data set and again after
+the data has grown tenfold. The number of SQL queries (and the status code)
+must not change: a per-row query shows up as a difference between the two
+runs. Requests also run with QUERY_BUDGET_ACTION='raise', so going over a
+view's QUERY_BUDGETS entry fails the test as well.
+"""
+import shutil
+import tempfile
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse
+
+from academic import urls as academic_urls
+from academic.grade_import import error_file_name
+from academic.models import Course, Enrollment, FacultyCourseAssignment, Grade
+from academic.schedule import feed_token
+from academic.serializers import (
+    CourseSerializer, EnrollmentSerializer, FacultyCourseAssignmentSerializer, GradeSerializer,
+)
+from users.models import Faculty, Student
+from .base import DASHBOARD_ROUTES, N, ROLES, QueryCountTestCase, seed
+
+
+class AcademicQueryCountTests(QueryCountTestCase):
+
+    def setUp(self):
+        super().setUp()
+        # Feed tokens embed a timestamp; sign them once so both runs use the same URL.
+        self.feed_urls = [
+            reverse('schedule-feed', args=[feed_token(user)])
+            for user in (self.student.user, self.faculty.user)
+        ]
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root))
+        default_storage.save(error_file_name(self.faculty, 'seeded.csv'), ContentFile(b'row,error\n'))
+
+    def grade_sheet(self, course):
+        """Every student in the database; those not enrolled in `course` are rejected."""
+        lines = ['student_id,name,grade'] + [
+            f'{student_id},,B+' for student_id in Student.objects.values_list('student_id', flat=True)
+        ]
+        return SimpleUploadedFile('grades.csv', '\n'.join(lines).encode(), content_type='text/csv')
+
+    def endpoint_calls(self):
+        course = Course.objects.get(code='T0000')
+        enrollment = Enrollment.objects.get(student=self.student, course=course)
+        grade = Grade.objects.get(student=self.student, course=course)
+        other_faculty = Faculty.objects.get(faculty_id='F00001')
+        new_course = {
+            'code': 'NEW101', 'name': 'New Course', 'department': 'CSE', 'credits': 3,
+            'semester': 'Fall 2025', 'days': ['Tue'], 'start_time': '10:00',
+            'end_time': '11:00', 'room': '101', 'building': 'Main',
+        }
+        bulk_grades = {
+            'course_code': course.code,
+            'grades': [{'student_id': sid, 'grade': 'A'} for sid in ('STU001', 'S00000')],
+        }
+        page = '?page_size=100'
+        return [
+            *self.reads(reverse('course-list-create') + page, *ROLES),
+            *self.reads(reverse('course-list-create') + '?faculty=current&page_size=100', *ROLES),
+            *self.reads(reverse('course-detail', args=[course.pk]), *ROLES),
+            *self.reads(reverse('assignment-list-create'), 'admin'),
+            *self.reads(reverse('enrollment-list-create'), *ROLES),
+            *self.reads(reverse('enrollment-list-create') + '?faculty=current', *ROLES),
+            *self.reads(reverse('grade-list'), *ROLES),
+            *self.reads(reverse('academic-records') + page, 'admin'),
+            *self.reads(reverse('academic-records') + '?cursor=&page_size=2', 'admin'),
+            *self.reads(reverse('grade-audit-log') + f'?grade={grade.pk}', 'admin'),
+            *self.reads(reverse('grade-audit-log') + '?faculty=FAC001&page_size=100', 'admin'),
+            *self.reads(reverse('schedule-today'), *ROLES),
+            *self.reads(reverse('schedule-week'), *ROLES),
+            *self.reads(reverse('schedule-feed-link'), *ROLES),
+            *self.reads(reverse('academic-history'), 'student'),
+            *self.reads(reverse('academic-history-summary'), 'student'),
+            *self.reads(reverse('transcript'), 'student'),
+            *self.reads(reverse('admin-dashboard-stats'), 'admin'),
+            *self.reads(reverse('faculty-dashboard-stats'), 'faculty'),
+            *self.reads(reverse('student-dashboard-stats'), 'student'),
+            *[call for role in ROLES for call in self.reads(reverse(f'{role}-dashboard-bootstrap'), role)],
+            *[(None, 'GET', url, None, 200) for url in self.feed_urls],
+            ('admin', 'POST', reverse('course-list-create'), new_course, 201),
+            ('admin', 'PUT', reverse('course-detail', args=[course.pk]), {**new_course, 'code': course.code}, 200),
+            ('admin', 'DELETE', reverse('course-detail', args=[course.pk]), None, 200),
+            ('admin', 'POST', reverse('assignment-list-create'),
+             {'faculty_id': other_faculty.faculty_id, 'course_id': course.pk}, 201),
+            ('admin', 'POST', reverse('enrollment-list-create'),
+             {'student_id': 'S00001', 'course_code': course.code}, 201),
+            ('admin', 'DELETE', reverse('enrollment-delete', args=[enrollment.pk]), None, 200),
+            ('admin', 'POST', reverse('enrollment-status-transition'),
+             {'status': 'Completed', 'from_status': ['Active'], 'semester': 'Fall 2025'}, 200),
+            ('faculty', 'POST', reverse('enrollment-status-transition'),
+             {'status': 'Completed', 'semester': 'Fall 2025'}, 403),
+            ('faculty', 'POST', reverse('grade-bulk-create'), bulk_grades, 201),
+            ('faculty', 'PUT', reverse('grade-update', args=[grade.pk]), {'grade': 'B'}, 200),
+            ('faculty', 'POST', reverse('grade-import'),
+             {'course_code': course.code, 'file': self.grade_sheet(course)}, 201),
+            *self.reads(reverse('grade-import-errors', args=['seeded.csv']), 'faculty'),
+        ]
+
+    def test_query_counts_do_not_grow_with_data(self):
+        self.assertQueriesConstant()
+
+    def test_prefetch_profiles_load_what_the_serializer_reads(self):
+        seed(9 * N, N, self.faculty, self.student)
+        profiles = [
+            (Course.objects.for_listing(), CourseSerializer, 1),
+            (FacultyCourseAssignment.objects.for_listing(), FacultyCourseAssignmentSerializer, 1),
+            (Enrollment.objects.for_listing(), EnrollmentSerializer, 2),  # + instructors
+            (Grade.objects.for_listing(), GradeSerializer, 1),
+        ]
+        for queryset, serializer_class, queries in profiles:
+            with self.subTest(serializer_class.__name__), self.assertNumQueries(queries):
+                self.assertTrue(serializer_class(queryset, many=True).data)
+        with self.assertNumQueries(1):
+            semesters = [grade.course.semester for grade in Grade.objects.for_transcript()]
+        self.assertEqual(semesters, sorted(semesters))
+
+    def test_every_route_is_checked(self):
+        names = [pattern.name for pattern in academic_urls.urlpatterns]
+        self.assertRoutesCovered(names + list(DASHBOARD_ROUTES))
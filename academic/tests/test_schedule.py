@@ -0,0 +1,147 @@
+import datetime
+from importlib import import_module
+
+from django.apps import apps
+from django.urls import reverse
+
+from academic.models import Course, CourseMeeting, Enrollment, FacultyCourseAssignment
+from academic.schedule import feed_token, meetings_for, render_ical
+from .base import N, QueryCountTestCase, seed
+
+
+class ScheduleTests(QueryCountTestCase):
+
+    def add_course(self, **fields):
+        """A Tue/Thu course taught by the demo faculty and taken by the demo student."""
+        course = Course.objects.create(**{
+            'code': 'ICS101', 'name': 'Networks', 'department': 'CSE', 'credits': 3,
+            'semester': 'Fall 2025', 'days': ['Tue', 'Thu'], 'start_time': datetime.time(10, 30),
+            'end_time': datetime.time(12), 'room': '5', 'building': 'Main', **fields,
+        })
+        FacultyCourseAssignment.objects.create(faculty=self.faculty, course=course)
+        Enrollment.objects.create(student=self.student, course=course)
+        return course
+
+    def test_week_lists_each_meeting_under_its_days(self):
+        self.add_course()
+        get = lambda role: self.client.get(reverse('schedule-week'), **self.headers[role]).json()['data']
+        week = get('student')
+        self.assertEqual(list(week), CourseMeeting.WEEKDAYS)
+        entry = {
+            'courseCode': 'ICS101', 'courseName': 'Networks', 'startTime': '10:30', 'endTime': '12:00',
+            'days': ['Tue', 'Thu'], 'room': '5', 'building': 'Main', 'type': 'Lecture',
+            'status': 'Scheduled', 'instructor': 'Fahim Rahman',
+        }
+        for day, items in week.items():
+            with self.subTest(day):
+                self.assertEqual(items.count(entry), day in ('Tue', 'Thu'))
+        # Every seeded course meets Mon/Wed; each day is sorted by start time.
+        self.assertEqual(len(week['Mon']), N)
+        self.assertEqual(week['Mon'], sorted(week['Mon'], key=lambda item: item['startTime']))
+        self.assertEqual(get('faculty'), week)
+        self.assertEqual(get('admin'), {day: [] for day in CourseMeeting.WEEKDAYS})
+
+    def test_ical_events_recur_weekly_in_floating_time(self):
+        name = 'Networks, Security; and Systems\\Labs ' + 'x' * 40 + ' নেটওয়ার্ক'
+        course = self.add_course(name=name, room='5; B')
+        # A Thursday: each event starts on its weekday of that week.
+        content = render_ical(self.student.user, meetings_for([course.pk], range(7)).order_by('weekday'),
+                              datetime.date(2025, 9, 4)).decode()
+
+        self.assertTrue(content.endswith('\r\n'))
+        lines = content.split('\r\n')[:-1]
+        self.assertTrue(all(len(line.encode()) <= 75 for line in lines))
+        self.assertTrue(any(line.startswith(' ') for line in lines))
+        unfolded = content.replace('\r\n ', '').split('\r\n')[:-1]
+        self.assertEqual(unfolded[0], 'BEGIN:VCALENDAR')
+        self.assertEqual(unfolded[-1], 'END:VCALENDAR')
+        self.assertFalse([line for line in unfolded if 'TZID' in line or 'TIMEZONE' in line])
+
+        start = unfolded.index(f'UID:course-{course.pk}-TU@ums')
+        self.assertEqual(unfolded[start - 1:start + 10], [
+            'BEGIN:VEVENT',
+            f'UID:course-{course.pk}-TU@ums',
+            'DTSTAMP:20250904T000000Z',
+            'DTSTART:20250902T103000',
+            'DTEND:20250902T120000',
+            'RRULE:FREQ=WEEKLY;BYDAY=TU',
+            'SUMMARY:ICS101 - Networks\\, Security\\; and Systems\\\\Labs ' + 'x' * 40 + ' নেটওয়ার্ক',
+            'LOCATION:5\\; B\\, Main',
+            'DESCRIPTION:Fall 2025\\nInstructor: Fahim Rahman',
+            'END:VEVENT',
+            'BEGIN:VEVENT',
+        ])
+        self.assertIn('DTSTART:20250904T103000', unfolded)
+        self.assertIn('RRULE:FREQ=WEEKLY;BYDAY=TH', unfolded)
+
+    def test_ical_feed_serves_the_rendered_calendar(self):
+        course = self.add_course()
+        response = self.client.get(reverse('schedule-feed', args=[feed_token(self.student.user)]))
+        self.assertEqual(response['Content-Type'], 'text/calendar; charset=utf-8')
+        lines = response.content.decode().split('\r\n')
+        self.assertIn(f'UID:course-{course.pk}-TH@ums', lines)
+        # The seeded courses' Mon/Wed meetings plus this one's Tue/Thu.
+        self.assertEqual(lines.count('BEGIN:VEVENT'), 2 * N + 2)
+        bad = self.client.get(reverse('schedule-feed', args=['not-a-token']))
+        self.assertEqual(bad.status_code, 404)
+
+    def test_compressed_feed_etag_revalidates(self):
+        seed(9 * N, N, self.faculty, self.student)
+        url = reverse('schedule-feed', args=[feed_token(self.student.user)])
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertTrue(response['ETag'].endswith('-gzip"'))
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH='"other", ' + response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH='"other"')
+        self.assertEqual(response.status_code, 200)
+
+    def meetings(self, course):
+        return list(CourseMeeting.objects.filter(course=course).order_by('weekday').values_list(
+            'weekday', 'start_time', 'end_time', 'room', 'building'))
+
+    def test_meetings_follow_the_course_schedule(self):
+        course = self.add_course()
+        self.assertEqual(self.meetings(course), [
+            (1, datetime.time(10, 30), datetime.time(12), '5', 'Main'),
+            (3, datetime.time(10, 30), datetime.time(12), '5', 'Main'),
+        ])
+
+        # Repeated and unknown day names are skipped, as in the 0003 backfill.
+        course.days = ['Fri', 'Mon', 'Fri', 'Funday']
+        course.start_time, course.end_time = datetime.time(14), datetime.time(15, 15)
+        course.room, course.building = '301', 'Science'
+        course.save()
+        self.assertEqual(self.meetings(course), [
+            (0, datetime.time(14), datetime.time(15, 15), '301', 'Science'),
+            (4, datetime.time(14), datetime.time(15, 15), '301', 'Science'),
+        ])
+        week = self.client.get(reverse('schedule-week'), **self.headers['student']).json()['data']
+        self.assertEqual([item['startTime'] for item in week['Fri']], ['14:00'])
+        self.assertEqual(week['Tue'], [])
+
+        # Saving other fields keeps the rows; clearing the days removes them.
+        ids = set(CourseMeeting.objects.filter(course=course).values_list('pk', flat=True))
+        course.name = 'Renamed'
+        course.save(update_fields=['name'])
+        self.assertEqual(set(CourseMeeting.objects.filter(course=course).values_list('pk', flat=True)), ids)
+        course.days = []
+        course.save(update_fields=['days'])
+        self.assertEqual(self.meetings(course), [])
+
+    def test_backfill_migration_parses_course_days(self):
+        backfill = import_module('academic.migrations.0003_coursemeeting').backfill_meetings
+        courses = [
+            self.add_course(),
+            self.add_course(code='ICS102', days=['Sun', 'sun', 'Sun', 'Sat'], start_time=None, end_time=None),
+            self.add_course(code='ICS103', days=[]),
+        ]
+        expected = [self.meetings(course) for course in Course.objects.order_by('pk')]
+        CourseMeeting.objects.all().delete()
+        backfill(apps, None)
+        self.assertEqual([self.meetings(course) for course in Course.objects.order_by('pk')], expected)
+        self.assertEqual(self.meetings(courses[1]), [(5, None, None, '5', 'Main'), (6, None, None, '5', 'Main')])
+        self.assertEqual(self.meetings(courses[2]), [])
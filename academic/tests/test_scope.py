@@ -0,0 +1,63 @@
+from unittest import mock
+
+from django.urls import reverse
+
+from academic.models import Course, Enrollment, FacultyCourseAssignment, Grade
+from academic.scope import access_scope
+from users.models import User
+from .base import QueryCountTestCase
+
+
+class AccessScopeTests(QueryCountTestCase):
+
+    def test_access_scope_is_memoized_cached_and_invalidated(self):
+        load = lambda user: User.objects.select_related('faculty_profile', 'student_profile').get(pk=user.pk)
+        faculty_user, student_user = load(self.faculty.user), load(self.student.user)
+        with self.assertNumQueries(1):
+            ids = access_scope(faculty_user).assigned_course_ids
+            self.assertIs(access_scope(faculty_user).assigned_course_ids, ids)
+        # The next request's user object starts a new scope that reads the cache.
+        next_request_user = load(self.faculty.user)
+        with self.assertNumQueries(0):
+            self.assertEqual(access_scope(next_request_user).assigned_course_ids, ids)
+
+        course = Course.objects.create(code='NEW101', name='New', department='CSE', credits=3)
+        FacultyCourseAssignment.objects.create(faculty=self.faculty, course=course)
+        self.assertEqual(access_scope(load(self.faculty.user)).assigned_course_ids, ids | {course.pk})
+
+        enrolled = access_scope(student_user).enrolled_course_ids
+        enrollment = Enrollment.objects.filter(student=self.student).first()
+        enrollment.status = 'Dropped'
+        enrollment.save()
+        self.assertEqual(access_scope(load(self.student.user)).enrolled_course_ids,
+                         enrolled - {enrollment.course_id})
+
+    def test_teaches_ignores_a_stale_cached_scope(self):
+        load = lambda user: User.objects.select_related('faculty_profile').get(pk=user.pk)
+        course = Course.objects.get(code='T0000')
+        self.assertIn(course.pk, access_scope(load(self.faculty.user)).assigned_course_ids)
+        # Removed through another worker: this worker's cached set isn't bumped.
+        with mock.patch('academic.models.bump_version'):
+            FacultyCourseAssignment.objects.filter(faculty=self.faculty, course=course).delete()
+        scope = access_scope(load(self.faculty.user))
+        self.assertIn(course.pk, scope.assigned_course_ids)
+        self.assertFalse(scope.teaches(course))
+
+        response = self.client.post(reverse('grade-bulk-create'), {
+            'course_code': course.code, 'grades': [{'student_id': self.student.student_id, 'grade': 'A'}],
+        }, content_type='application/json', **self.headers['faculty'])
+        self.assertEqual(response.status_code, 403)
+
+    def test_visible_to_scopes_rows_by_role(self):
+        grades, enrollments = Grade.objects.all(), Enrollment.objects.all()
+        self.assertEqual(Grade.objects.visible_to(self.admin).count(), grades.count())
+        self.assertEqual(Enrollment.objects.visible_to(self.admin).count(), enrollments.count())
+        self.assertEqual(set(Grade.objects.visible_to(self.faculty.user)),
+                         set(grades.filter(graded_by=self.faculty)))
+        self.assertEqual(set(Grade.objects.visible_to(self.student.user)),
+                         set(grades.filter(student=self.student)))
+        self.assertEqual(set(Enrollment.objects.visible_to(self.student.user)),
+                         set(enrollments.filter(student=self.student)))
+        self.assertEqual(set(Enrollment.objects.taught_by(self.faculty.user)),
+                         set(enrollments.filter(course__assignments__faculty=self.faculty)))
+        self.assertFalse(Course.objects.taught_by(self.student.user).exists())
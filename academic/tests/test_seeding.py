@@ -0,0 +1,64 @@
+import io
+from decimal import Decimal
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+
+from academic.models import Course, CourseMeeting, Enrollment, FacultyCourseAssignment, Grade, recalculate_gpas
+from academic.seeding import DEMO_COURSES, DEMO_FACULTY, DEMO_STUDENTS
+from users.models import Faculty, Student, User
+
+SIZES = ['--students', '30', '--faculty', '4', '--courses', '12']
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class SeedCommandTests(TestCase):
+
+    def seed(self, *args):
+        call_command('seed', *SIZES, *args, stdout=io.StringIO())
+
+    def snapshot(self):
+        return {
+            'users': list(User.objects.order_by('email').values_list('email', 'first_name', 'last_name', 'role')),
+            'students': list(Student.objects.order_by('student_id').values_list(
+                'student_id', 'major', 'year', 'current_gpa')),
+            'courses': list(Course.objects.order_by('code').values_list(
+                'code', 'semester', 'days', 'start_time', 'room', 'credits')),
+            'assignments': sorted(FacultyCourseAssignment.objects.values_list('faculty__faculty_id', 'course__code')),
+            'enrollments': sorted(Enrollment.objects.values_list('student__student_id', 'course__code', 'status')),
+            'grades': sorted(Grade.objects.values_list('student__student_id', 'course__code', 'grade', 'gpa')),
+        }
+
+    def test_same_seed_same_database(self):
+        self.seed('--seed', '7')
+        self.assertEqual(User.objects.count(), 1 + len(DEMO_FACULTY) + 4 + len(DEMO_STUDENTS) + 30)
+        self.assertEqual(Faculty.objects.count(), len(DEMO_FACULTY) + 4)
+        self.assertEqual(Student.objects.count(), len(DEMO_STUDENTS) + 30)
+        self.assertEqual(Course.objects.count(), len(DEMO_COURSES) + 12)
+        self.assertEqual(CourseMeeting.objects.count(), sum(len(days) for days in Course.objects.values_list(
+            'days', flat=True)))
+        self.assertFalse(Course.objects.exclude(assignments__isnull=False).exists())
+        demo_ids = [row[3] for row in DEMO_STUDENTS]
+        self.assertTrue(Grade.objects.exclude(student__student_id__in=demo_ids).exists())
+        first = self.snapshot()
+
+        self.seed('--seed', '7', '--flush')
+        self.assertEqual(self.snapshot(), first)
+        self.seed('--seed', '8', '--flush')
+        self.assertNotEqual(self.snapshot(), first)
+
+    def test_current_gpa_matches_the_grades(self):
+        self.seed('--seed', '3')
+        graded = Student.objects.filter(grades__isnull=False).distinct()
+        seeded = dict(graded.values_list('pk', 'current_gpa'))
+        self.assertGreater(len(seeded), len(DEMO_STUDENTS))
+        recalculate_gpas(list(seeded))
+        self.assertEqual(dict(graded.values_list('pk', 'current_gpa')), seeded)
+        self.assertNotEqual(set(seeded.values()), {Decimal('0.00')})
+
+    def test_refuses_to_seed_over_existing_users(self):
+        self.seed()
+        users = User.objects.count()
+        with self.assertRaisesMessage(CommandError, '--flush'):
+            self.seed()
+        self.assertEqual(User.objects.count(), users)
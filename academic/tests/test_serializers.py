@@ -0,0 +1,39 @@
+"""
+List endpoints render values_list() rows with ValuesSerializer subclasses in
+place of the DRF serializers; both must produce the same JSON for the same rows.
+"""
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+
+from academic.models import Course, Grade
+from academic.serializers import GradeSerializer, GradeValuesSerializer
+from users.models import Student, User
+from .base import QueryCountTestCase
+
+
+class ValuesSerializerParityTests(QueryCountTestCase):
+
+    def assertSameJSON(self, values_data, drf_data):
+        self.assertEqual(JSONRenderer().render(values_data), JSONRenderer().render(drf_data))
+
+    def test_grade_lists_match_grade_serializer(self):
+        # No name, an ungraded-by row and a GPA that isn't a whole number.
+        blank = Student.objects.create(
+            user=User.objects.create(username='blank', email='blank@test.edu', role='student'),
+            student_id='S99999', major='CSE', year='1st',
+        )
+        Grade.objects.create(student=blank, course=Course.objects.get(code='T0000'), grade='B+', graded_by=None)
+
+        lists = [
+            ('grade-list', '', Grade.objects.order_by('course__code', 'student__student_id')),
+            ('academic-records', '?page_size=100', Grade.objects.order_by('student__student_id', 'course__code')),
+        ]
+        for name, query, queryset in lists:
+            with self.subTest(name):
+                drf_data = GradeSerializer(queryset, many=True).data
+                self.assertSameJSON(GradeValuesSerializer(GradeValuesSerializer.project(queryset)).data, drf_data)
+                response = self.client.get(reverse(name) + query, **self.headers['admin'])
+                self.assertSameJSON(response.json()['data'], drf_data)
+
+        row = next(row for row in drf_data if row['student_id'] == 'S99999')
+        self.assertEqual((row['student_name'], row['grade_points']), ('', '3.30'))
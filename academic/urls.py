@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from .views import (
     CourseListCreateView,
@@ -5,16 +6,26 @@ from .views import (
     AssignmentListCreateView,
     EnrollmentListCreateView,
     EnrollmentDeleteView,
+    EnrollmentStatusTransitionView,
     GradeListView,
     BulkGradeCreateView,
+    GradeImportView,
+    GradeImportErrorsView,
     GradeUpdateView,
+    GradeAuditLogView,
     AcademicRecordsView,
     ScheduleTodayView,
+    ScheduleWeekView,
+    ScheduleFeedLinkView,
+    ScheduleFeedView,
     AcademicHistoryView,
     AcademicHistorySummaryView,
     TranscriptView,
 )
 
+if settings.ASYNC_VIEWS:
+    from .async_views import AcademicHistorySummaryView, ScheduleTodayView  # noqa: F811
+
 urlpatterns = [
     # Course Management
     path('courses/', CourseListCreateView.as_view(), name='course-list-create'),
@@ -26,17 +37,24 @@ urlpatterns = [
     # Enrollment
     path('enrollments/', EnrollmentListCreateView.as_view(), name='enrollment-list-create'),
     path('enrollments/<int:pk>/', EnrollmentDeleteView.as_view(), name='enrollment-delete'),
+    path('enrollments/status/', EnrollmentStatusTransitionView.as_view(), name='enrollment-status-transition'),
 
     # Grading
     path('grades/', GradeListView.as_view(), name='grade-list'),
     path('grades/bulk/', BulkGradeCreateView.as_view(), name='grade-bulk-create'),
+    path('grades/import/', GradeImportView.as_view(), name='grade-import'),
+    path('grades/import/errors/<str:name>', GradeImportErrorsView.as_view(), name='grade-import-errors'),
     path('grades/<int:pk>/', GradeUpdateView.as_view(), name='grade-update'),
+    path('grades/audit/', GradeAuditLogView.as_view(), name='grade-audit-log'),
 
     # Academic Records (Admin)
     path('records/', AcademicRecordsView.as_view(), name='academic-records'),
 
     # Schedule Widget
     path('schedules/today/', ScheduleTodayView.as_view(), name='schedule-today'),
+    path('schedules/week/', ScheduleWeekView.as_view(), name='schedule-week'),
+    path('schedules/feed/', ScheduleFeedLinkView.as_view(), name='schedule-feed-link'),
+    path('schedules/feed/<str:token>.ics', ScheduleFeedView.as_view(), name='schedule-feed'),
 
     # Academic History (Student)
     path('history/', AcademicHistoryView.as_view(), name='academic-history'),
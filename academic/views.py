@@ -1,33 +1,70 @@
 import datetime
 from rest_framework import generics, status
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.views import APIView
-from django.db.models import Q, Sum
-from django.http import HttpResponse
-
-from .models import Course, FacultyCourseAssignment, Enrollment, Grade
+from django.db import transaction
+from django.db.models import F, Q, Sum
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified
+from django.urls import reverse
+
+from .models import (
+    Course,
+    FacultyCourseAssignment,
+    Enrollment,
+    Grade,
+    GradeAuditLog,
+    record_grade_changes,
+    recalculate_gpas,
+    upsert_grades,
+)
+from .archive import archive_semester, student_grades
 from .serializers import (
     CourseSerializer,
     FacultyCourseAssignmentSerializer,
     EnrollmentSerializer,
+    EnrollmentTransitionSerializer,
     BulkGradeSerializer,
+    GradeAuditValuesSerializer,
+    GradeImportSerializer,
     GradeSerializer,
+    GradeValuesSerializer,
 )
 from users.models import Student, Faculty
+from .dashboard import (
+    admin_stats,
+    faculty_stats,
+    get_bootstrap,
+    history_rows,
+    history_summary,
+    student_stats,
+)
+from .grade_import import ImportFileError, error_file_name, import_grades
+from .scope import access_scope
+from .schedule import (
+    feed_token,
+    get_ical_feed,
+    get_today_schedule,
+    get_week_schedule,
+    user_from_feed_token,
+)
 from users.permissions import IsAdminUser, IsFacultyUser, IsStudentUser
+from config.fieldsets import SparseFieldsetMixin
+from config.idempotency import idempotent
+from config.middleware import strip_encoding_suffix
+from config.pagination import KeysetPagination
 
 
 # ─── Pagination ────────────────────────────────────────────────────────────
 
-class SmallPagination(PageNumberPagination):
+class SmallPagination(KeysetPagination):
     page_size = 5
     page_size_query_param = 'page_size'
     max_page_size = 100
 
 
-class LargePagination(PageNumberPagination):
+class LargePagination(KeysetPagination):
     page_size = 8
     page_size_query_param = 'page_size'
     max_page_size = 100
@@ -37,9 +74,9 @@ class LargePagination(PageNumberPagination):
 # COURSE MANAGEMENT (Admin CRUD)
 # ═══════════════════════════════════════════════════════════════════════════
 
-class CourseListCreateView(generics.ListCreateAPIView):
+class CourseListCreateView(SparseFieldsetMixin, generics.ListCreateAPIView):
     """
-    GET  /api/academic/courses/?search=&page=&page_size=5&faculty=current
+    GET  /api/academic/courses/?search=&page=&page_size=5&faculty=current&fields=&cursor=
     POST /api/academic/courses/
     """
     serializer_class = CourseSerializer
@@ -65,12 +102,10 @@ class CourseListCreateView(generics.ListCreateAPIView):
 
         # Faculty: only show their assigned courses
         # Faculty jodi login kora thake, tahole shudhu tar course gulo dekhano hobe.
-        if faculty_param == 'current' and hasattr(self.request.user, 'faculty_profile'):
-            assigned_course_ids = FacultyCourseAssignment.objects.filter(
-                faculty=self.request.user.faculty_profile
-            ).values_list('course_id', flat=True)
-            queryset = queryset.filter(id__in=assigned_course_ids)
+        if faculty_param == 'current' and access_scope(self.request.user).faculty is not None:
+            queryset = queryset.taught_by(self.request.user)
 
+        queryset = CourseSerializer.optimize_queryset(queryset, self.get_requested_fields())
         return queryset.order_by('code')
 
 
@@ -102,9 +137,7 @@ class AssignmentListCreateView(generics.ListCreateAPIView):
     permission_classes = [IsAdminUser]
 
     def get_queryset(self):
-        return FacultyCourseAssignment.objects.select_related(
-            'faculty__user', 'course'
-        ).all()
+        return FacultyCourseAssignment.objects.for_listing()
 
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
@@ -116,9 +149,9 @@ class AssignmentListCreateView(generics.ListCreateAPIView):
 # ENROLLMENT (Admin manages, Faculty/Student reads)
 # ═══════════════════════════════════════════════════════════════════════════
 
-class EnrollmentListCreateView(generics.ListCreateAPIView):
+class EnrollmentListCreateView(SparseFieldsetMixin, generics.ListCreateAPIView):
     """
-    GET  /api/academic/enrollments/?search=&student=current&faculty=current&course=
+    GET  /api/academic/enrollments/?search=&student=current&faculty=current&course=&fields=
     POST /api/academic/enrollments/
     """
     serializer_class = EnrollmentSerializer
@@ -129,30 +162,19 @@ class EnrollmentListCreateView(generics.ListCreateAPIView):
         return [IsAuthenticated()]
 
     def get_queryset(self):
-        queryset = Enrollment.objects.select_related(
-            'student__user', 'course'
-        ).all()
-
         user = self.request.user
+        # Student: only their own enrollments
+        queryset = Enrollment.objects.visible_to(user)
+
         # Filters apply kora hocche search query er opor base kore.
         search = self.request.query_params.get('search', '').strip()
-        student_param = self.request.query_params.get('student', '').strip()
         faculty_param = self.request.query_params.get('faculty', '').strip()
         course_param = self.request.query_params.get('course', '').strip()
         semester_param = self.request.query_params.get('semester', '').strip()
 
-        # Student: only their own enrollments
-        if student_param == 'current' and hasattr(user, 'student_profile'):
-            queryset = queryset.filter(student=user.student_profile)
-        elif user.role == 'student' and hasattr(user, 'student_profile'):
-            queryset = queryset.filter(student=user.student_profile)
-
         # Faculty: only students in their courses
-        if faculty_param == 'current' and hasattr(user, 'faculty_profile'):
-            assigned_course_ids = FacultyCourseAssignment.objects.filter(
-                faculty=user.faculty_profile
-            ).values_list('course_id', flat=True)
-            queryset = queryset.filter(course_id__in=assigned_course_ids)
+        if faculty_param == 'current' and access_scope(user).faculty is not None:
+            queryset = queryset.taught_by(user)
 
         # Filter by course
         if course_param:
@@ -171,6 +193,7 @@ class EnrollmentListCreateView(generics.ListCreateAPIView):
                 Q(course__code__icontains=search)
             )
 
+        queryset = EnrollmentSerializer.optimize_queryset(queryset, self.get_requested_fields())
         return queryset.order_by('-enrolled_at')
 
     def list(self, request, *args, **kwargs):
@@ -185,37 +208,48 @@ class EnrollmentDeleteView(generics.DestroyAPIView):
     queryset = Enrollment.objects.all()
 
 
+class EnrollmentStatusTransitionView(APIView):
+    """
+    POST /api/academic/enrollments/status/
+    { status, from_status?, course_code?, semester? } — e.g. end of term:
+    { "status": "Completed", "from_status": ["Active"], "semester": "Fall 2025" }.
+    Admin moves a course's / semester's enrollments to `status` in one UPDATE.
+    With "archive": true the semester's enrollments and grades then move to
+    the archive tables (academic.archive).
+    """
+    permission_classes = [IsAdminUser]
+
+    def post(self, request):
+        serializer = EnrollmentTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        status_to = serializer.validated_data['status']
+        # One transaction: a failed archive also undoes the status change.
+        with transaction.atomic():
+            updated = serializer.get_queryset().transition(status_to)
+            data = {'message': f'{updated} enrollments set to {status_to}.', 'updated': updated}
+            if serializer.validated_data['archive']:
+                data['archived'] = archive_semester(serializer.validated_data['semester'])
+        return Response(data)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # GRADING (Faculty submits/updates, Student reads)
 # ═══════════════════════════════════════════════════════════════════════════
 
-class GradeListView(generics.ListAPIView):
+class GradeListView(SparseFieldsetMixin, generics.ListAPIView):
     """
-    GET /api/academic/grades/?faculty=current&student=current&search=
+    GET /api/academic/grades/?faculty=current&student=current&search=&fields=
     """
     serializer_class = GradeSerializer
+    fieldset_serializer_class = GradeValuesSerializer
 
     def get_queryset(self):
-        queryset = Grade.objects.select_related(
-            'student__user', 'course', 'graded_by__user'
-        ).all()
-
         user = self.request.user
-        search = self.request.query_params.get('search', '').strip()
-        faculty_param = self.request.query_params.get('faculty', '').strip()
-        student_param = self.request.query_params.get('student', '').strip()
-
-        # Faculty: only grades they submitted
-        if faculty_param == 'current' and hasattr(user, 'faculty_profile'):
-            queryset = queryset.filter(graded_by=user.faculty_profile)
-        elif user.role == 'faculty' and hasattr(user, 'faculty_profile'):
-            queryset = queryset.filter(graded_by=user.faculty_profile)
+        # Faculty: only grades they submitted. Student: only their own grades.
+        # GradeValuesSerializer.project() selects its own columns, so no joins here.
+        queryset = Grade.objects.visible_to(user)
 
-        # Student: only their own grades
-        if student_param == 'current' and hasattr(user, 'student_profile'):
-            queryset = queryset.filter(student=user.student_profile)
-        elif user.role == 'student' and hasattr(user, 'student_profile'):
-            queryset = queryset.filter(student=user.student_profile)
+        search = self.request.query_params.get('search', '').strip()
 
         if search:
             queryset = queryset.filter(
@@ -228,15 +262,19 @@ class GradeListView(generics.ListAPIView):
         return queryset.order_by('course__code', 'student__student_id')
 
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        fields = self.get_requested_fields()
+        rows = GradeValuesSerializer.project(self.get_queryset(), fields)
+        return Response(GradeValuesSerializer(rows, fields).data)
 
 
 class BulkGradeCreateView(APIView):
-    """POST /api/academic/grades/bulk/ — Faculty bulk-submits grades."""
+    """
+    POST /api/academic/grades/bulk/ — Faculty bulk-submits grades.
+    Retries with the same Idempotency-Key header replay the first response.
+    """
     permission_classes = [IsFacultyUser]
 
+    @idempotent('grade-bulk')
     def post(self, request):
         serializer = BulkGradeSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -246,43 +284,94 @@ class BulkGradeCreateView(APIView):
 
         # Verify faculty is assigned to this course
         # Check kora hocche je faculty ei course er teacher kina.
-        if not FacultyCourseAssignment.objects.filter(faculty=faculty, course=course).exists():
+        if not access_scope(request.user).teaches(course):
             return Response(
                 {'error': 'You are not assigned to this course.'},
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        created_grades = []
+        # Only students enrolled in the course get a grade (one query for all entries).
+        enrolled = dict(
+            Enrollment.objects.filter(
+                course=course,
+                student__student_id__in=[e['student_id'] for e in serializer.validated_data['grades']],
+            ).values_list('student__student_id', 'student_id')
+        )
+        submitted = {}
+        count = 0
         for entry in serializer.validated_data['grades']:
-            student = Student.objects.get(student_id=entry['student_id'])
+            if entry['student_id'] in enrolled:
+                submitted[enrolled[entry['student_id']]] = entry['grade']
+                count += 1
 
-            # Verify student is enrolled
-            if not Enrollment.objects.filter(student=student, course=course).exists():
-                continue
+        # One upsert for every grade, then one GPA recalculation for every student.
+        with transaction.atomic():
+            upsert_grades(course, faculty, submitted, 'bulk')
 
-            grade_obj, _ = Grade.objects.update_or_create(
-                student=student,
-                course=course,
-                defaults={
-                    'grade': entry['grade'],
-                    'graded_by': faculty,
-                }
+        return Response(
+            {'message': 'Grades submitted successfully!', 'count': count},
+            status=status.HTTP_201_CREATED
+        )
+
+
+class GradeImportView(APIView):
+    """
+    POST /api/academic/grades/import/  (multipart: course_code, file)
+    Faculty imports a CSV/XLSX grade sheet. Valid rows are applied; rejected
+    rows are listed in a CSV linked from `error_file`.
+    """
+    permission_classes = [IsFacultyUser]
+
+    def post(self, request):
+        serializer = GradeImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        course = serializer.validated_data['course_obj']
+        faculty = request.user.faculty_profile
+        if not access_scope(request.user).teaches(course):
+            return Response(
+                {'error': 'You are not assigned to this course.'},
+                status=status.HTTP_403_FORBIDDEN
             )
-            created_grades.append(grade_obj)
 
+        try:
+            result = import_grades(serializer.validated_data['file'], course, faculty)
+        except ImportFileError as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if result['error_file']:
+            name = result['error_file'].rsplit('/', 1)[-1]
+            result['error_file'] = request.build_absolute_uri(reverse('grade-import-errors', args=[name]))
         return Response(
-            {'message': 'Grades submitted successfully!', 'count': len(created_grades)},
+            {'message': f"Imported {result['imported']} grades, rejected {result['rejected']}.", **result},
             status=status.HTTP_201_CREATED
         )
 
 
+class GradeImportErrorsView(APIView):
+    """GET /api/academic/grades/import/errors/{name}.csv — download an import's rejected rows."""
+    permission_classes = [IsFacultyUser]
+
+    def get(self, request, name):
+        # Files live under the uploader's faculty pk, so nobody else can fetch them.
+        path = error_file_name(request.user.faculty_profile, name)
+        if not default_storage.exists(path):
+            raise Http404
+        return FileResponse(default_storage.open(path, 'rb'), as_attachment=True,
+                            filename=f'grade-import-errors-{name}', content_type='text/csv')
+
+
 class GradeUpdateView(generics.UpdateAPIView):
-    """PUT /api/academic/grades/{id}/ — Faculty updates a single grade."""
+    """
+    PUT /api/academic/grades/{id}/ — Faculty updates a single grade.
+    Send the grade's `version` as If-Match: "<version>" to get 412 instead of
+    overwriting a change made since it was read. Responses carry it as ETag.
+    """
     serializer_class = GradeSerializer
     permission_classes = [IsFacultyUser]
 
     def get_queryset(self):
-        return Grade.objects.filter(graded_by=self.request.user.faculty_profile)
+        return Grade.objects.visible_to(self.request.user).for_listing()
 
     def update(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -295,30 +384,54 @@ class GradeUpdateView(generics.UpdateAPIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        instance.grade = new_grade
-        instance.save()
+        if_match = request.headers.get('If-Match', '').strip()
+        if if_match and if_match != '*':
+            tags = {tag.strip().removeprefix('W/').strip('"') for tag in if_match.split(',')}
+            if str(instance.version) not in tags:
+                return self.precondition_failed(instance.version)
+
+        # Compare-and-set: only writes if nobody changed the row since get_object().
+        with transaction.atomic():
+            updated = Grade.objects.filter(pk=instance.pk, version=instance.version).update(
+                grade=new_grade, gpa=Grade.GPA_MAP[new_grade], version=F('version') + 1,
+            )
+            if not updated:
+                return self.precondition_failed(
+                    Grade.objects.filter(pk=instance.pk).values_list('version', flat=True).first()
+                )
+            # Also invalidates the cached dashboards: update() sends no post_save.
+            recalculate_gpas([instance.student_id])
+            old_grade = instance.grade
+            instance.grade, instance.gpa, instance.version = new_grade, Grade.GPA_MAP[new_grade], instance.version + 1
+            record_grade_changes([(instance, old_grade)], request.user.faculty_profile, 'update')
 
         serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        return Response(serializer.data, headers={'ETag': f'"{instance.version}"'})
+
+    def precondition_failed(self, version):
+        return Response(
+            {'error': 'This grade was changed by someone else. Reload it and try again.', 'version': version},
+            status=status.HTTP_412_PRECONDITION_FAILED,
+            headers={'ETag': f'"{version}"'},
+        )
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # ACADEMIC RECORDS (Admin read-only view of ALL grades)
 # ═══════════════════════════════════════════════════════════════════════════
 
-class AcademicRecordsView(generics.ListAPIView):
+class AcademicRecordsView(SparseFieldsetMixin, generics.ListAPIView):
     """
-    GET /api/academic/records/?search=&semester=&page=&page_size=8
+    GET /api/academic/records/?search=&semester=&page=&page_size=8&fields=&cursor=
     Admin view of all grade records.
     """
     serializer_class = GradeSerializer
+    fieldset_serializer_class = GradeValuesSerializer
     permission_classes = [IsAdminUser]
     pagination_class = LargePagination
 
     def get_queryset(self):
-        queryset = Grade.objects.select_related(
-            'student__user', 'course'
-        ).all()
+        queryset = Grade.objects.all()
 
         search = self.request.query_params.get('search', '').strip()
         semester = self.request.query_params.get('semester', '').strip()
@@ -335,6 +448,37 @@ class AcademicRecordsView(generics.ListAPIView):
 
         return queryset.order_by('student__student_id', 'course__code')
 
+    def list(self, request, *args, **kwargs):
+        fields = self.get_requested_fields()
+        rows = GradeValuesSerializer.project(self.get_queryset(), fields)
+        page = self.paginate_queryset(rows)
+        return self.get_paginated_response(GradeValuesSerializer(page, fields).data)
+
+
+class GradeAuditLogView(generics.ListAPIView):
+    """
+    GET /api/academic/grades/audit/?grade=&faculty=&page=&page_size=8&cursor=
+    Admin view of grade changes, newest first. `grade` is a grade id,
+    `faculty` a faculty_id; both filters are index lookups.
+    """
+    permission_classes = [IsAdminUser]
+    pagination_class = LargePagination
+
+    def get_queryset(self):
+        queryset = GradeAuditLog.objects.all()
+        grade = self.request.query_params.get('grade', '').strip()
+        faculty = self.request.query_params.get('faculty', '').strip()
+        if grade.isdigit():
+            queryset = queryset.filter(grade_id=grade)
+        if faculty:
+            queryset = queryset.filter(changed_by__faculty_id=faculty)
+        return queryset.order_by('-changed_at')
+
+    def list(self, request, *args, **kwargs):
+        rows = GradeAuditValuesSerializer.project(self.get_queryset())
+        page = self.paginate_queryset(rows)
+        return self.get_paginated_response(GradeAuditValuesSerializer(page).data)
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # CLASS SCHEDULE WIDGET (Today/Tomorrow)
@@ -348,54 +492,58 @@ class ScheduleTodayView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        user = request.user
-        today = datetime.date.today()
-        day_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        today_day = day_names[today.weekday()]
-        tomorrow_day = day_names[(today.weekday() + 1) % 7]
-
-        if user.role == 'faculty' and hasattr(user, 'faculty_profile'):
-            assigned_course_ids = FacultyCourseAssignment.objects.filter(
-                faculty=user.faculty_profile
-            ).values_list('course_id', flat=True)
-            courses = Course.objects.filter(id__in=assigned_course_ids)
-        elif user.role == 'student' and hasattr(user, 'student_profile'):
-            enrolled_course_ids = Enrollment.objects.filter(
-                student=user.student_profile, status='Active'
-            ).values_list('course_id', flat=True)
-            courses = Course.objects.filter(id__in=enrolled_course_ids)
+        # CourseMeeting theke ek query te schedule ana hocche, user+din hisebe cache.
+        return Response(get_today_schedule(request.user, datetime.date.today()))
+
+
+class ScheduleWeekView(APIView):
+    """
+    GET /api/academic/schedules/week/
+    Returns the full weekly timetable: { "Mon": [...], ..., "Sun": [...] }.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response(get_week_schedule(request.user))
+
+
+class ScheduleFeedLinkView(APIView):
+    """
+    GET /api/academic/schedules/feed/
+    Returns the user's private iCalendar subscription URL.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        path = reverse('schedule-feed', kwargs={'token': feed_token(request.user)})
+        return Response({'url': request.build_absolute_uri(path)})
+
+
+class ScheduleFeedView(APIView):
+    """
+    GET /api/academic/schedules/feed/{token}.ics
+    iCalendar feed for calendar apps. The signed token in the URL is the
+    credential; responses carry an ETag so polling clients get 304s.
+    """
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request, token):
+        user = user_from_feed_token(token)
+        if user is None:
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+
+        content, etag = get_ical_feed(user)
+        # CompressionMiddleware sends the tag back with an -gzip/-br/-zstd suffix.
+        if_none_match = request.headers.get('If-None-Match', '')
+        if etag in (strip_encoding_suffix(tag.strip()) for tag in if_none_match.split(',')):
+            response = HttpResponseNotModified()
         else:
-            courses = Course.objects.none()
-
-        def build_schedule(courses_qs, target_day):
-            result = []
-            for c in courses_qs:
-                if target_day in (c.days or []):
-                    # Get instructor
-                    # Course er instructor ke sheta ber kora hocche.
-                    assignment = FacultyCourseAssignment.objects.filter(course=c).first()
-                    instructor = assignment.faculty.user.get_full_name() if assignment else ''
-
-                    result.append({
-                        'courseCode': c.code,
-                        'courseName': c.name,
-                        'startTime': c.start_time.strftime('%H:%M') if c.start_time else '',
-                        'endTime': c.end_time.strftime('%H:%M') if c.end_time else '',
-                        'days': c.days,
-                        'room': c.room,
-                        'building': c.building,
-                        'type': 'Lecture',
-                        'status': 'Scheduled',
-                        'instructor': instructor,
-                    })
-            return sorted(result, key=lambda x: x['startTime'])
-
-        return Response({
-            'today': build_schedule(courses, today_day),
-            'tomorrow': build_schedule(courses, tomorrow_day),
-            'today_day': today_day,
-            'tomorrow_day': tomorrow_day,
-        })
+            response = HttpResponse(content, content_type='text/calendar; charset=utf-8')
+            response['Content-Disposition'] = 'inline; filename="schedule.ics"'
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -411,7 +559,7 @@ class AcademicHistoryView(APIView):
 
     def get(self, request):
         student = request.user.student_profile
-        grades = Grade.objects.filter(student=student).select_related('course').order_by('course__semester')
+        grades = student_grades(student)
 
         # Group by semester
         semesters = {}
@@ -452,28 +600,8 @@ class AcademicHistorySummaryView(APIView):
     permission_classes = [IsStudentUser]
 
     def get(self, request):
-        student = request.user.student_profile
-        grades = Grade.objects.filter(student=student).select_related('course')
-
-        total_credits = 0
-        total_points = 0
-        semesters = set()
-
-        for g in grades:
-            credits = g.course.credits
-            total_credits += credits
-            total_points += float(g.gpa or 0) * credits
-            if g.course.semester:
-                semesters.add(g.course.semester)
-
-        cgpa = round(total_points / total_credits, 2) if total_credits > 0 else 0.0
-
-        return Response({
-            'cumulative_gpa': cgpa,
-            'total_credits': total_credits,
-            'semesters_count': len(semesters),
-            'courses_completed': grades.count(),
-        })
+        # Ek query te shob grade; courses_completed o eki loop theke.
+        return Response(history_summary(history_rows(request.user.student_profile)))
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -509,7 +637,7 @@ class TranscriptView(APIView):
         y -= 40
 
         # Get grades grouped by semester
-        grades = Grade.objects.filter(student=student).select_related('course').order_by('course__semester')
+        grades = student_grades(student)
 
         semesters = {}
         for g in grades:
@@ -588,11 +716,7 @@ class AdminDashboardStatsView(APIView):
     permission_classes = [IsAdminUser]
 
     def get(self, request):
-        return Response({
-            'total_students': Student.objects.count(),
-            'total_faculty': Faculty.objects.count(),
-            'total_courses': Course.objects.count(),
-        })
+        return Response(admin_stats())
 
 
 class FacultyDashboardStatsView(APIView):
@@ -600,19 +724,7 @@ class FacultyDashboardStatsView(APIView):
     permission_classes = [IsFacultyUser]
 
     def get(self, request):
-        faculty = request.user.faculty_profile
-        assigned_course_ids = FacultyCourseAssignment.objects.filter(
-            faculty=faculty
-        ).values_list('course_id', flat=True)
-
-        total_students = Enrollment.objects.filter(
-            course_id__in=assigned_course_ids, status='Active'
-        ).values('student').distinct().count()
-
-        return Response({
-            'assigned_courses_count': len(assigned_course_ids),
-            'total_students_count': total_students,
-        })
+        return Response(faculty_stats(access_scope(request.user).assigned_course_ids))
 
 
 class StudentDashboardStatsView(APIView):
@@ -620,12 +732,22 @@ class StudentDashboardStatsView(APIView):
     permission_classes = [IsStudentUser]
 
     def get(self, request):
-        student = request.user.student_profile
-        enrolled_count = Enrollment.objects.filter(
-            student=student, status='Active'
-        ).count()
-
-        return Response({
-            'enrolled_courses_count': enrolled_count,
-            'current_gpa': str(student.current_gpa),
-        })
+        scope = access_scope(request.user)
+        return Response(student_stats(scope.student, scope.enrolled_course_ids))
+
+
+class DashboardBootstrapView(APIView):
+    """
+    GET /api/dashboard/{admin|faculty|student}/bootstrap/
+    Everything the role's dashboard loads after login in one response:
+    stats, today's schedule, history summary and course list, as returned
+    by the individual endpoints. Cached per user (see academic.dashboard).
+    """
+    role = None
+    role_permissions = {'admin': IsAdminUser, 'faculty': IsFacultyUser, 'student': IsStudentUser}
+
+    def get_permissions(self):
+        return [self.role_permissions[self.role]()]
+
+    def get(self, request):
+        return Response(get_bootstrap(request.user, self.role))
@@ -0,0 +1,23 @@
+"""
+Benchmark scripts for the University Management System.
+
+Each module is runnable on its own against the local database, e.g.:
+    python -m benchmarks.compression
+"""
+import os
+
+
+def setup():
+    """Configure Django for a standalone benchmark run."""
+    import django
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    django.setup()
+
+
+def auth_header(user):
+    """Bearer header for the Django test client, without going through login."""
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    token = RefreshToken.for_user(user).access_token
+    return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
@@ -0,0 +1,141 @@
+"""
+Responsiveness of normal traffic while the auth endpoints are abused.
+
+One client keeps requesting a student's dashboard stats while `--attackers`
+threads, all from one IP, send `--attack-rps` requests per second at one
+account: wrong-password logins (each costs a password hash) and
+forgot-password requests (each writes an OTP and sends an email). Each
+phase runs for `--seconds` through an in-process WSGIHandler:
+  baseline     dashboard traffic only
+  throttled    plus the attack, with the token buckets (config.throttling)
+  unthrottled  plus the attack, with every throttle rate set to None
+Run against a database built with benchmarks.dataset:
+    SQLITE_PATH=/tmp/bench.sqlite3 python -m benchmarks.abuse --seconds 10 --attack-rps 20
+"""
+import argparse
+import io
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from benchmarks import auth_header, setup
+from benchmarks.load import summarize
+
+ATTACKER_IP = '203.0.113.7'
+DASHBOARD_PATH = '/api/dashboard/student/stats/'
+PHASES = ('baseline', 'throttled', 'unthrottled')
+
+
+def call(application, method, path, headers=None, body=b'', ip='127.0.0.1'):
+    environ = {
+        'REQUEST_METHOD': method, 'PATH_INFO': path, 'QUERY_STRING': '', 'SCRIPT_NAME': '',
+        'SERVER_NAME': 'testserver', 'SERVER_PORT': '80', 'SERVER_PROTOCOL': 'HTTP/1.1',
+        'REMOTE_ADDR': ip, 'CONTENT_TYPE': 'application/json', 'CONTENT_LENGTH': str(len(body)),
+        'wsgi.url_scheme': 'http', 'wsgi.input': io.BytesIO(body), 'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True, 'wsgi.multiprocess': False, 'wsgi.run_once': False,
+        **(headers or {}),
+    }
+    status = []
+    response = application(environ, lambda s, h: status.append(int(s.split()[0])))
+    b''.join(response)
+    response.close()
+    return status[0]
+
+
+def run_phase(application, phase, seconds, attackers, attack_rps, student_headers, victim):
+    from django.core import mail
+    from config.throttling import TokenBucketThrottle
+
+    rates = TokenBucketThrottle.THROTTLE_RATES
+    if phase == 'unthrottled':
+        TokenBucketThrottle.THROTTLE_RATES = dict.fromkeys(rates)
+    mail.outbox = []
+    stop = time.perf_counter() + seconds
+    timings, attack_statuses = [], Counter()
+    attacks = [
+        ('/api/auth/login/', json.dumps({'email': victim, 'password': 'wrong-guess'}).encode()),
+        ('/api/auth/forgot-password/', json.dumps({'email': victim}).encode()),
+    ]
+    interval = attackers / attack_rps
+
+    def attack(i):
+        n, due = i, time.perf_counter()
+        while due < stop:
+            # Paced like a remote client: a slow response doesn't slow the attack down.
+            time.sleep(max(0.0, due - time.perf_counter()))
+            path, body = attacks[n % len(attacks)]
+            attack_statuses[call(application, 'POST', path, body=body, ip=ATTACKER_IP)] += 1
+            n, due = n + 1, due + interval
+
+    threads = [threading.Thread(target=attack, args=(i,))
+               for i in range(attackers if phase != 'baseline' else 0)]
+    for thread in threads:
+        thread.start()
+    started = time.perf_counter()
+    errors = 0
+    while time.perf_counter() < stop:
+        begin = time.perf_counter()
+        if call(application, 'GET', DASHBOARD_PATH, student_headers) != 200:
+            errors += 1
+        timings.append(time.perf_counter() - begin)
+    elapsed = time.perf_counter() - started
+    for thread in threads:
+        thread.join()
+    TokenBucketThrottle.THROTTLE_RATES = rates
+
+    return {
+        'dashboard': summarize(timings, errors, elapsed),
+        'attack_requests': sum(attack_statuses.values()),
+        'attack_statuses': dict(attack_statuses),
+        'emails_sent': len(mail.outbox),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--attackers', type=int, default=8, help='attacking threads')
+    parser.add_argument('--attack-rps', type=float, default=20, help='attack requests per second, in total')
+    parser.add_argument('--json', help='write results to this file')
+    args = parser.parse_args()
+
+    os.environ['EMAIL_BACKEND'] = 'django.core.mail.backends.locmem.EmailBackend'
+    os.environ['SERVER_TIMING'] = 'False'
+    setup()
+    logging.getLogger('django.request').setLevel(logging.ERROR)  # one 401/429 line per attack otherwise
+    from django.core.cache import caches
+    from django.conf import settings
+    from django.core.handlers.wsgi import WSGIHandler
+    from users.models import PasswordResetOTP, User
+
+    application = WSGIHandler()
+    student = User.objects.filter(role='student', is_active=True).order_by('pk').first()
+    victim = User.objects.filter(role='student').order_by('-pk').values_list('email', flat=True).first()
+    last_otp = PasswordResetOTP.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+
+    report = {}
+    try:
+        for phase in PHASES:
+            caches[settings.THROTTLE_CACHE].clear()
+            report[phase] = run_phase(application, phase, args.seconds, args.attackers, args.attack_rps,
+                                      auth_header(student), victim)
+    finally:
+        PasswordResetOTP.objects.filter(pk__gt=last_otp).delete()
+
+    print(f"{'phase':12} {'dash p50':>9} {'dash p95':>9} {'dash rps':>9} {'attacks':>8} {'429s':>6} {'emails':>7}")
+    for phase, row in report.items():
+        stats = row['dashboard']
+        print(f"{phase:12} {stats['p50_ms']:>9.1f} {stats['p95_ms']:>9.1f} {stats['rps']:>9.1f} "
+              f"{row['attack_requests']:>8} {row['attack_statuses'].get(429, 0):>6} {row['emails_sent']:>7}")
+
+    if args.json:
+        with open(args.json, 'w') as fh:
+            json.dump(report, fh, indent=2)
+
+
+if __name__ == '__main__':
+    main()
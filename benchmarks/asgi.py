@@ -0,0 +1,161 @@
+"""
+Sync WSGI vs async ASGI throughput on the endpoints in academic.async_views.
+
+Both handlers are driven in-process, so the numbers compare Django's
+request paths rather than a particular server:
+  wsgi  WSGIHandler + the sync DRF views, `--concurrency` worker threads
+        (a threaded server such as gunicorn --threads)
+  asgi  ASGIHandler + the async views (ASYNC_VIEWS=true), `--concurrency`
+        requests in flight on one event loop (uvicorn / daphne)
+Each transport runs in its own process because ASYNC_VIEWS is read when the
+URLconf is imported. Run against a database built with benchmarks.dataset:
+    SQLITE_PATH=/tmp/bench.sqlite3 python -m benchmarks.asgi --requests 2000 --concurrency 16
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import setup
+from benchmarks.load import ENDPOINTS, MIXES, build_plan, headers_for, summarize
+
+ASYNC_PATHS = {
+    '/api/academic/schedules/today/',
+    '/api/academic/history/summary/',
+    '/api/dashboard/admin/stats/',
+    '/api/dashboard/faculty/stats/',
+    '/api/dashboard/student/stats/',
+}
+TRANSPORTS = ('wsgi', 'asgi')
+
+
+def async_plan(mix, total, seed, users_per_role):
+    """A load.build_plan() request list restricted to the async endpoints."""
+    endpoints = {
+        role: [endpoint for endpoint in endpoints if endpoint[1] in ASYNC_PATHS]
+        for role, endpoints in ENDPOINTS.items()
+    }
+    return build_plan(mix, total, seed, users_per_role, endpoints)
+
+
+def run_wsgi(plan, headers, concurrency):
+    from django.core.handlers.wsgi import WSGIHandler
+
+    application = WSGIHandler()
+
+    def fetch(item):
+        _, _, user_id, path = item
+        environ = {
+            'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'QUERY_STRING': '', 'SCRIPT_NAME': '',
+            'SERVER_NAME': 'testserver', 'SERVER_PORT': '80', 'SERVER_PROTOCOL': 'HTTP/1.1',
+            'wsgi.url_scheme': 'http', 'wsgi.input': io.BytesIO(), 'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True, 'wsgi.multiprocess': False, 'wsgi.run_once': False,
+            **headers[user_id],
+        }
+        status = []
+        start = time.perf_counter()
+        response = application(environ, lambda s, h: status.append(int(s.split()[0])))
+        b''.join(response)
+        response.close()
+        return time.perf_counter() - start, status[0]
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(fetch, plan))
+
+
+async def run_asgi(plan, headers, concurrency):
+    from django.core.asgi import get_asgi_application
+
+    application = get_asgi_application()
+    slots = asyncio.Semaphore(concurrency)
+
+    async def fetch(item):
+        _, _, user_id, path = item
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+            'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': b'',
+            'root_path': '', 'server': ('testserver', 80), 'client': ('127.0.0.1', 0),
+            'headers': [(b'authorization', headers[user_id]['HTTP_AUTHORIZATION'].encode())],
+        }
+        messages = []
+        body = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+
+        async def receive():
+            if body:
+                return body.pop()
+            # The client never disconnects; Django cancels this once the response is sent.
+            await asyncio.Event().wait()
+
+        async def send(message):
+            messages.append(message)
+
+        async with slots:
+            start = time.perf_counter()
+            await application(scope, receive, send)
+            return time.perf_counter() - start, messages[0]['status']
+
+    return await asyncio.gather(*(fetch(item) for item in plan))
+
+
+def run_transport(args):
+    """Child process: time one transport and print its summary as JSON."""
+    setup()
+    plan = async_plan(MIXES[args.mix], args.warmup + args.requests, args.seed, args.users)
+    headers = headers_for(plan)
+    if args.transport == 'wsgi':
+        run = lambda items: run_wsgi(items, headers, args.concurrency)
+    else:
+        run = lambda items: asyncio.run(run_asgi(items, headers, args.concurrency))
+
+    run(plan[:args.warmup])
+    started = time.perf_counter()
+    results = run(plan[args.warmup:])
+    elapsed = time.perf_counter() - started
+    errors = sum(1 for _, status in results if not 200 <= status < 400)
+    print(json.dumps(summarize([seconds for seconds, _ in results], errors, elapsed)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mix', choices=MIXES, default='term')
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--warmup', type=int, default=100, help='requests run before measuring')
+    parser.add_argument('--users', type=int, default=200, help='distinct users sampled per role')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--concurrency', type=int, default=8, help='threads (wsgi) / in-flight requests (asgi)')
+    parser.add_argument('--json', help='write results to this file')
+    parser.add_argument('--transport', choices=TRANSPORTS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.transport:
+        run_transport(args)
+        return
+
+    report = {}
+    for transport in TRANSPORTS:
+        env = {**os.environ, 'ASYNC_VIEWS': str(transport == 'asgi'), 'SERVER_TIMING': 'False'}
+        child = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.asgi', *sys.argv[1:], '--transport', transport],
+            env=env, capture_output=True, text=True,
+        )
+        if child.returncode:
+            sys.exit(f'{transport} run failed:\n{child.stderr}')
+        report[transport] = json.loads(child.stdout.strip().splitlines()[-1])
+
+    print(f"{'transport':10} {'n':>6} {'err':>4} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'rps':>7}")
+    for transport, stats in report.items():
+        print(f"{transport:10} {stats['requests']:>6} {stats['errors']:>4} {stats['p50_ms']:>8.1f} "
+              f"{stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} {stats['rps']:>7.1f}")
+
+    if args.json:
+        with open(args.json, 'w') as fh:
+            json.dump({'concurrency': args.concurrency, 'mix': args.mix, **report}, fh, indent=2)
+
+
+if __name__ == '__main__':
+    main()
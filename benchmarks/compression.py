@@ -0,0 +1,72 @@
+"""
+Byte and latency comparison for CompressionMiddleware.
+
+Run against a seeded database (python seed_data.py):
+    python -m benchmarks.compression [--repeat 20] [--json out.json]
+"""
+import argparse
+import json
+import statistics
+import time
+
+from benchmarks import auth_header, setup
+
+ENDPOINTS = [
+    # (label, role email, path)
+    ('enrollments (admin)', 'admin@university.edu', '/api/academic/enrollments/'),
+    ('grades (admin)', 'admin@university.edu', '/api/academic/grades/'),
+    ('courses page (faculty)', 'rahman@university.edu', '/api/academic/courses/?page_size=100'),
+    ('transcript pdf (student)', 'ayesha@university.edu', '/api/academic/transcript/'),
+    ('openapi schema', None, '/api/schema/'),
+]
+
+
+def measure(client, path, headers, encoding, repeat):
+    timings = []
+    response = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(path, HTTP_ACCEPT_ENCODING=encoding, **headers)
+        body = b''.join(response.streaming_content) if response.streaming else response.content
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        'status': response.status_code,
+        'encoding': response.get('Content-Encoding', 'identity'),
+        'bytes': len(body),
+        'median_ms': round(statistics.median(timings), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--json', help='write results to this file')
+    args = parser.parse_args()
+
+    setup()
+    from django.test import Client
+    from users.models import User
+    from config.middleware import available_codecs
+
+    client = Client()
+    encodings = ['identity'] + list(available_codecs())
+    results = []
+    for label, email, path in ENDPOINTS:
+        headers = auth_header(User.objects.get(email=email)) if email else {}
+        row = {'endpoint': label, 'path': path}
+        for encoding in encodings:
+            row[encoding] = measure(client, path, headers, encoding, args.repeat)
+        results.append(row)
+
+    print(f"{'endpoint':28} " + ' '.join(f'{e:>20}' for e in encodings))
+    for row in results:
+        cells = [f"{row[e]['bytes']:>9} B {row[e]['median_ms']:>6.1f}ms" for e in encodings]
+        print(f"{row['endpoint']:28} " + ' '.join(f'{c:>20}' for c in cells))
+
+    if args.json:
+        with open(args.json, 'w') as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Synthetic university generator for benchmarks.
+
+Benchmark-shaped presets for the seeding engine (academic.seeding): the
+same --seed and scale always produce the same data. Point SQLITE_PATH at a
+scratch file to keep it away from db.sqlite3:
+    SQLITE_PATH=/tmp/bench.sqlite3 python -m benchmarks.dataset --scale large --snapshot large.sqlite3.gz
+and later, instead of regenerating:
+    SQLITE_PATH=/tmp/bench.sqlite3 python manage.py snapshot restore large.sqlite3.gz
+"""
+import argparse
+
+from benchmarks import setup
+
+PRESETS = {
+    # 'large' is roughly 50k students, 2k courses and 1M grades.
+    'small': {'students': 500, 'faculty': 40, 'courses': 80, 'grades_per_student': 8, 'active_per_student': 3},
+    'medium': {'students': 5000, 'faculty': 300, 'courses': 400, 'grades_per_student': 12, 'active_per_student': 4},
+    'large': {'students': 50000, 'faculty': 1500, 'courses': 2000, 'grades_per_student': 20, 'active_per_student': 5},
+}
+
+
+def generate(seed=0, **options):
+    """Write a synthetic university (demo accounts included) into the empty default database."""
+    from academic.seeding import Seeder
+
+    Seeder(seed=seed, **options).run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', choices=PRESETS, default='small')
+    parser.add_argument('--seed', type=int, default=0)
+    for name in PRESETS['small']:
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, help=f'override the preset {name}')
+    parser.add_argument('--snapshot', help='also save the result to this snapshot file (.gz / .zst)')
+    args = parser.parse_args()
+
+    setup()
+    from django.core.management import call_command
+    from users.models import User
+
+    call_command('migrate', verbosity=0)
+    if User.objects.exists():
+        parser.error('the database is not empty; point SQLITE_PATH at a new file')
+    options = {name: getattr(args, name) or value for name, value in PRESETS[args.scale].items()}
+    print(f'Generating {args.scale} university (seed {args.seed}): {options}')
+    generate(seed=args.seed, **options)
+    if args.snapshot:
+        call_command('snapshot', 'save', args.snapshot)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,314 @@
+"""
+Load-test harness: replays a weighted mix of role traffic against the API and
+reports p50/p95/p99 latency and throughput per endpoint.
+
+Requests go in-process through Django's test client (default) or over HTTP
+to a running server (--base-url, with --concurrency worker threads). Users
+are sampled from whatever database is configured, e.g. one built with
+benchmarks.dataset:
+    SQLITE_PATH=/tmp/bench.sqlite3 python -m benchmarks.load --mix term --requests 2000 --json run.json
+    python -m benchmarks.load --compare base.json run.json
+--logins replays POST /api/auth/login/ instead (the seeded passwords from
+academic.seeding), split over --processes worker processes, and reports
+logins per second per core:
+    SQLITE_PATH=/tmp/bench.sqlite3 python -m benchmarks.load --logins --requests 200 --processes 4
+"""
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import auth_header, setup
+
+# role -> [(endpoint name, path, weight)]; '{course}' is a course id.
+ENDPOINTS = {
+    'student': [
+        ('dashboard stats', '/api/dashboard/student/stats/', 10),
+        ('schedule today', '/api/academic/schedules/today/', 10),
+        ('schedule week', '/api/academic/schedules/week/', 4),
+        ('my enrollments', '/api/academic/enrollments/?student=current', 6),
+        ('my grades', '/api/academic/grades/?student=current', 6),
+        ('history', '/api/academic/history/', 3),
+        ('history summary', '/api/academic/history/summary/', 3),
+        ('course list', '/api/academic/courses/', 4),
+        ('course detail', '/api/academic/courses/{course}/', 2),
+        ('transcript pdf', '/api/academic/transcript/', 1),
+    ],
+    'faculty': [
+        ('dashboard stats', '/api/dashboard/faculty/stats/', 8),
+        ('schedule today', '/api/academic/schedules/today/', 8),
+        ('my courses', '/api/academic/courses/?faculty=current&page_size=100', 6),
+        ('course roster', '/api/academic/enrollments/?faculty=current', 4),
+        ('submitted grades', '/api/academic/grades/?faculty=current', 4),
+    ],
+    'admin': [
+        ('dashboard stats', '/api/dashboard/admin/stats/', 6),
+        ('student list', '/api/users/students/?page=1', 4),
+        ('student search', '/api/users/students/?search=Rahman', 2),
+        ('faculty list', '/api/users/faculty/?page=1', 3),
+        ('course list', '/api/academic/courses/?page=1', 3),
+        ('academic records', '/api/academic/records/?page=1', 3),
+        ('assignments', '/api/academic/assignments/', 1),
+        ('all enrollments', '/api/academic/enrollments/', 1),
+    ],
+}
+
+# --logins: every role only logs in.
+LOGIN_PATH = '/api/auth/login/'
+LOGIN_ENDPOINTS = {role: [('login', LOGIN_PATH, 1)] for role in ENDPOINTS}
+
+# Share of traffic per role.
+MIXES = {
+    'term': {'student': 85, 'faculty': 12, 'admin': 3},
+    'grading': {'student': 50, 'faculty': 45, 'admin': 5},
+    'admin': {'student': 20, 'faculty': 10, 'admin': 70},
+}
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[rank]
+
+
+def summarize(timings, errors, elapsed):
+    timings = sorted(timings)
+    ms = lambda value: round(value * 1000, 2) if value is not None else None
+    return {
+        'requests': len(timings),
+        'errors': errors,
+        'rps': round(len(timings) / elapsed, 1) if elapsed else None,
+        'mean_ms': ms(sum(timings) / len(timings)) if timings else None,
+        'p50_ms': ms(percentile(timings, 50)),
+        'p95_ms': ms(percentile(timings, 95)),
+        'p99_ms': ms(percentile(timings, 99)),
+        'max_ms': ms(timings[-1]) if timings else None,
+    }
+
+
+def build_plan(mix, total, seed, users_per_role, endpoints=ENDPOINTS):
+    """Deterministic list of (role, endpoint name, user, path) requests."""
+    from academic.models import Course
+    from users.models import User
+
+    rng = random.Random(seed)
+    users = {}
+    for role in mix:
+        ids = list(User.objects.filter(role=role, is_active=True).values_list('pk', flat=True))
+        if role == 'admin':
+            ids += list(User.objects.filter(is_superuser=True).values_list('pk', flat=True))
+        if not ids:
+            raise SystemExit(f'no {role} users in the database')
+        users[role] = rng.sample(sorted(set(ids)), min(users_per_role, len(set(ids))))
+    course_ids = list(Course.objects.values_list('pk', flat=True))
+
+    roles, role_weights = zip(*mix.items())
+    plan = []
+    for _ in range(total):
+        role = rng.choices(roles, role_weights)[0]
+        name, path, _ = rng.choices(endpoints[role], [e[2] for e in endpoints[role]])[0]
+        plan.append((role, name, rng.choice(users[role]), path.format(course=rng.choice(course_ids))))
+    return plan
+
+
+def headers_for(plan):
+    from users.models import User
+
+    user_ids = {user_id for _, _, user_id, _ in plan}
+    return {user.pk: auth_header(user) for user in User.objects.filter(pk__in=user_ids)}
+
+
+def run_client(plan, headers):
+    """In-process through Django's test client, one request at a time."""
+    from django.test import Client
+
+    client = Client(raise_request_exception=False)
+    results = []
+    for role, name, user_id, path in plan:
+        start = time.perf_counter()
+        response = client.get(path, **headers[user_id])
+        if response.streaming:
+            b''.join(response.streaming_content)
+        results.append((f'{role} {name}', time.perf_counter() - start, response.status_code))
+    return results
+
+
+def _login_worker(items):
+    from django.test import Client
+
+    client = Client(raise_request_exception=False)
+    results = []
+    for role, name, email, password in items:
+        start = time.perf_counter()
+        response = client.post(LOGIN_PATH, {'email': email, 'password': password},
+                               content_type='application/json')
+        results.append((f'{role} {name}', time.perf_counter() - start, response.status_code))
+    return results
+
+
+def run_logins(plan, processes):
+    """In-process logins, the plan split over `processes` forked workers."""
+    from django.db import connections
+    from academic.seeding import PASSWORDS
+    from users.models import User
+
+    users = User.objects.in_bulk({user_id for _, _, user_id, _ in plan})
+    items = [(role, name, users[user_id].email, PASSWORDS[role]) for role, name, user_id, _ in plan]
+    if processes < 2:
+        return _login_worker(items)
+    # Workers inherit the configured Django, but must open their own connections.
+    connections.close_all()
+    with multiprocessing.get_context('fork').Pool(processes) as pool:
+        return [row for chunk in pool.map(_login_worker, [items[i::processes] for i in range(processes)])
+                for row in chunk]
+
+
+def run_http(plan, headers, base_url, concurrency):
+    """Against a running server, `concurrency` requests in flight."""
+
+    def fetch(item):
+        role, name, user_id, path = item
+        request = urllib.request.Request(
+            base_url.rstrip('/') + path,
+            headers={'Authorization': headers[user_id]['HTTP_AUTHORIZATION'], 'Accept-Encoding': 'gzip'},
+        )
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                response.read()
+                status = response.status
+        except urllib.error.HTTPError as exc:
+            exc.read()
+            status = exc.code
+        except OSError:
+            status = 0
+        return f'{role} {name}', time.perf_counter() - start, status
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(fetch, plan))
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def dataset_counts():
+    from academic.models import Course, Enrollment, Grade
+    from users.models import Faculty, Student
+
+    return {model.__name__.lower(): model.objects.count()
+            for model in (Student, Faculty, Course, Enrollment, Grade)}
+
+
+def compare(base_path, run_path):
+    with open(base_path) as fh:
+        base = json.load(fh)
+    with open(run_path) as fh:
+        run = json.load(fh)
+    print(f"{base.get('revision')} -> {run.get('revision')}")
+    print(f"{'endpoint':34} {'p50 ms':>17} {'p95 ms':>17} {'p99 ms':>17}")
+    for name, stats in run['endpoints'].items():
+        old = base['endpoints'].get(name)
+        if not old:
+            continue
+        cells = []
+        for key in ('p50_ms', 'p95_ms', 'p99_ms'):
+            change = (stats[key] - old[key]) / old[key] * 100 if old[key] else 0.0
+            cells.append(f'{old[key]:>6.1f}>{stats[key]:<6.1f}{change:+4.0f}%')
+        print(f'{name:34} ' + ' '.join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mix', choices=MIXES, default='term')
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--warmup', type=int, default=100, help='requests run before measuring')
+    parser.add_argument('--users', type=int, default=200, help='distinct users sampled per role')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--base-url', help='load a running server instead of the in-process client')
+    parser.add_argument('--concurrency', type=int, default=8, help='worker threads with --base-url')
+    parser.add_argument('--logins', action='store_true', help='measure logins instead of the role mix')
+    parser.add_argument('--processes', type=int, default=1, help='worker processes with --logins')
+    parser.add_argument('--json', help='write results to this file')
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'RUN'), help='diff two result files')
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    setup()
+    import django
+    from django.conf import settings
+
+    endpoints = LOGIN_ENDPOINTS if args.logins else ENDPOINTS
+    plan = build_plan(MIXES[args.mix], args.warmup + args.requests, args.seed, args.users, endpoints)
+    if args.logins:
+        run = lambda items: run_logins(items, args.processes)
+    elif args.base_url:
+        headers = headers_for(plan)
+        run = lambda items: run_http(items, headers, args.base_url, args.concurrency)
+    else:
+        headers = headers_for(plan)
+        run = lambda items: run_client(items, headers)
+
+    run(plan[:args.warmup])
+    started = time.perf_counter()
+    results = run(plan[args.warmup:])
+    elapsed = time.perf_counter() - started
+
+    timings, errors = defaultdict(list), defaultdict(int)
+    for name, seconds, status in results:
+        timings[name].append(seconds)
+        if not 200 <= status < 400:
+            errors[name] += 1
+    report = {
+        'revision': git_revision(),
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'database': str(settings.DATABASES['default']['NAME']),
+        'dataset': dataset_counts(),
+        'mix': args.mix,
+        'transport': args.base_url or 'test-client',
+        'concurrency': args.processes if args.logins else args.concurrency if args.base_url else 1,
+        'seed': args.seed,
+        'overall': summarize([s for _, s, _ in results], sum(errors.values()), elapsed),
+        'endpoints': {
+            name: summarize(timings[name], errors[name], elapsed) for name in sorted(timings)
+        },
+    }
+
+    print(f"{'endpoint':34} {'n':>6} {'err':>4} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'rps':>7}")
+    for name, stats in [*report['endpoints'].items(), ('TOTAL', report['overall'])]:
+        print(f"{name:34} {stats['requests']:>6} {stats['errors']:>4} {stats['p50_ms']:>8.1f} "
+              f"{stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} {stats['rps']:>7.1f}")
+
+    if args.logins:
+        cores = min(args.processes, os.cpu_count() or 1)
+        report['logins_per_core'] = round(report['overall']['rps'] / cores, 1)
+        print(f"{report['overall']['rps']:.1f} logins/s on {cores} core(s): "
+              f"{report['logins_per_core']:.1f} per core")
+
+    if args.json:
+        with open(args.json, 'w') as fh:
+            json.dump(report, fh, indent=2)
+
+
+if __name__ == '__main__':
+    main()
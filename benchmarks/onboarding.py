@@ -0,0 +1,84 @@
+"""
+Account onboarding throughput, in accounts per second.
+
+Creates `--accounts` students through StudentSerializer in three ways, each
+inside a transaction that is rolled back afterwards:
+  serial   one POST payload at a time, each with its own password
+           (one hash per account, as before users.onboarding)
+  pool     one list payload, distinct passwords hashed in a process pool
+  initial  one list payload without passwords (shared initial password hash)
+The hasher comes from PASSWORD_HASHER, so compare hashers with e.g.
+    python -m benchmarks.onboarding --accounts 200
+    PASSWORD_HASHER=scrypt python -m benchmarks.onboarding --accounts 200
+"""
+import argparse
+import json
+import os
+import time
+
+from benchmarks import setup
+
+MODES = ('serial', 'pool', 'initial')
+
+
+def payloads(count, with_passwords):
+    rows = []
+    for i in range(count):
+        row = {
+            'student_id': f'ONB{i:06d}', 'name': f'Onboard Student{i}', 'email': f'onboard{i}@bench.edu',
+            'major': 'Computer Science', 'year': '1st', 'gpa': '0.00',
+        }
+        if with_passwords:
+            row['password'] = f'initial-{i}'
+        rows.append(row)
+    return rows
+
+
+def run(mode, count, workers):
+    from django.db import transaction
+    from users.serializers import StudentSerializer
+
+    rows = payloads(count, with_passwords=mode != 'initial')
+    started = time.perf_counter()
+    with transaction.atomic():
+        if mode == 'serial':
+            for row in rows:
+                serializer = StudentSerializer(data=row)
+                serializer.is_valid(raise_exception=True)
+                serializer.save()
+        else:
+            serializer = StudentSerializer(data=rows, many=True)
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+        elapsed = time.perf_counter() - started
+        transaction.set_rollback(True)
+    return {'accounts': count, 'seconds': round(elapsed, 3), 'accounts_per_s': round(count / elapsed, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--accounts', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=0, help='hashing processes (0: one per CPU)')
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--json', help='write results to this file')
+    args = parser.parse_args()
+
+    os.environ['ONBOARDING_HASH_WORKERS'] = str(args.workers)
+    setup()
+    from django.conf import settings
+
+    hasher = settings.PASSWORD_HASHERS[0].rsplit('.', 1)[-1]
+    results = {mode: run(mode, args.accounts, args.workers) for mode in args.modes}
+
+    print(f'hasher: {hasher}, cpus: {os.cpu_count()}')
+    print(f"{'mode':10} {'accounts':>9} {'seconds':>9} {'acct/s':>9}")
+    for mode, row in results.items():
+        print(f"{mode:10} {row['accounts']:>9} {row['seconds']:>9.2f} {row['accounts_per_s']:>9.1f}")
+
+    if args.json:
+        with open(args.json, 'w') as fh:
+            json.dump({'hasher': hasher, **results}, fh, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""
+CPU cost of the DRF list serializers vs. their ValuesSerializer counterparts.
+
+Both paths start from the same in-memory rows (no database I/O): the DRF
+path materializes model instances with Model.from_db + related caches, as
+queryset iteration with select_related does, then serializes; the values
+path serializes the values_list() tuples directly. The rendered JSON is
+checked to be byte-for-byte identical.
+    python -m benchmarks.serializers [--rows 10000] [--repeat 5]
+"""
+import argparse
+import datetime
+import time
+from decimal import Decimal
+
+from benchmarks import setup
+
+
+def resolve(obj, lookup):
+    for part in lookup.split('__'):
+        obj = getattr(obj, part)
+    return obj
+
+
+def make_instances(n):
+    from academic.models import Course, Grade
+    from users.models import Faculty, Student, User
+
+    courses = [
+        Course(id=i, code=f'CS{i:03d}', name=f'Course {i}', credits=3, semester='Fall 2025')
+        for i in range(50)
+    ]
+    students, faculty, grades = [], [], []
+    for i in range(n):
+        user = User(id=i, first_name=f'First{i}', last_name=f'Last{i}', email=f's{i}@university.edu')
+        student = Student(id=i, user=user, student_id=f'STU{i:05d}', major='Computer Science',
+                          year='2nd', current_gpa=Decimal('3.25'))
+        students.append(student)
+        faculty.append(Faculty(id=i, user=user, faculty_id=f'FAC{i:05d}', department='EEE',
+                               specialization='Signals', join_date=datetime.date(2020, 1, 1)))
+        grades.append(Grade(id=i, student=student, course=courses[i % 50], grade='B+',
+                            gpa=Decimal('3.30')))
+    return {'grade': grades, 'student': students, 'faculty': faculty}
+
+
+def db_row(obj):
+    return [getattr(obj, f.attname) for f in obj._meta.concrete_fields]
+
+
+def materializer(objs, related):
+    """
+    Rebuild `objs` from raw column tuples the way the ORM does. `related`
+    lists (path, forward field) pairs to attach, parents before children.
+    """
+    model = type(objs[0])
+    attnames = [f.attname for f in model._meta.concrete_fields]
+    raw = [(db_row(o), [db_row(resolve(o, path)) for path, _ in related]) for o in objs]
+    related_meta = [
+        (field, [f.attname for f in field.related_model._meta.concrete_fields])
+        for _, field in related
+    ]
+    parents = [path.rpartition('__')[0] for path, _ in related]
+
+    def build():
+        out = []
+        for row, related_rows in raw:
+            obj = model.from_db('default', attnames, row)
+            built = {'': obj}
+            for (path, _), (field, names), parent, values in zip(related, related_meta, parents, related_rows):
+                child = field.related_model.from_db('default', names, values)
+                field.set_cached_value(built[parent], child)
+                built[path] = child
+            out.append(obj)
+        return out
+    return build
+
+
+def bench(fn, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    setup()
+    from config.renderers import CustomJSONRenderer
+    from academic.models import Grade
+    from users.models import Faculty, Student
+    from academic.serializers import GradeSerializer, GradeValuesSerializer
+    from users.serializers import (
+        FacultySerializer, FacultyValuesSerializer, StudentSerializer, StudentValuesSerializer,
+    )
+
+    instances = make_instances(args.rows)
+    pairs = [
+        ('grade', GradeSerializer, GradeValuesSerializer),
+        ('student', StudentSerializer, StudentValuesSerializer),
+        ('faculty', FacultySerializer, FacultyValuesSerializer),
+    ]
+    renderer = CustomJSONRenderer()
+    scale = 10000 / args.rows
+    related = {
+        'grade': [('student', Grade.student.field), ('student__user', Student.user.field),
+                  ('course', Grade.course.field)],
+        'student': [('user', Student.user.field)],
+        'faculty': [('user', Faculty.user.field)],
+    }
+    print(f"{'serializer':10} {'drf ms/10k':>12} {'values ms/10k':>14} {'speedup':>8} identical")
+    for name, drf_class, values_class in pairs:
+        objs = instances[name]
+        rows = [tuple(resolve(o, lookup) for lookup in values_class.lookups_for()) for o in objs]
+        build = materializer(objs, related[name])
+        drf_ms, drf_data = bench(lambda: drf_class(build(), many=True).data, args.repeat)
+        values_ms, values_data = bench(lambda: values_class(rows).data, args.repeat)
+        identical = renderer.render(drf_data) == renderer.render(values_data)
+        print(f'{name:10} {drf_ms * scale:>12.1f} {values_ms * scale:>14.1f} '
+              f'{drf_ms / values_ms:>7.1f}x {identical}')
+
+
+if __name__ == '__main__':
+    main()
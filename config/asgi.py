@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_asgi_application()
+
+# Build (or load) the OpenAPI schema once per worker instead of on first hit.
+from config.schema import get_schema_artifacts  # noqa: E402
+
+get_schema_artifacts()
@@ -0,0 +1,122 @@
+"""
+Async counterparts of DRF's APIView for read-only endpoints.
+
+DRF views are sync only, so under ASGI every request to one costs a hop
+into the thread-sensitive executor. AsyncAPIView is a plain Django View
+with async handlers that keeps the parts of APIView these endpoints rely
+on: JWT authentication, DRF permission classes, DRF exception responses
+and the CustomJSONRenderer envelope. Handlers return a DRF Response:
+
+    class StudentDashboardStatsView(AsyncAPIView):
+        permission_classes = [IsStudentUser]
+
+        async def get(self, request):
+            return Response({...})
+
+The user is loaded together with both profiles, so handlers can read
+`request.user.student_profile` / `faculty_profile` without a lazy query
+(which would raise SynchronousOnlyOperation in async code).
+"""
+from django.contrib.auth.models import AnonymousUser
+from django.http import Http404
+from django.utils.decorators import classonlymethod
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from config.renderers import CustomJSONRenderer
+
+
+class AsyncJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication with an async user lookup that also loads the profiles."""
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        # Same checks as JWTAuthentication.get_user().
+        try:
+            user_id = validated_token[jwt_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken('Token contained no recognizable user identification')
+
+        try:
+            user = await (
+                self.user_model.objects
+                .select_related('student_profile', 'faculty_profile')
+                .aget(**{jwt_settings.USER_ID_FIELD: user_id})
+            )
+        except self.user_model.DoesNotExist:
+            raise exceptions.AuthenticationFailed('User not found', code='user_not_found')
+
+        if jwt_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise exceptions.AuthenticationFailed('User is inactive', code='user_inactive')
+        if jwt_settings.CHECK_REVOKE_TOKEN and (
+            validated_token.get(jwt_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password)
+        ):
+            raise exceptions.AuthenticationFailed(
+                "The user's password has been changed.", code='password_changed',
+            )
+        return user
+
+
+class AsyncAPIView(View):
+    permission_classes = [IsAuthenticated]
+    renderer_class = CustomJSONRenderer
+    authenticator = AsyncJWTAuthentication()
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        # Token auth only, like the DRF views (APIView.as_view is csrf_exempt too).
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            result = await self.authenticator.aauthenticate(request)
+            request.user, request.auth = result if result else (AnonymousUser(), None)
+            self.check_permissions(request)
+            response = await super().dispatch(request, *args, **kwargs)
+        except (exceptions.APIException, Http404) as exc:
+            response = self.handle_exception(request, exc)
+        return self.finalize_response(request, response)
+
+    def check_permissions(self, request):
+        for permission in [permission() for permission in self.permission_classes]:
+            if not permission.has_permission(request, self):
+                if request.auth is None and not request.user.is_authenticated:
+                    raise exceptions.NotAuthenticated()
+                raise exceptions.PermissionDenied(getattr(permission, 'message', None))
+
+    def handle_exception(self, request, exc):
+        if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            # 401 with a WWW-Authenticate challenge, as APIView does.
+            exc.auth_header = self.authenticator.authenticate_header(request)
+        handler = api_settings.EXCEPTION_HANDLER
+        return handler(exc, {'view': self, 'args': self.args, 'kwargs': self.kwargs, 'request': request})
+
+    def http_method_not_allowed(self, request, *args, **kwargs):
+        raise exceptions.MethodNotAllowed(request.method)
+
+    def finalize_response(self, request, response):
+        if not isinstance(response, Response):
+            return response  # e.g. View.options()
+        # Rendering is CPU only, so render inline instead of leaving it to
+        # the handler's sync_to_async(response.render).
+        response.accepted_renderer = self.renderer_class()
+        response.accepted_media_type = self.renderer_class.media_type
+        response.renderer_context = {'view': self, 'request': request, 'response': response}
+        return response.render()
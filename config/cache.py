@@ -0,0 +1,48 @@
+"""
+Version-based cache invalidation.
+
+Cached values embed the current version of every namespace they depend on
+in their key. Bumping a namespace makes all those keys unreachable at once,
+which works on any cache backend (no key scanning or delete_pattern needed).
+Stale entries simply age out via their timeout.
+"""
+import time
+
+from django.core.cache import cache
+
+
+def _version_key(namespace):
+    return f'version:{namespace}'
+
+
+def get_versions(*namespaces):
+    """Current version for each namespace, in one cache round trip."""
+    keys = [_version_key(ns) for ns in namespaces]
+    found = cache.get_many(keys)
+    versions = []
+    for key in keys:
+        version = found.get(key)
+        if version is None:
+            # Seed from the clock so an evicted counter can't restart at a
+            # value that older entries were written with.
+            version = time.time_ns()
+            cache.add(key, version, timeout=None)
+            version = cache.get(key, version)
+        versions.append(version)
+    return versions
+
+
+def bump_version(*namespaces):
+    """Invalidate every cached value that depends on these namespaces."""
+    for namespace in namespaces:
+        key = _version_key(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def versioned_key(prefix, namespaces, *parts):
+    """Cache key for `prefix:parts` that changes whenever a namespace is bumped."""
+    versions = get_versions(*namespaces)
+    return ':'.join([prefix, *map(str, parts), *map(str, versions)])
@@ -0,0 +1,96 @@
+"""
+Cached and estimated row counts for paginated lists.
+
+A paginated list runs COUNT(*) over the same filtered, joined queryset on
+every page. cached_count() keeps the result for COUNT_CACHE_TIMEOUT seconds
+under a versioned key (see config.cache) that depends on one namespace per
+table the query reads, including tables in subqueries; saving or deleting a
+row of a model bumps its table's namespace via invalidate_counts().
+
+Unfiltered counts of tables the planner already knows to be large come from
+its statistics instead (pg_class.reltuples, or sqlite_stat1 after ANALYZE);
+those are reported as inexact.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from django.db.models.sql import Query
+
+from config.cache import bump_version, versioned_key
+
+
+def _namespace(table):
+    return f'count:{table}'
+
+
+def query_tables(query):
+    """Every table a Query reads: its base table, joins and subqueries."""
+    tables = {query.get_meta().db_table}
+    tables.update(join.table_name for join in query.alias_map.values())
+    nodes = list(query.where.children)
+    while nodes:
+        node = nodes.pop()
+        if hasattr(node, 'children'):
+            nodes.extend(node.children)
+        elif isinstance(getattr(node, 'rhs', None), Query):
+            tables |= query_tables(node.rhs)
+    return tables
+
+
+def count_namespaces(*models):
+    """Namespaces invalidate_counts() bumps for these models, for caches built on the same tables."""
+    return [_namespace(model._meta.db_table) for model in models]
+
+
+def invalidate_counts(*models):
+    """Drop cached counts of every query that reads these models' tables."""
+    bump_version(*count_namespaces(*models))
+
+
+def estimate_count(model):
+    """The planner's row estimate for a table, or None if it has none."""
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute('SELECT reltuples FROM pg_class WHERE oid = %s::regclass', [table])
+        elif connection.vendor == 'sqlite':
+            # sqlite_stat1 only exists once ANALYZE has run; a failed SELECT
+            # leaves an SQLite transaction usable. The first number of any
+            # row for the table is its row count.
+            try:
+                cursor.execute('SELECT stat FROM sqlite_stat1 WHERE tbl = %s ORDER BY idx IS NOT NULL LIMIT 1', [table])
+            except DatabaseError:
+                return None
+        else:
+            return None
+        row = cursor.fetchone()
+    if row is None:
+        return None
+    estimate = int(float(str(row[0]).split()[0]))
+    return estimate if estimate >= 0 else None
+
+
+def cached_count(queryset, *key_parts, estimate=True):
+    """
+    (count, exact) for a queryset. `key_parts` name the request it came from
+    (view, filters, user) so equal requests share one cache entry.
+    """
+    query = queryset.query
+    if estimate and not query.where.children and not query.distinct:
+        # -1: no statistics; cached so small tables don't pay for the lookup each time.
+        rows = cache.get_or_set(f'count:estimate:{queryset.model._meta.db_table}',
+                                lambda: estimate_count(queryset.model) or -1,
+                                settings.COUNT_CACHE_TIMEOUT)
+        if rows >= settings.COUNT_ESTIMATE_THRESHOLD:
+            return rows, False
+
+    namespaces = sorted(_namespace(table) for table in query_tables(query))
+    digest = hashlib.md5(repr(key_parts).encode()).hexdigest()
+    key = versioned_key('count', namespaces, digest)
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, settings.COUNT_CACHE_TIMEOUT)
+    return count, True
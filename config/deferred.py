@@ -0,0 +1,82 @@
+"""
+Write-behind inserts for append-only rows (e.g. academic.GradeAuditLog).
+
+defer_create() queues unsaved instances once the surrounding transaction
+commits. During a request the queue belongs to that request (set up by
+config.middleware.DeferredWritesMiddleware) and is written with one
+bulk_create per model when the response is closed, which happens after it
+has been handed to the server, so the client never waits for it. Outside a
+request (management commands, shell, tests) the rows are written at commit.
+Rows from a rolled-back transaction are never queued.
+
+The request's queue is found through a ContextVar: under ASGI the middleware
+runs on the event loop and the view's transactions on an executor thread,
+and sync_to_async carries the context from one to the other. The flush runs
+before close() sends request_finished, so Django's close_old_connections
+receiver still tidies the connection it used. A failed bulk_create is
+retried up to WRITE_ATTEMPTS times; rows still not written are logged and
+counted in config.metrics (ums_deferred_rows_failed_total).
+"""
+import logging
+from collections import defaultdict
+from contextvars import ContextVar
+
+from django.db import transaction
+
+from config import metrics
+
+logger = logging.getLogger(__name__)
+
+WRITE_ATTEMPTS = 3
+
+_current = ContextVar('deferred_queue', default=None)
+
+
+def start_request():
+    """Give the current request its own queue; returns (queue, token for end_request())."""
+    queue = defaultdict(list)
+    return queue, _current.set(queue)
+
+
+def end_request(token):
+    _current.reset(token)
+
+
+def defer_create(objs):
+    """bulk_create `objs` after commit, after the response when in a request."""
+    objs = list(objs)
+    if not objs:
+        return
+
+    def enqueue():
+        queue = _current.get()
+        pending = defaultdict(list) if queue is None else queue
+        for obj in objs:
+            pending[type(obj)].append(obj)
+        if queue is None:
+            flush(pending)
+
+    transaction.on_commit(enqueue)
+
+
+def _write(model, objs):
+    for attempt in range(1, WRITE_ATTEMPTS + 1):
+        try:
+            # One transaction per attempt, so a retry never finds half a batch written.
+            with transaction.atomic():
+                model.objects.bulk_create(objs, batch_size=1000)
+            return
+        except Exception:
+            if attempt < WRITE_ATTEMPTS:
+                logger.warning('Writing %d deferred %s rows failed, retrying', len(objs), model.__name__,
+                               exc_info=True)
+                continue
+            # The response is already gone: log and count the loss instead of raising.
+            logger.exception('Could not write %d deferred %s rows', len(objs), model.__name__)
+            metrics.registry.record_deferred_failure(model.__name__, len(objs))
+
+
+def flush(queue):
+    """Write and empty `queue`."""
+    while queue:
+        _write(*queue.popitem())
@@ -0,0 +1,98 @@
+from rest_framework.exceptions import ValidationError
+
+
+def parse_fields_param(request, available, param='fields'):
+    """
+    Read ?fields=a,b,c. Returns the requested names in `available` order,
+    or None when the parameter is absent/empty (meaning "all fields").
+    """
+    raw = request.query_params.get(param, '').strip()
+    if not raw:
+        return None
+    requested = {name.strip() for name in raw.split(',') if name.strip()}
+    unknown = requested - set(available)
+    if unknown:
+        raise ValidationError({
+            param: f"Unknown field(s): {', '.join(sorted(unknown))}. "
+                   f"Available: {', '.join(available)}."
+        })
+    return [name for name in available if name in requested]
+
+
+class SparseFieldsetMixin:
+    """
+    View mixin adding ?fields= to GET requests.
+
+    The requested field list is passed to the serializer as context['fields']
+    and is available to get_queryset() through get_requested_fields(), so the
+    queryset can skip joins, annotations and prefetches nobody asked for.
+    `fieldset_serializer_class` (default: serializer_class) must expose
+    `field_names`.
+    """
+    fieldset_serializer_class = None
+
+    def get_fieldset_serializer_class(self):
+        return self.fieldset_serializer_class or self.get_serializer_class()
+
+    def get_requested_fields(self):
+        if not hasattr(self, '_requested_fields'):
+            self._requested_fields = None
+            if self.request.method == 'GET':
+                self._requested_fields = parse_fields_param(
+                    self.request, self.get_fieldset_serializer_class().field_names
+                )
+        return self._requested_fields
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['fields'] = self.get_requested_fields()
+        return context
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    Serializer mixin describing what each output field reads.
+
+    field_sources:     output field -> model paths it reads ('course__code').
+                       Related paths imply select_related on their relation.
+    field_annotations: output field -> {alias: expression} to annotate.
+    field_prefetches:  output field -> callable returning Prefetch objects.
+
+    Keys of field_sources, in order, are the serializer's output fields.
+    """
+    field_sources = {}
+    field_annotations = {}
+    field_prefetches = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.field_names = tuple(cls.field_sources)
+
+    @classmethod
+    def optimize_queryset(cls, queryset, fields=None):
+        """Apply only()/select_related()/annotate()/prefetch_related() for `fields`."""
+        paths = ['pk']
+        relations = set()
+        annotations = {}
+        prefetches = []
+        for name in fields or cls.field_names:
+            for path in cls.field_sources[name]:
+                paths.append(path)
+                if '__' in path:
+                    relations.add(path.rsplit('__', 1)[0])
+            annotations.update(cls.field_annotations.get(name, {}))
+            if name in cls.field_prefetches:
+                prefetches.extend(cls.field_prefetches[name]())
+
+        queryset = queryset.select_related(None)
+        if relations:
+            queryset = queryset.select_related(*sorted(relations))
+        queryset = queryset.only(*paths)
+        if annotations:
+            queryset = queryset.annotate(**annotations)
+        if prefetches:
+            queryset = queryset.prefetch_related(*prefetches)
+        return queryset
+
+    def requested_fields(self):
+        return self.context.get('fields') or self.field_names
@@ -0,0 +1,78 @@
+"""
+Idempotency-Key support for POST handlers.
+
+A client that retries a slow request with the same `Idempotency-Key` header
+gets the first response back instead of running the handler again:
+
+    class BulkGradeCreateView(APIView):
+        @idempotent('grade-bulk')
+        def post(self, request): ...
+
+Responses are stored in the cache per (scope, user, key) for
+IDEMPOTENCY_KEY_TIMEOUT seconds together with a hash of the request body.
+Reusing a key for a different body is a 422; a retry that arrives while the
+first request is still running is a 409. 5xx responses aren't stored, so
+those can be retried.
+"""
+import hashlib
+import json
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+PENDING = 'pending'
+
+
+def _fingerprint(data):
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def idempotent(scope):
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(self, request, *args, **kwargs):
+            idempotency_key = request.headers.get('Idempotency-Key', '').strip()
+            if not idempotency_key:
+                return handler(self, request, *args, **kwargs)
+            if len(idempotency_key) > 255:
+                return Response({'error': 'Idempotency-Key is too long.'}, status=status.HTTP_400_BAD_REQUEST)
+
+            key = f'idempotency:{scope}:{request.user.pk}:{hashlib.sha256(idempotency_key.encode()).hexdigest()}'
+            fingerprint = _fingerprint(request.data)
+            timeout = settings.IDEMPOTENCY_KEY_TIMEOUT
+
+            # add() is atomic: only one request per key gets to run the handler.
+            if not cache.add(key, {'state': PENDING, 'fingerprint': fingerprint}, timeout):
+                stored = cache.get(key)
+                if stored is not None:
+                    if stored['fingerprint'] != fingerprint:
+                        return Response(
+                            {'error': 'This Idempotency-Key was already used for a different request.'},
+                            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                        )
+                    if stored['state'] == PENDING:
+                        return Response(
+                            {'error': 'A request with this Idempotency-Key is still in progress.'},
+                            status=status.HTTP_409_CONFLICT,
+                        )
+                    return Response(stored['data'], status=stored['status'],
+                                    headers={'Idempotent-Replayed': 'true'})
+                # Expired between add() and get(): claim it again.
+                cache.set(key, {'state': PENDING, 'fingerprint': fingerprint}, timeout)
+
+            try:
+                response = handler(self, request, *args, **kwargs)
+            except Exception:
+                cache.delete(key)
+                raise
+            if response.status_code >= 500:
+                cache.delete(key)
+            else:
+                cache.set(key, {'state': 'done', 'fingerprint': fingerprint,
+                                'status': response.status_code, 'data': response.data}, timeout)
+            return response
+        return wrapper
+    return decorator
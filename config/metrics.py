@@ -0,0 +1,195 @@
+"""
+Per-view request metrics: SQL query count, DB time, serialization time and
+render time.
+
+InstrumentationMiddleware (config.middleware) opens a RequestMetrics for
+each request and records the totals here. Queries are counted by one
+execute_wrapper per connection, count_queries(), which adds them to
+whichever request's RequestMetrics is current in the calling context:
+concurrent async requests share the thread-sensitive connection but not
+their contextvars. CustomJSONRenderer reports its own time via
+track('render'). The registry lives in process memory, so every worker
+exposes its own counters at /api/ops/metrics/ (config.views).
+"""
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connection
+
+_current = ContextVar('request_metrics', default=None)
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class RequestMetrics:
+    """Timings for one request; called by count_queries() for each of its queries."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.render_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.queries += 1
+
+
+def count_queries(execute, sql, params, many, context):
+    """The installed execute_wrapper: counts into the current request, if any."""
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    return metrics(execute, sql, params, many, context)
+
+
+def install_query_counter():
+    """Add count_queries to this thread's default connection, once."""
+    if count_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_queries)
+
+
+def start_request():
+    metrics = RequestMetrics()
+    return metrics, _current.set(metrics)
+
+
+def end_request(token):
+    _current.reset(token)
+
+
+def current():
+    return _current.get()
+
+
+@contextmanager
+def track(phase):
+    """Add the wrapped block's duration to `<phase>_time` of the current request."""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        name = f'{phase}_time'
+        setattr(metrics, name, getattr(metrics, name) + time.perf_counter() - start)
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def query_budget(view_name, method):
+    """QUERY_BUDGETS['View.METHOD'], else QUERY_BUDGETS['View'], else the default."""
+    budgets = settings.QUERY_BUDGETS
+    return budgets.get(f'{view_name}.{method}', budgets.get(view_name, settings.QUERY_BUDGET_DEFAULT))
+
+
+# ─── Registry ──────────────────────────────────────────────────────────────
+
+class _ViewStats:
+    __slots__ = ('requests', 'queries', 'db', 'serialize', 'render', 'total',
+                 'over_budget', 'buckets')
+
+    def __init__(self):
+        self.requests = 0
+        self.queries = 0
+        self.db = 0.0
+        self.serialize = 0.0
+        self.render = 0.0
+        self.total = 0.0
+        self.over_budget = 0
+        self.buckets = [0] * len(DURATION_BUCKETS)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = defaultdict(_ViewStats)
+        self._status = defaultdict(int)
+        self._deferred_failed = defaultdict(int)
+
+    def record(self, view, method, status, queries, db, serialize, render, total, over_budget):
+        with self._lock:
+            stats = self._stats[view]
+            stats.requests += 1
+            stats.queries += queries
+            stats.db += db
+            stats.serialize += serialize
+            stats.render += render
+            stats.total += total
+            stats.over_budget += over_budget
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if total <= bound:
+                    stats.buckets[i] += 1
+            self._status[(view, method, status)] += 1
+
+    def record_deferred_failure(self, model, rows):
+        """Rows config.deferred gave up writing."""
+        with self._lock:
+            self._deferred_failed[model] += rows
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self._status.clear()
+            self._deferred_failed.clear()
+
+    def render_prometheus(self):
+        with self._lock:
+            stats = sorted(self._stats.items())
+            statuses = sorted(self._status.items())
+            deferred_failed = sorted(self._deferred_failed.items())
+
+        lines = [
+            '# HELP ums_http_requests_total Requests handled, by view, method and status.',
+            '# TYPE ums_http_requests_total counter',
+        ]
+        for (view, method, status), count in statuses:
+            lines.append(
+                f'ums_http_requests_total{{view="{view}",method="{method}",status="{status}"}} {count}'
+            )
+
+        counters = [
+            ('ums_db_queries_total', 'SQL queries executed.', 'queries'),
+            ('ums_db_seconds_total', 'Time spent in the database.', 'db'),
+            ('ums_serialize_seconds_total',
+             'Python time in the view outside the database and renderer.', 'serialize'),
+            ('ums_render_seconds_total', 'Time spent rendering response bodies.', 'render'),
+            ('ums_query_budget_exceeded_total', 'Requests over their query budget.', 'over_budget'),
+        ]
+        for name, help_text, attr in counters:
+            lines += [f'# HELP {name} {help_text}', f'# TYPE {name} counter']
+            for view, s in stats:
+                value = getattr(s, attr)
+                lines.append(f'{name}{{view="{view}"}} {value if isinstance(value, int) else round(value, 6)}')
+
+        name = 'ums_request_duration_seconds'
+        lines += [f'# HELP {name} End-to-end request duration.', f'# TYPE {name} histogram']
+        for view, s in stats:
+            for bound, count in zip(DURATION_BUCKETS, s.buckets):
+                lines.append(f'{name}_bucket{{view="{view}",le="{bound}"}} {count}')
+            lines += [
+                f'{name}_bucket{{view="{view}",le="+Inf"}} {s.requests}',
+                f'{name}_sum{{view="{view}"}} {round(s.total, 6)}',
+                f'{name}_count{{view="{view}"}} {s.requests}',
+            ]
+
+        name = 'ums_deferred_rows_failed_total'
+        lines += [f'# HELP {name} Write-behind rows (config.deferred) that could not be written.',
+                  f'# TYPE {name} counter']
+        lines += [f'{name}{{model="{model}"}} {rows}' for model, rows in deferred_failed]
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
@@ -0,0 +1,346 @@
+import logging
+import time
+import zlib
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+from config import deferred, metrics
+
+try:
+    import brotli
+except ImportError:  # Optional: pip install brotli
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # Optional: pip install zstandard
+    zstandard = None
+
+
+# ─── Codecs ────────────────────────────────────────────────────────────────
+
+class _GzipCodec:
+    name = 'gzip'
+
+    def compressor(self):
+        # wbits=31 -> gzip container with a zero mtime, so output is stable.
+        return zlib.compressobj(6, zlib.DEFLATED, 31)
+
+    def compress(self, data):
+        c = self.compressor()
+        return c.compress(data) + c.flush()
+
+    def stream(self, c, chunk):
+        return c.compress(chunk)
+
+    def finish(self, c):
+        return c.flush()
+
+
+class _BrotliCodec:
+    name = 'br'
+
+    def compressor(self):
+        # Quality 5 is the usual on-the-fly setting; 11 is far too slow per request.
+        return brotli.Compressor(quality=5)
+
+    def compress(self, data):
+        return brotli.compress(data, quality=5)
+
+    def stream(self, c, chunk):
+        return c.process(chunk)
+
+    def finish(self, c):
+        return c.finish()
+
+
+class _ZstdCodec:
+    name = 'zstd'
+
+    def compressor(self):
+        return zstandard.ZstdCompressor(level=3).compressobj()
+
+    def compress(self, data):
+        return zstandard.ZstdCompressor(level=3).compress(data)
+
+    def stream(self, c, chunk):
+        return c.compress(chunk)
+
+    def finish(self, c):
+        return c.flush()
+
+
+def available_codecs():
+    """Codecs usable in this process, keyed by Content-Encoding token."""
+    codecs = {'gzip': _GzipCodec()}
+    if brotli is not None:
+        codecs['br'] = _BrotliCodec()
+    if zstandard is not None:
+        codecs['zstd'] = _ZstdCodec()
+    return codecs
+
+
+ENCODING_SUFFIXES = ('-gzip', '-br', '-zstd')
+
+
+def strip_encoding_suffix(etag):
+    """Undo the per-encoding suffix CompressionMiddleware adds to strong ETags."""
+    for suffix in ENCODING_SUFFIXES:
+        if etag.endswith(suffix + '"'):
+            return etag[:-len(suffix) - 1] + '"'
+    return etag
+
+
+def parse_accept_encoding(header):
+    """Return {token: q} from an Accept-Encoding header."""
+    accepted = {}
+    for part in header.split(','):
+        token, _, params = part.strip().partition(';')
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token] = q
+    return accepted
+
+
+# ─── Middleware ────────────────────────────────────────────────────────────
+
+logger = logging.getLogger(__name__)
+
+
+def view_name(request):
+    """Class name of the resolved view ('CourseListCreateView'), or '<unresolved>'."""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return '<unresolved>'
+    func = match.func
+    return getattr(func, 'view_class', getattr(func, 'cls', func)).__name__
+
+
+class InstrumentationMiddleware:
+    """
+    Per-view SQL query count, DB time, serialization time and render time.
+
+    Totals go to config.metrics.registry (scraped at /api/ops/metrics/) and,
+    with SERVER_TIMING enabled, to a Server-Timing header. Requests over
+    their QUERY_BUDGETS entry are logged, or raise QueryBudgetExceeded when
+    QUERY_BUDGET_ACTION is 'raise' (used by the test suite).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics.install_query_counter()
+        request_metrics, token = metrics.start_request()
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            metrics.end_request(token)
+        return self.process_response(request, response, request_metrics, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        # Connections are per thread and the ORM runs in the thread-sensitive
+        # executor, so the counter is installed there. It is shared by every
+        # request on that thread and finds this one through the contextvar,
+        # which sync_to_async carries over.
+        await sync_to_async(metrics.install_query_counter)()
+        request_metrics, token = metrics.start_request()
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            metrics.end_request(token)
+        return self.process_response(request, response, request_metrics, time.perf_counter() - start)
+
+    def process_response(self, request, response, m, total):
+        # Everything the view did outside SQL and the renderer; on list
+        # endpoints that is almost entirely serializer work.
+        serialize = max(total - m.db_time - m.render_time, 0.0)
+        name = view_name(request)
+        budget = metrics.query_budget(name, request.method)
+        over_budget = budget is not None and m.queries > budget
+        metrics.registry.record(
+            name, request.method, response.status_code, m.queries,
+            m.db_time, serialize, m.render_time, total, over_budget,
+        )
+
+        if settings.SERVER_TIMING:
+            response.headers['Server-Timing'] = (
+                f'db;dur={m.db_time * 1000:.1f};desc="queries={m.queries}", '
+                f'serialize;dur={serialize * 1000:.1f}, '
+                f'render;dur={m.render_time * 1000:.1f}, '
+                f'total;dur={total * 1000:.1f}'
+            )
+
+        if over_budget:
+            message = (
+                f'{name} ran {m.queries} queries for {request.method} '
+                f'{request.path} (budget {budget})'
+            )
+            if settings.QUERY_BUDGET_ACTION == 'raise':
+                raise metrics.QueryBudgetExceeded(message)
+            logger.warning(message)
+        return response
+
+
+class DeferredWritesMiddleware:
+    """
+    Gives each request its own config.deferred queue and writes it when the
+    response is closed, once the server has sent it.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        queue, token = deferred.start_request()
+        try:
+            response = self.get_response(request)
+        finally:
+            deferred.end_request(token)
+        return self.process_response(queue, response)
+
+    async def __acall__(self, request):
+        queue, token = deferred.start_request()
+        try:
+            response = await self.get_response(request)
+        finally:
+            deferred.end_request(token)
+        return self.process_response(queue, response)
+
+    @staticmethod
+    def process_response(queue, response):
+        # close() runs its resource closers (as FileResponse's file) before
+        # sending request_finished; WSGI servers and ASGIHandler call it
+        # after the last byte is sent.
+        response._resource_closers.append(lambda: deferred.flush(queue))
+        return response
+
+
+class CompressionMiddleware:
+    """
+    Negotiated response compression (br / zstd / gzip).
+
+    Picks the first encoding from COMPRESSION_ENCODINGS the client accepts,
+    skips bodies below COMPRESSION_MIN_SIZE and COMPRESSION_EXCLUDED_CONTENT_TYPES
+    (already compressed media, and text/html against BREACH), and compresses
+    streaming responses chunk by chunk.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        codecs = available_codecs()
+        self.codecs = [
+            codecs[name] for name in settings.COMPRESSION_ENCODINGS if name in codecs
+        ]
+        self.min_size = settings.COMPRESSION_MIN_SIZE
+        self.excluded_types = tuple(settings.COMPRESSION_EXCLUDED_CONTENT_TYPES)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        return self.process_response(request, response)
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        return self.process_response(request, response)
+
+    def choose_codec(self, request):
+        accepted = parse_accept_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        wildcard = accepted.get('*', 0.0)
+        for codec in self.codecs:
+            if accepted.get(codec.name, wildcard) > 0:
+                return codec
+        return None
+
+    def is_excluded(self, response):
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        return content_type.startswith(self.excluded_types)
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding') or self.is_excluded(response):
+            return response
+        if not response.streaming and len(response.content) < self.min_size:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        codec = self.choose_codec(request)
+        if codec is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = self._compress_async(
+                    codec, response.streaming_content
+                )
+            else:
+                response.streaming_content = self._compress_stream(
+                    codec, response.streaming_content
+                )
+            # Final size is unknown until the stream is consumed.
+            del response.headers['Content-Length']
+        else:
+            compressed = codec.compress(response.content)
+            # Return the compressed content only if it's actually shorter.
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        # A strong ETag has to differ per representation (RFC 9110 8.8.3),
+        # so tag it with the encoding instead of weakening it.
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = f'{etag[:-1]}-{codec.name}"'
+        response.headers['Content-Encoding'] = codec.name
+        return response
+
+    @staticmethod
+    def _compress_stream(codec, chunks):
+        c = codec.compressor()
+        for chunk in chunks:
+            data = codec.stream(c, chunk)
+            if data:
+                yield data
+        yield codec.finish(c)
+
+    @staticmethod
+    async def _compress_async(codec, chunks):
+        c = codec.compressor()
+        async for chunk in chunks:
+            data = codec.stream(c, chunk)
+            if data:
+                yield data
+        yield codec.finish(c)
@@ -0,0 +1,218 @@
+import base64
+import datetime
+import json
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from config.counts import cached_count
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder, except datetimes keep their microseconds: a position
+    rounded to milliseconds never equals the row it came from, so rows that
+    share its timestamp would be skipped.
+    """
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return {'dt': o.isoformat()}
+        return super().default(o)
+
+
+def _decode_cursor_value(value):
+    if isinstance(value, dict) and value.keys() == {'dt'}:
+        return datetime.datetime.fromisoformat(value['dt'])
+    return value
+
+
+# ─── CachedCountPagination ─────────────────────────────────────────────────
+
+class CachedCountPagination(PageNumberPagination):
+    """
+    Page numbers whose total comes from config.counts.cached_count.
+
+    The count is cached per (view, filters, user) and invalidated when any
+    table behind the query changes; unfiltered lists over very large tables
+    use the planner's estimate. `count_exact` in the pagination block says
+    which one the client got, and `?count=exact` forces a real count.
+    """
+    exact_count_query_param = 'count'
+    # Query params that select a page rather than filter the list.
+    page_params = ('page', 'page_size', 'cursor', 'fields', 'count')
+
+    def django_paginator_class(self, object_list, per_page):
+        paginator = Paginator(object_list, per_page)
+        paginator.count, self.count_exact = self.get_count(object_list)
+        return paginator
+
+    def get_count(self, queryset):
+        request = self.request
+        filters = sorted((key, value) for key, value in request.query_params.lists()
+                         if key not in self.page_params)
+        view = request.resolver_match.view_name if request.resolver_match else request.path
+        estimate = request.query_params.get(self.exact_count_query_param) != 'exact'
+        return cached_count(queryset, view, filters, request.user.pk, estimate=estimate)
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        response.data = {'count': response.data['count'], 'count_exact': self.count_exact,
+                         **{key: value for key, value in response.data.items() if key != 'count'}}
+        return response
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['count_exact'] = {'type': 'boolean', 'example': True}
+        return response_schema
+
+
+# ─── KeysetPagination ──────────────────────────────────────────────────────
+
+class KeysetPagination(CachedCountPagination):
+    """
+    Page numbers by default; `?cursor=` switches a request to keyset paging.
+
+    OFFSET pages cost more the deeper they go and every page runs a COUNT(*).
+    A cursor instead holds the ordering values of the row a page ended on, and
+    the next page is a `WHERE (ordering) > (cursor) LIMIT n` on the view's own
+    order_by, so page 1000 costs the same as page 1 and no count is taken.
+
+        GET /api/academic/records/?cursor=            first page
+        GET /api/academic/records/?cursor=eyJwIjpb...   the `next` link
+
+    The response keeps the same envelope with `count: null`. The queryset's
+    ordering must be plain field lookups on non-null columns; pk is added as
+    the final tiebreaker so every position is unique.
+    """
+    cursor_query_param = 'cursor'
+    cursor_prefix = '_cursor_'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.cursor_query_param in request.query_params
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+        position, reverse = self.decode_cursor(request)
+
+        ordering = [(field, not descending) if reverse else (field, descending)
+                    for field, descending in self.ordering]
+        queryset = queryset.annotate(**{
+            f'{self.cursor_prefix}{i}': F(field) for i, (field, _) in enumerate(ordering)
+        }).order_by(*[f'-{field}' if descending else field for field, descending in ordering])
+        if position is not None:
+            queryset = queryset.filter(self.after(ordering, position))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        self.first = self.position_of(rows[0]) if rows else None
+        self.last = self.position_of(rows[-1]) if rows else None
+        return rows
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response({
+            'count': None,
+            'count_exact': False,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if not self.has_next or self.last is None:
+            return None
+        return self.cursor_link(self.last, reverse=False)
+
+    def get_previous_link(self):
+        if not self.keyset:
+            return super().get_previous_link()
+        if not self.has_previous or self.first is None:
+            return None
+        return self.cursor_link(self.first, reverse=True)
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [{
+            'name': self.cursor_query_param,
+            'required': False,
+            'in': 'query',
+            'description': 'Keyset cursor; pass it empty for the first page. Replaces `page`.',
+            'schema': {'type': 'string'},
+        }]
+
+    # ─── Cursor helpers ───────────────────────────────────────────────────
+
+    def get_ordering(self, queryset):
+        """[(lookup, descending)] from the queryset's order_by, ending in pk."""
+        ordering = []
+        for field in queryset.query.order_by or queryset.model._meta.ordering:
+            if not isinstance(field, str):
+                raise ImproperlyConfigured(
+                    f'{self.__class__.__name__} only supports plain field orderings, got {field!r}.'
+                )
+            ordering.append((field.lstrip('-'), field.startswith('-')))
+        if not any(field in ('pk', 'id') for field, _ in ordering):
+            ordering.append(('pk', ordering[-1][1] if ordering else False))
+        return ordering
+
+    @staticmethod
+    def after(ordering, position):
+        """
+        Rows strictly after `position`: a > x OR (a = x AND b > y) OR ...
+        The leading `a >= x` is redundant but lets the database range-scan
+        the index on the first ordering column.
+        """
+        condition = Q()
+        equal = {}
+        for (field, descending), value in zip(ordering, position):
+            condition |= Q(**equal, **{f"{field}__{'lt' if descending else 'gt'}": value})
+            equal[field] = value
+        first, descending = ordering[0]
+        return Q(**{f"{first}__{'lte' if descending else 'gte'}": position[0]}) & condition
+
+    def position_of(self, row):
+        names = [f'{self.cursor_prefix}{i}' for i in range(len(self.ordering))]
+        if isinstance(row, tuple):
+            # values_list(): annotations come after the projected columns.
+            return list(row[-len(names):])
+        if isinstance(row, dict):
+            return [row[name] for name in names]
+        return [getattr(row, name) for name in names]
+
+    def decode_cursor(self, request):
+        """(position, reverse) from the query string; (None, False) starts at the top."""
+        encoded = request.query_params.get(self.cursor_query_param, '')
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()), object_hook=_decode_cursor_value)
+            position, reverse = payload['p'], bool(payload.get('r'))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound('Invalid cursor.')
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound('Invalid cursor.')
+        return position, reverse
+
+    def cursor_link(self, position, reverse):
+        payload = {'p': position, 'r': 1} if reverse else {'p': position}
+        encoded = base64.urlsafe_b64encode(json.dumps(payload, cls=CursorEncoder).encode()).decode()
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, encoded)
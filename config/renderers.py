@@ -1,7 +1,13 @@
 from rest_framework.renderers import JSONRenderer
 
+from config.metrics import track
+
 class CustomJSONRenderer(JSONRenderer):
     def render(self, data, accepted_media_type=None, renderer_context=None):
+        with track('render'):
+            return self._render(data, accepted_media_type, renderer_context)
+
+    def _render(self, data, accepted_media_type=None, renderer_context=None):
         status_code = renderer_context['response'].status_code if renderer_context else 200
 
         # Check if already formatted (e.g. by exception handler)
@@ -1,3 +1,20 @@
+import hashlib
+import os
+import tempfile
+import threading
+from importlib import metadata
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+from drf_spectacular.settings import spectacular_settings
+from drf_spectacular.views import SpectacularAPIView
+
+from config.middleware import strip_encoding_suffix
+
+
 def standard_response_postprocessor(result, generator, request, public):
     """
     Post-processing hook to wrap all successful responses in the standard envelope:
@@ -45,3 +62,133 @@ def standard_response_postprocessor(result, generator, request, public):
                     json_content['schema'] = wrapped_schema
 
     return result
+
+
+# ─── Cached schema serving ─────────────────────────────────────────────────
+
+# Files the fingerprint leaves out: they never change what the schema looks like.
+SCHEMA_IGNORED = {'migrations', 'management', 'tests.py', '__pycache__'}
+
+SCHEMA_RENDERERS = {
+    'json': OpenApiJsonRenderer,
+    'yaml': OpenApiYamlRenderer,
+}
+
+_schema_lock = threading.Lock()
+_schema_artifacts = {}
+
+
+def schema_sources():
+    """Every .py file of the project's apps and the config package, in a stable order."""
+    roots = {Path(config.path) for config in apps.get_app_configs()
+             if Path(config.path).is_relative_to(settings.BASE_DIR)}
+    roots.add(Path(__file__).parent)
+    files = []
+    for root in sorted(roots):
+        files += [path for path in sorted(root.rglob('*.py'))
+                  if not SCHEMA_IGNORED.intersection(path.relative_to(root).parts)]
+    return files
+
+
+def schema_fingerprint():
+    """
+    Hash of the project's source (models, serializers, views, pagination, ...),
+    the installed package versions and SPECTACULAR_SETTINGS. Editing any of
+    them forces a rebuild.
+    """
+    digest = hashlib.sha256(repr(sorted(settings.SPECTACULAR_SETTINGS.items())).encode())
+    packages = sorted(f"{dist.metadata['Name']}=={dist.version}" for dist in metadata.distributions())
+    digest.update('\n'.join(packages).encode())
+    for path in schema_sources():
+        digest.update(str(path.relative_to(settings.BASE_DIR)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def build_schema_artifacts():
+    """Generate the schema once and pre-serialize it as JSON and YAML."""
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    schema = generator.get_schema(request=None, public=True)
+    artifacts = {}
+    for fmt, renderer_class in SCHEMA_RENDERERS.items():
+        content = renderer_class().render(schema, renderer_context={})
+        artifacts[fmt] = (content, f'"{hashlib.sha256(content).hexdigest()[:32]}"')
+    return artifacts
+
+
+def _artifact_path(fingerprint, fmt):
+    return settings.SCHEMA_CACHE_DIR / f'openapi-{fingerprint}.{fmt}'
+
+
+def write_schema_artifacts(fingerprint, artifacts):
+    """
+    Replace the cached files atomically: workers starting together may all
+    write, and a reader only ever sees a complete file or none.
+    """
+    settings.SCHEMA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    current = {_artifact_path(fingerprint, fmt) for fmt in artifacts}
+    for stale in settings.SCHEMA_CACHE_DIR.glob('openapi-*'):
+        if stale not in current:
+            stale.unlink(missing_ok=True)  # another worker may have got there first
+    for fmt, (content, _) in artifacts.items():
+        path = _artifact_path(fingerprint, fmt)
+        fd, tmp = tempfile.mkstemp(dir=settings.SCHEMA_CACHE_DIR, prefix=f'.{path.name}.')
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                fh.write(content)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+def read_schema_artifacts(fingerprint):
+    artifacts = {}
+    for fmt in SCHEMA_RENDERERS:
+        try:
+            content = _artifact_path(fingerprint, fmt).read_bytes()
+        except FileNotFoundError:
+            return None
+        artifacts[fmt] = (content, f'"{hashlib.sha256(content).hexdigest()[:32]}"')
+    return artifacts
+
+
+def get_schema_artifacts():
+    """
+    Return {format: (content, etag)}, building the schema at most once per
+    process. A file cache written by `manage.py build_schema` (or by the
+    first build) is reused across restarts while the fingerprint matches.
+    """
+    if _schema_artifacts:
+        return _schema_artifacts
+    with _schema_lock:
+        if not _schema_artifacts:
+            fingerprint = schema_fingerprint()
+            artifacts = read_schema_artifacts(fingerprint)
+            if artifacts is None:
+                artifacts = build_schema_artifacts()
+                write_schema_artifacts(fingerprint, artifacts)
+            _schema_artifacts.update(artifacts)
+    return _schema_artifacts
+
+
+class CachedSpectacularAPIView(SpectacularAPIView):
+    """
+    Serves the pre-serialized schema with a strong ETag.
+    Requests for a specific ?lang= or ?version= fall back to live generation.
+    """
+
+    def _get_schema_response(self, request):
+        if request.GET.get('lang') or request.GET.get('version'):
+            return super()._get_schema_response(request)
+
+        content, etag = get_schema_artifacts()[request.accepted_renderer.format]
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH', '')
+        if etag in (strip_encoding_suffix(tag.strip()) for tag in if_none_match.split(',')):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(content, content_type=request.accepted_media_type)
+            response['Content-Disposition'] = f'inline; filename="{self._get_filename(request, None)}"'
+        response['ETag'] = etag
+        response['Cache-Control'] = 'no-cache'
+        return response
@@ -0,0 +1,103 @@
+from decimal import Decimal
+from operator import itemgetter
+
+
+# ─── Value transforms (match the DRF field output they replace) ───────────
+
+def full_name(first_name, last_name):
+    """Same string as AbstractUser.get_full_name()."""
+    return f"{first_name} {last_name}".strip()
+
+
+def decimal_string(decimal_places):
+    """Same string as serializers.DecimalField(decimal_places=n) with COERCE_DECIMAL_TO_STRING."""
+    quantum = Decimal(1).scaleb(-decimal_places)
+
+    def transform(value):
+        if value is None:
+            return None
+        return '{:f}'.format(Decimal(value).quantize(quantum))
+    return transform
+
+
+def iso_datetime(value):
+    """Same string as serializers.DateTimeField() under USE_TZ with TIME_ZONE = 'UTC'."""
+    if value is None:
+        return None
+    value = value.isoformat()
+    return value[:-6] + 'Z' if value.endswith('+00:00') else value
+
+
+# ─── ValuesSerializer ──────────────────────────────────────────────────────
+
+class ValuesSerializer:
+    """
+    Read-only serializer for high-volume list endpoints.
+
+    Works on `.values_list()` tuples instead of model instances, so there is
+    no per-row model construction and no per-field DRF machinery. Subclasses
+    declare `fields` as (output_key, lookup) or (output_key, lookups, transform)
+    tuples; the lookup -> tuple index map is computed once per field subset.
+
+        rows = GradeValuesSerializer.project(queryset, fields)
+        data = GradeValuesSerializer(rows, fields).data
+
+    `fields` (optional) limits output to a subset of keys; only the columns
+    those keys need are selected, so unused joins disappear from the query.
+    """
+    fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.field_names = tuple(spec[0] for spec in cls.fields)
+        cls._plans = {}
+
+    @classmethod
+    def _plan(cls, fields=None):
+        """(lookups, builders) for a field subset, compiled once and reused."""
+        key = tuple(fields) if fields else cls.field_names
+        if key not in cls._plans:
+            lookups = []
+            builders = []
+            for spec in cls.fields:
+                name, sources = spec[0], spec[1]
+                if name not in key:
+                    continue
+                transform = spec[2] if len(spec) > 2 else None
+                if isinstance(sources, str):
+                    sources = (sources,)
+                indexes = []
+                for source in sources:
+                    if source not in lookups:
+                        lookups.append(source)
+                    indexes.append(lookups.index(source))
+                builders.append((name, cls._getter(indexes, transform)))
+            cls._plans[key] = (tuple(lookups), tuple(builders))
+        return cls._plans[key]
+
+    @staticmethod
+    def _getter(indexes, transform):
+        if transform is None:
+            return itemgetter(indexes[0])
+        if len(indexes) == 1:
+            index = indexes[0]
+            return lambda row: transform(row[index])
+        return lambda row: transform(*[row[i] for i in indexes])
+
+    @classmethod
+    def lookups_for(cls, fields=None):
+        return cls._plan(fields)[0]
+
+    def __init__(self, rows, fields=None):
+        self.rows = rows
+        self.requested_fields = fields
+
+    @classmethod
+    def project(cls, queryset, fields=None):
+        """Narrow a queryset to exactly the columns this serializer reads."""
+        return queryset.values_list(*cls.lookups_for(fields))
+
+    @property
+    def data(self):
+        builders = self._plan(self.requested_fields)[1]
+        return [{key: get(row) for key, get in builders} for row in self.rows]
@@ -55,7 +55,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'config.middleware.InstrumentationMiddleware',
+    'config.middleware.DeferredWritesMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'config.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -67,6 +70,19 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'config.urls'
 
+# ─── Response Compression ──────────────────────────────────────────────────
+# Server preference order; 'br' and 'zstd' are used only when the optional
+# brotli / zstandard packages are installed.
+COMPRESSION_ENCODINGS = ['br', 'zstd', 'gzip']
+COMPRESSION_MIN_SIZE = 1024  # bytes
+COMPRESSION_EXCLUDED_CONTENT_TYPES = [
+    'image/', 'video/', 'audio/',
+    'application/zip', 'application/gzip', 'application/x-7z-compressed',
+    # BREACH: HTML pages (admin, browsable API) carry CSRF tokens next to
+    # reflected input, so their compressed size would leak the token.
+    'text/html',
+]
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -84,6 +100,10 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'config.wsgi.application'
 
+# Serve the hottest read endpoints from academic.async_views (async ORM). Worth it only under an
+# ASGI server (config.asgi); under WSGI each request would pay for a private event loop.
+ASYNC_VIEWS = os.getenv('ASYNC_VIEWS', 'False').lower() == 'true'
+
 
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
@@ -91,16 +111,92 @@ WSGI_APPLICATION = 'config.wsgi.application'
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        # SQLITE_PATH points benchmarks at a separate database file.
+        'NAME': os.getenv('SQLITE_PATH', BASE_DIR / 'db.sqlite3'),
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+# Versioned keys (config.cache) are invalidated by bumping a counter in the default
+# cache, so every worker has to share it, e.g.
+# CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+# CACHE_LOCATION=redis://127.0.0.1:6379/1
+# The locmem default is per process, which is only right for a single process
+# (runserver, the tests). With locmem the cached schedules, scopes, dashboards and
+# login payloads below are kept for at most LOCAL_CACHE_TIMEOUT seconds, so a change
+# handled by another worker shows up within that.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'ums-default'),
+    },
+    # Token buckets for the auth endpoints (config.throttling). locmem limits each process on
+    # its own; with several workers use a shared backend, e.g.
+    # THROTTLE_CACHE_BACKEND=django.core.cache.backends.filebased.FileBasedCache
+    # THROTTLE_CACHE_LOCATION=/var/tmp/ums-throttle
+    'throttle': {
+        'BACKEND': os.getenv('THROTTLE_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('THROTTLE_CACHE_LOCATION', 'ums-throttle'),
+    },
+}
+THROTTLE_CACHE = 'throttle'
+
+SHARED_CACHE = not CACHES['default']['BACKEND'].endswith('.LocMemCache')
+LOCAL_CACHE_TIMEOUT = int(os.getenv('LOCAL_CACHE_TIMEOUT', '60'))
+
+
+def _cache_timeout(seconds):
+    return seconds if SHARED_CACHE else min(seconds, LOCAL_CACHE_TIMEOUT)
+
+
+SCHEDULE_CACHE_TIMEOUT = _cache_timeout(60 * 60 * 24)  # schedule keys also carry the date
+DASHBOARD_CACHE_TIMEOUT = _cache_timeout(60 * 60)  # versioned like the schedule keys; see academic.dashboard
+ACCESS_SCOPE_CACHE_TIMEOUT = _cache_timeout(60 * 60 * 24)  # per-user course id sets (academic.scope)
+LOGIN_PAYLOAD_CACHE_TIMEOUT = _cache_timeout(60 * 60 * 24)  # role/name/id in the login response (users.serializers)
+
+# Paginated list totals (config.counts): cached briefly, and taken from the
+# planner's statistics for unfiltered tables at least this large.
+COUNT_CACHE_TIMEOUT = int(os.getenv('COUNT_CACHE_TIMEOUT', '60'))
+COUNT_ESTIMATE_THRESHOLD = int(os.getenv('COUNT_ESTIMATE_THRESHOLD', '100000'))
+
+# How long a POST's response is kept for retries with the same Idempotency-Key.
+IDEMPOTENCY_KEY_TIMEOUT = 60 * 60 * 24
+
+# Grade sheet rows validated and upserted per batch (academic.grade_import).
+GRADE_IMPORT_CHUNK_SIZE = 2000
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
 AUTH_PASSWORD_VALIDATORS = []
 
+# PASSWORD_HASHER picks the hasher for new hashes: 'pbkdf2' (Django's default), 'scrypt'
+# or 'argon2' (needs argon2-cffi). The rest stay listed so existing hashes still verify
+# and are rehashed with the chosen one on the next login.
+_PASSWORD_HASHERS = {
+    'pbkdf2': 'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'pbkdf2_sha1': 'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'argon2': 'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'bcrypt_sha256': 'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'scrypt': 'django.contrib.auth.hashers.ScryptPasswordHasher',
+}
+_password_hasher = os.getenv('PASSWORD_HASHER', 'pbkdf2')
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[_password_hasher]] + [
+    path for name, path in _PASSWORD_HASHERS.items() if name != _password_hasher
+]
+
+# Accounts onboarded without a password share one precomputed hash of INITIAL_PASSWORD and
+# must set their own through the forgot-password flow before they can log in (users.onboarding).
+INITIAL_PASSWORD = os.getenv('INITIAL_PASSWORD', 'changeme123')
+# False restores the earlier flow: such accounts log in with INITIAL_PASSWORD as is.
+ONBOARDING_REQUIRE_PASSWORD_CHANGE = os.getenv('ONBOARDING_REQUIRE_PASSWORD_CHANGE', 'True').lower() == 'true'
+# Worker processes for hashing bulk-onboarded passwords; 0 means one per CPU.
+ONBOARDING_HASH_WORKERS = int(os.getenv('ONBOARDING_HASH_WORKERS', '0'))
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/6.0/topics/i18n/
@@ -120,11 +216,19 @@ USE_TZ = True
 STATIC_URL = 'static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+# Generated files (grade import error reports); served through authenticated views, not MEDIA_URL.
+MEDIA_ROOT = Path(os.getenv('MEDIA_ROOT', BASE_DIR / 'media'))
+
 # Custom User Model
 AUTH_USER_MODEL = 'users.User'
+# Loads the user with both profiles in the login lookup (users.backends).
+AUTHENTICATION_BACKENDS = ['users.backends.ProfileModelBackend']
 
 # CORS Settings
 CORS_ALLOW_ALL_ORIGINS = True
+from corsheaders.defaults import default_headers
+CORS_ALLOW_HEADERS = (*default_headers, 'if-match', 'idempotency-key')
+CORS_EXPOSE_HEADERS = ['ETag', 'Idempotent-Replayed']
 
 # REST Framework Configuration
 REST_FRAMEWORK = {
@@ -138,6 +242,16 @@ REST_FRAMEWORK = {
         'config.renderers.CustomJSONRenderer',
     ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    # Token buckets per IP and per email for the auth views (config.throttling).
+    'DEFAULT_THROTTLE_RATES': {
+        'login': '10/min',
+        'otp_send': '5/hour',
+        'otp_check': '10/min',
+    },
+    # Reverse proxies in front of the app. The per-IP buckets take the client address from
+    # X-Forwarded-For only this many hops deep; 0 uses REMOTE_ADDR, so a client can't dodge
+    # the limit by sending its own X-Forwarded-For. Set to 1 behind a single proxy.
+    'NUM_PROXIES': int(os.getenv('NUM_PROXIES', '0')),
 }
 
 SPECTACULAR_SETTINGS = {
@@ -151,6 +265,47 @@ SPECTACULAR_SETTINGS = {
     ],
 }
 
+# ─── Instrumentation (see config.metrics) ─────────────────────────────────
+# Server-Timing exposes per-request DB time and query counts to the client: on with DEBUG only.
+SERVER_TIMING = os.getenv('SERVER_TIMING', str(DEBUG)).lower() == 'true'
+# Scrapers of /api/ops/metrics/ send this in an X-Ops-Token header; empty means admins only.
+OPS_METRICS_TOKEN = os.getenv('OPS_METRICS_TOKEN', '')
+# Max SQL queries per request, by 'ViewClass.METHOD' or 'ViewClass'. Over-budget requests are
+# logged ('log') or raise QueryBudgetExceeded ('raise', used by the tests).
+QUERY_BUDGET_DEFAULT = 10
+QUERY_BUDGETS = {
+    # Paginated lists: +1 on a cold cache for the planner's row estimate (config.counts).
+    'CourseListCreateView.GET': 5,
+    'CourseDetailView.GET': 4,
+    'EnrollmentListCreateView.GET': 5,
+    'GradeListView.GET': 4,
+    'AcademicRecordsView.GET': 5,
+    'StudentListCreateView.GET': 5,
+    'FacultyListCreateView.GET': 5,
+    'ScheduleTodayView.GET': 4,
+    'ScheduleWeekView.GET': 4,
+    'AdminDashboardStatsView.GET': 5,
+    'FacultyDashboardStatsView.GET': 5,
+    'StudentDashboardStatsView.GET': 5,
+    # Upsert + version bump + GPA recalculation, plus the previous grades for the audit log.
+    'BulkGradeCreateView.POST': 14,
+    # Per GRADE_IMPORT_CHUNK_SIZE rows; a single-chunk sheet needs about as many as bulk.
+    'GradeImportView.POST': 14,
+    # With "archive": the transition, then per archive table a DELETE of the rows being
+    # replaced, one INSERT ... SELECT and one DELETE from the hot table; all in one
+    # transaction, so the two steps' own atomic blocks become savepoints.
+    'EnrollmentStatusTransitionView.POST': 18,
+    # Deleting a profile also deletes its user and everything that cascades from both
+    # (archived enrollments and grades included).
+    'CourseDetailView.DELETE': 12,
+    'StudentDetailView.DELETE': 17,
+    'FacultyDetailView.DELETE': 16,
+}
+QUERY_BUDGET_ACTION = os.getenv('QUERY_BUDGET_ACTION', 'log')
+
+# Pre-serialized schema cache (see config.schema / manage.py build_schema)
+SCHEMA_CACHE_DIR = BASE_DIR / '.schema_cache'
+
 from datetime import timedelta
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
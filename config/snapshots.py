@@ -0,0 +1,99 @@
+"""
+Database snapshots for fast test and benchmark setup.
+
+save_snapshot() copies the live SQLite database page by page with SQLite's
+online backup API and compresses the copy; restore_snapshot() decompresses
+it and backs it up over the live database, which is much faster than
+migrate + seed for large fixtures. The codec follows the file extension:
+.zst (needs zstandard), .gz, or anything else for an uncompressed copy.
+"""
+import gzip
+import os
+import shutil
+import sqlite3
+import tempfile
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+try:
+    import zstandard
+except ImportError:  # Optional: pip install zstandard
+    zstandard = None
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def _sqlite_connection(alias):
+    connection = connections[alias]
+    if connection.vendor != 'sqlite':
+        raise SnapshotError(
+            f"Snapshots use SQLite's backup API; the '{alias}' database is "
+            f"{connection.vendor}. Use its native dump/restore tools instead."
+        )
+    if connection.in_atomic_block:
+        # The backup would wait forever on the transaction's own lock.
+        raise SnapshotError('Snapshots cannot be taken or restored inside a transaction.')
+    connection.ensure_connection()
+    return connection.connection
+
+
+def _open(path, mode):
+    if path.endswith('.zst'):
+        if zstandard is None:
+            raise SnapshotError('.zst snapshots need the zstandard package.')
+        if 'w' in mode:
+            return zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(open(path, 'wb'))
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'))
+    if path.endswith('.gz'):
+        # Level 1: several times faster than the default for ~10% more bytes.
+        return gzip.open(path, mode, compresslevel=1) if 'w' in mode else gzip.open(path, mode)
+    return open(path, mode)
+
+
+def save_snapshot(path, alias=DEFAULT_DB_ALIAS):
+    """Write a compressed copy of the database to `path`; returns its size in bytes."""
+    source = _sqlite_connection(alias)
+    with tempfile.TemporaryDirectory() as tmp:
+        copy_path = os.path.join(tmp, 'snapshot.sqlite3')
+        copy = sqlite3.connect(copy_path)
+        try:
+            source.backup(copy)
+        finally:
+            copy.close()
+        with open(copy_path, 'rb') as src, _open(path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+    return os.path.getsize(path)
+
+
+def restore_snapshot(path, alias=DEFAULT_DB_ALIAS):
+    """Replace the database's contents with the snapshot at `path`."""
+    if not os.path.exists(path):
+        raise SnapshotError(f'Snapshot {path} does not exist.')
+    target = _sqlite_connection(alias)
+    with tempfile.TemporaryDirectory() as tmp:
+        copy_path = os.path.join(tmp, 'snapshot.sqlite3')
+        with _open(path, 'rb') as src, open(copy_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+        copy = sqlite3.connect(copy_path)
+        try:
+            if copy.execute('PRAGMA quick_check').fetchone()[0] != 'ok':
+                raise SnapshotError(f'Snapshot {path} is corrupt.')
+            copy.backup(target)
+        finally:
+            copy.close()
+    # Cached pages and versioned keys describe the old data.
+    cache.clear()
+
+
+def unapplied_migrations(alias=DEFAULT_DB_ALIAS):
+    """Migrations the restored database is missing, as 'app.name' strings."""
+    from django.db.migrations.executor import MigrationExecutor
+
+    executor = MigrationExecutor(connections[alias])
+    plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+    return [f'{migration.app_label}.{migration.name}' for migration, _ in plan]
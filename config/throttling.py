@@ -0,0 +1,69 @@
+"""
+Token-bucket throttling for the unauthenticated auth endpoints.
+
+Views opt in with a `throttle_scope`, as with DRF's ScopedRateThrottle:
+
+    class ForgotPasswordView(generics.GenericAPIView):
+        throttle_classes = [TokenBucketThrottle]
+        throttle_scope = 'otp_send'
+
+Each scope keeps one bucket per client IP and one per submitted email
+address; a request spends a token from both, so neither spraying emails
+from one address nor hammering one account from many addresses gets
+through. REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] gives each scope its
+size and refill rate: '5/min' holds 5 tokens and returns one every 12s.
+
+A check is one get_many() and at most one set_many() on the THROTTLE_CACHE
+cache, however busy the bucket: locmem for a single process, a file or
+database cache (THROTTLE_CACHE_BACKEND) when several workers share the
+limits. The read-modify-write isn't atomic across processes, so requests
+racing on one bucket may get a token or two over the rate.
+"""
+import hashlib
+import math
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.throttling import ScopedRateThrottle
+
+
+class TokenBucketThrottle(ScopedRateThrottle):
+
+    def allow_request(self, request, view):
+        self.scope = getattr(view, self.scope_attr, None)
+        if not self.scope:
+            return True
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        if self.rate is None:
+            return True
+
+        store = caches[settings.THROTTLE_CACHE]
+        keys = self.get_bucket_keys(request)
+        buckets = store.get_many(keys)
+        now = self.timer()
+        refill = self.num_requests / self.duration
+        levels = {}
+        for key in keys:
+            # Missing or expired: untouched for a whole period, so full.
+            tokens, stamp = buckets.get(key, (self.num_requests, now))
+            levels[key] = min(self.num_requests, tokens + (now - stamp) * refill)
+
+        empty = [tokens for tokens in levels.values() if tokens < 1]
+        if empty:
+            self.retry_after = max((1 - tokens) / refill for tokens in empty)
+            return False
+        store.set_many({key: (tokens - 1, now) for key, tokens in levels.items()},
+                       timeout=math.ceil(self.duration))
+        return True
+
+    def get_bucket_keys(self, request):
+        keys = [f'throttle:{self.scope}:ip:{self.get_ident(request)}']
+        email = request.data.get('email') if hasattr(request.data, 'get') else None
+        if isinstance(email, str) and email.strip():
+            digest = hashlib.md5(email.strip().lower().encode()).hexdigest()
+            keys.append(f'throttle:{self.scope}:email:{digest}')
+        return keys
+
+    def wait(self):
+        return self.retry_after
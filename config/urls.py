@@ -1,15 +1,20 @@
 """
 URL configuration for config project.
 """
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
-from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
+from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
+
+from config.views import MetricsView
+from config.schema import CachedSpectacularAPIView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
+    path('api/schema/', CachedSpectacularAPIView.as_view(), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
+    path('api/ops/metrics/', MetricsView.as_view(), name='ops-metrics'),
     path('api/', include('users.urls')),
     path('api/academic/', include('academic.urls')),
 ]
@@ -20,10 +25,22 @@ from academic.views import (
     AdminDashboardStatsView,
     FacultyDashboardStatsView,
     StudentDashboardStatsView,
+    DashboardBootstrapView,
 )
 
+if settings.ASYNC_VIEWS:
+    from academic.async_views import (  # noqa: F811
+        AdminDashboardStatsView,
+        FacultyDashboardStatsView,
+        StudentDashboardStatsView,
+    )
+
 urlpatterns += [
     path('api/dashboard/admin/stats/', AdminDashboardStatsView.as_view(), name='admin-dashboard-stats'),
     path('api/dashboard/faculty/stats/', FacultyDashboardStatsView.as_view(), name='faculty-dashboard-stats'),
     path('api/dashboard/student/stats/', StudentDashboardStatsView.as_view(), name='student-dashboard-stats'),
+    # Every widget's payload in one cached response, for the first load after login.
+    path('api/dashboard/admin/bootstrap/', DashboardBootstrapView.as_view(role='admin'), name='admin-dashboard-bootstrap'),
+    path('api/dashboard/faculty/bootstrap/', DashboardBootstrapView.as_view(role='faculty'), name='faculty-dashboard-bootstrap'),
+    path('api/dashboard/student/bootstrap/', DashboardBootstrapView.as_view(role='student'), name='student-dashboard-bootstrap'),
 ]
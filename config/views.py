@@ -0,0 +1,34 @@
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework.permissions import BasePermission
+from rest_framework.views import APIView
+
+from config.metrics import registry
+
+
+class IsOpsClient(BasePermission):
+    """
+    Scrapers sending OPS_METRICS_TOKEN as X-Ops-Token, or any logged-in admin.
+    Not the client address: behind a local reverse proxy every request comes
+    from 127.0.0.1.
+    """
+
+    def has_permission(self, request, view):
+        token = request.headers.get('X-Ops-Token', '')
+        if settings.OPS_METRICS_TOKEN and hmac.compare_digest(token.encode(), settings.OPS_METRICS_TOKEN.encode()):
+            return True
+        user = request.user
+        return bool(user and user.is_authenticated and (user.role == 'admin' or user.is_superuser))
+
+
+class MetricsView(APIView):
+    """GET /api/ops/metrics/ — per-view request metrics in Prometheus text format."""
+    permission_classes = [IsOpsClient]
+
+    def get(self, request):
+        return HttpResponse(
+            registry.render_prometheus(),
+            content_type='text/plain; version=0.0.4; charset=utf-8',
+        )
@@ -0,0 +1,40 @@
+"""
+Authentication backend that loads the user together with both profiles.
+
+Login builds its payload from `student_profile` / `faculty_profile`; with
+Django's ModelBackend each of those is another query after the user lookup.
+"""
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+PROFILES = ('student_profile', 'faculty_profile')
+
+
+class ProfileModelBackend(ModelBackend):
+    """ModelBackend whose user lookups select_related() the student and faculty profiles."""
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        UserModel = get_user_model()
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = UserModel._default_manager.select_related(*PROFILES).get(
+                **{UserModel.USERNAME_FIELD: username}
+            )
+        except UserModel.DoesNotExist:
+            # Run the hasher anyway so unknown emails take as long as wrong passwords.
+            UserModel().set_password(password)
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
+
+    def get_user(self, user_id):
+        UserModel = get_user_model()
+        try:
+            user = UserModel._default_manager.select_related(*PROFILES).get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
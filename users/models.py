@@ -1,8 +1,13 @@
 from django.db import models
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.contrib.auth.models import AbstractUser
 from django.utils import timezone
 from datetime import timedelta
 
+from config.cache import bump_version
+from config.counts import invalidate_counts
+
 
 class User(AbstractUser):
     ROLE_CHOICES = (
@@ -12,6 +17,8 @@ class User(AbstractUser):
     )
     email = models.EmailField(unique=True)
     role = models.CharField(max_length=10, choices=ROLE_CHOICES, default='student')
+    # Set for accounts onboarded with the shared initial password (users.onboarding).
+    must_change_password = models.BooleanField(default=False)
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']
@@ -65,3 +72,36 @@ class PasswordResetOTP(models.Model):
 
     def __str__(self):
         return f"OTP for {self.user.email} - {'Used' if self.is_used else 'Active'}"
+
+
+# ─── Paginated count invalidation (see config.counts) ─────────────────────
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=Student)
+@receiver(post_save, sender=Faculty)
+@receiver(post_delete, sender=Faculty)
+def invalidate_user_counts(sender, update_fields=None, **kwargs):
+    # Login sirf last_login save kore; tate kono list er count bodlay na.
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    invalidate_counts(sender)
+
+
+# ─── Login payload invalidation (see users.serializers) ───────────────────
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_login_payload(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= {'last_login', 'password'}:
+        return
+    bump_version(f'login:{instance.pk}')
+
+
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=Student)
+@receiver(post_save, sender=Faculty)
+@receiver(post_delete, sender=Faculty)
+def invalidate_profile_login_payload(sender, instance, **kwargs):
+    bump_version(f'login:{instance.user_id}')
@@ -0,0 +1,84 @@
+"""
+Password hashing for account onboarding.
+
+Hashing is the slowest step of creating an account: the configured hasher
+(PASSWORD_HASHER) is tuned to cost tens to hundreds of ms per password.
+Onboarding keeps that off the per-account path:
+  - accounts created without a password share one precomputed hash of
+    INITIAL_PASSWORD and are flagged must_change_password, so login refuses
+    them until the owner sets a password through the forgot-password flow
+    (unless ONBOARDING_REQUIRE_PASSWORD_CHANGE is off);
+  - bulk paths hash each distinct password once, spread over a process pool.
+Used by the student/faculty create endpoints (single and bulk) and the seeder.
+
+The pool is started once per process, on first use, and reused by later
+requests. Its workers are spawned rather than forked, so they don't
+inherit the server's open database connections or other state, and
+django.setup() runs in each before it hashes anything.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, make_password
+from django.utils.module_loading import import_string
+
+from .models import User
+
+# Below this many distinct passwords a pool costs more to start than it saves.
+POOL_MIN_PASSWORDS = 4
+
+_initial_hashes = {}
+_pools = {}
+
+
+def initial_password_hash():
+    """The shared hash of INITIAL_PASSWORD, computed once per process and hasher."""
+    key = (settings.INITIAL_PASSWORD, get_hasher().algorithm)
+    if key not in _initial_hashes:
+        _initial_hashes[key] = make_password(settings.INITIAL_PASSWORD)
+    return _initial_hashes[key]
+
+
+def _hash(raw, hasher_path):
+    return make_password(raw, hasher=import_string(hasher_path)())
+
+
+def _pool(workers):
+    """The process-wide hashing pool with `workers` processes, started on first use."""
+    if workers not in _pools:
+        _pools[workers] = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context('spawn'), initializer=django.setup,
+        )
+    return _pools[workers]
+
+
+def hash_passwords(raw_passwords, workers=None):
+    """{raw: hash} for each distinct password, hashed in `workers` processes."""
+    distinct = list(dict.fromkeys(raw_passwords))
+    # The hasher class itself, not its algorithm name: workers only see the settings module.
+    hasher = type(get_hasher())
+    hasher_path = f'{hasher.__module__}.{hasher.__qualname__}'
+    workers = min(workers or settings.ONBOARDING_HASH_WORKERS or os.cpu_count() or 1, len(distinct))
+    if workers < 2 or len(distinct) < POOL_MIN_PASSWORDS:
+        return {raw: _hash(raw, hasher_path) for raw in distinct}
+    hashes = _pool(workers).map(_hash, distinct, [hasher_path] * len(distinct),
+                                chunksize=max(1, len(distinct) // (workers * 4)))
+    return dict(zip(distinct, hashes))
+
+
+def new_user(email, name, role, password_hash=None):
+    """
+    An unsaved User for `email`. Without `password_hash` it gets the shared
+    initial password and, with ONBOARDING_REQUIRE_PASSWORD_CHANGE on, has
+    to change it before logging in.
+    """
+    first_name, _, last_name = name.partition(' ')
+    email = User.objects.normalize_email(email)
+    return User(
+        username=email, email=email, first_name=first_name, last_name=last_name, role=role,
+        password=password_hash or initial_password_hash(),
+        must_change_password=password_hash is None and settings.ONBOARDING_REQUIRE_PASSWORD_CHANGE,
+    )
@@ -1,9 +1,20 @@
+from collections import Counter
+
 from rest_framework import serializers
+from rest_framework.exceptions import PermissionDenied
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework_simplejwt.tokens import RefreshToken, TokenError
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.db import transaction
 
 from .models import Student, Faculty, PasswordResetOTP
+from .onboarding import hash_passwords, new_user
+from config.cache import versioned_key
+from config.counts import invalidate_counts
+from config.serializers import ValuesSerializer, full_name
 
 User = get_user_model()
 
@@ -12,9 +23,28 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     """Returns JWT tokens + user info matching frontend LoginPage expectations."""
     # Login er somy user er details ew pass kora hocche.
 
+    @classmethod
+    def get_token(cls, user):
+        # Runs after the password check, before any token is issued or last_login is touched.
+        # Onboarded with the shared initial password: set a real one first.
+        if user.must_change_password:
+            raise PermissionDenied(
+                'Please set a new password with "Forgot password" before logging in.'
+            )
+        return super().get_token(user)
+
     def validate(self, attrs):
         data = super().validate(attrs)
-        user = self.user
+        data['user'] = self.get_user_data(self.user)
+        return data
+
+    @staticmethod
+    def get_user_data(user):
+        # Cached per user; saving the user or its profile bumps login:<pk> (users.models).
+        key = versioned_key('login', [f'login:{user.pk}'], user.pk)
+        user_data = cache.get(key)
+        if user_data is not None:
+            return user_data
 
         # Superuser hole role 'admin' set kora hocche, regardless of DB value.
         role = 'admin' if user.is_superuser else user.role
@@ -34,8 +64,8 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         elif role == 'admin':
             user_data['id'] = f"ADM{user.pk:03d}"
 
-        data['user'] = user_data
-        return data
+        cache.set(key, user_data, settings.LOGIN_PAYLOAD_CACHE_TIMEOUT)
+        return user_data
 
 
 class LogoutSerializer(serializers.Serializer):
@@ -124,19 +154,122 @@ class ResetPasswordSerializer(serializers.Serializer):
         user = self.validated_data['user']
         otp_obj = self.validated_data['otp_obj']
         user.set_password(self.validated_data['new_password'])
+        user.must_change_password = False
         user.save()
         otp_obj.is_used = True
         otp_obj.save()
 
 
+# ─── Account onboarding ────────────────────────────────────────────────────
+
+class OnboardingListSerializer(serializers.ListSerializer):
+    """
+    Creates many accounts at once: each distinct password is hashed once in
+    a process pool (users.onboarding), then users and profiles are written
+    with one bulk_create each.
+    """
+
+    def validate(self, attrs):
+        # The whole batch at once: a repeated or taken email / id would
+        # otherwise only fail in bulk_create, as an IntegrityError.
+        conflicts = self.child.conflicts(attrs)
+        if conflicts:
+            raise serializers.ValidationError(conflicts)
+        return attrs
+
+    def create(self, validated_data):
+        profile_model = self.child.profile_model
+        hashes = hash_passwords(row['password'] for row in validated_data if row.get('password'))
+        users = [
+            new_user(row['email'], row['name'], self.child.role, hashes.get(row.get('password')))
+            for row in validated_data
+        ]
+        with transaction.atomic():
+            User.objects.bulk_create(users)
+            profiles = profile_model.objects.bulk_create([
+                profile_model(user=user, **self.child.profile_fields(row))
+                for user, row in zip(users, validated_data)
+            ])
+        # bulk_create sends no post_save.
+        invalidate_counts(User, profile_model)
+        return profiles
+
+
+class OnboardingSerializer(serializers.Serializer):
+    """
+    Base for the flat account payloads: creates the User and its `profile_model`
+    row. A list payload goes through OnboardingListSerializer. Subclasses set
+    `role`, `profile_model` and `profile_field_map` ({payload field: profile
+    model field}).
+    """
+    role = None
+    profile_model = None
+    profile_field_map = {}
+    id_field = None  # the profile's unique id in the payload, e.g. 'student_id'
+
+    class Meta:
+        list_serializer_class = OnboardingListSerializer
+
+    def conflicts(self, rows, instance=None):
+        """
+        {field: [message]} for emails and ids repeated within `rows` or
+        already used by another account (one query each).
+        """
+        values = {
+            'email': [User.objects.normalize_email(row['email']) for row in rows if 'email' in row],
+            self.id_field: [row[self.id_field] for row in rows if self.id_field in row],
+        }
+        taken = {
+            'email': User.objects.filter(email__in=values['email']),
+            self.id_field: self.profile_model.objects.filter(**{f'{self.id_field}__in': values[self.id_field]}),
+        }
+        if instance is not None:
+            taken = {'email': taken['email'].exclude(pk=instance.user_id),
+                     self.id_field: taken[self.id_field].exclude(pk=instance.pk)}
+        errors = {}
+        for field, given in values.items():
+            repeated = sorted(value for value, count in Counter(given).items() if count > 1)
+            if repeated:
+                errors.setdefault(field, []).append(f"Repeated in this request: {', '.join(repeated)}.")
+            existing = sorted(taken[field].values_list(field, flat=True)) if given else []
+            if existing:
+                errors.setdefault(field, []).append(f"Already in use: {', '.join(existing)}.")
+        return errors
+
+    def validate(self, attrs):
+        # Rows of a list payload are checked together by OnboardingListSerializer.
+        if not isinstance(self.parent, OnboardingListSerializer):
+            conflicts = self.conflicts([attrs], self.instance)
+            if conflicts:
+                raise serializers.ValidationError(conflicts)
+        return attrs
+
+    def profile_fields(self, validated_data):
+        """The profile model's fields from a validated payload."""
+        return {field: validated_data[key] for key, field in self.profile_field_map.items()}
+
+    def create(self, validated_data):
+        password = validated_data.get('password')
+        user = new_user(validated_data['email'], validated_data['name'], self.role,
+                        make_password(password) if password else None)
+        user.save()
+        return self.profile_model.objects.create(user=user, **self.profile_fields(validated_data))
+
+
 # ─── Student Serializer (flat payload matching ManageStudents.jsx) ─────────
 
-class StudentSerializer(serializers.Serializer):
+class StudentSerializer(OnboardingSerializer):
     """
     Accepts flat payload from frontend:
     { student_id, name, email, password, major, year, gpa }
-    Creates/updates both User and Student records.
+    Creates/updates both User and Student records. Without a password the
+    account gets the shared initial one and must change it (users.onboarding).
     """
+    role = 'student'
+    profile_model = Student
+    id_field = 'student_id'
+    profile_field_map = {'student_id': 'student_id', 'major': 'major', 'year': 'year', 'gpa': 'current_gpa'}
+
     student_id = serializers.CharField(max_length=20)
     name = serializers.CharField(max_length=150)
     email = serializers.EmailField()
@@ -145,29 +278,6 @@ class StudentSerializer(serializers.Serializer):
     year = serializers.ChoiceField(choices=['1st', '2nd', '3rd', '4th'])
     gpa = serializers.DecimalField(max_digits=4, decimal_places=2)
 
-    def create(self, validated_data):
-        name = validated_data['name']
-        parts = name.split(' ', 1)
-        first_name = parts[0]
-        last_name = parts[1] if len(parts) > 1 else ''
-
-        user = User.objects.create_user(
-            username=validated_data['email'],
-            email=validated_data['email'],
-            password=validated_data.get('password', 'changeme123'),
-            first_name=first_name,
-            last_name=last_name,
-            role='student',
-        )
-        student = Student.objects.create(
-            user=user,
-            student_id=validated_data['student_id'],
-            major=validated_data['major'],
-            year=validated_data['year'],
-            current_gpa=validated_data['gpa'],
-        )
-        return student
-
     def update(self, instance, validated_data):
         name = validated_data.get('name', instance.user.get_full_name())
         parts = name.split(' ', 1)
@@ -197,12 +307,21 @@ class StudentSerializer(serializers.Serializer):
 
 # ─── Faculty Serializer (flat payload matching ManageFaculty.jsx) ──────────
 
-class FacultySerializer(serializers.Serializer):
+class FacultySerializer(OnboardingSerializer):
     """
     Accepts flat payload from frontend:
     { faculty_id, name, email, password, department, specialization, join_date }
-    Creates/updates both User and Faculty records.
+    Creates/updates both User and Faculty records. Without a password the
+    account gets the shared initial one and must change it (users.onboarding).
     """
+    role = 'faculty'
+    profile_model = Faculty
+    id_field = 'faculty_id'
+    profile_field_map = {
+        'faculty_id': 'faculty_id', 'department': 'department',
+        'specialization': 'specialization', 'join_date': 'join_date',
+    }
+
     faculty_id = serializers.CharField(max_length=20)
     name = serializers.CharField(max_length=150)
     email = serializers.EmailField()
@@ -211,29 +330,6 @@ class FacultySerializer(serializers.Serializer):
     specialization = serializers.CharField(max_length=200)
     join_date = serializers.DateField()
 
-    def create(self, validated_data):
-        name = validated_data['name']
-        parts = name.split(' ', 1)
-        first_name = parts[0]
-        last_name = parts[1] if len(parts) > 1 else ''
-
-        user = User.objects.create_user(
-            username=validated_data['email'],
-            email=validated_data['email'],
-            password=validated_data.get('password', 'changeme123'),
-            first_name=first_name,
-            last_name=last_name,
-            role='faculty',
-        )
-        faculty = Faculty.objects.create(
-            user=user,
-            faculty_id=validated_data['faculty_id'],
-            department=validated_data['department'],
-            specialization=validated_data['specialization'],
-            join_date=validated_data['join_date'],
-        )
-        return faculty
-
     def update(self, instance, validated_data):
         name = validated_data.get('name', instance.user.get_full_name())
         parts = name.split(' ', 1)
@@ -259,3 +355,27 @@ class FacultySerializer(serializers.Serializer):
             'specialization': instance.specialization,
             'join_date': str(instance.join_date),
         }
+
+
+# ─── Read-only list serializers (values_list rows, same JSON as above) ─────
+
+class StudentValuesSerializer(ValuesSerializer):
+    fields = (
+        ('student_id', 'student_id'),
+        ('name', ('user__first_name', 'user__last_name'), full_name),
+        ('email', 'user__email'),
+        ('major', 'major'),
+        ('year', 'year'),
+        ('gpa', 'current_gpa', str),
+    )
+
+
+class FacultyValuesSerializer(ValuesSerializer):
+    fields = (
+        ('faculty_id', 'faculty_id'),
+        ('name', ('user__first_name', 'user__last_name'), full_name),
+        ('email', 'user__email'),
+        ('department', 'department'),
+        ('specialization', 'specialization'),
+        ('join_date', 'join_date', str),
+    )
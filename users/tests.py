@@ -1,3 +1,272 @@
-from django.test import TestCase
+import datetime
+import time
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.core import mail
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from academic.tests.base import N, PASSWORD, QueryCountTestCase
+from config.throttling import TokenBucketThrottle
+from users import urls as users_urls
+from users.models import Faculty, PasswordResetOTP, Student, User
+from users.onboarding import hash_passwords
+from users.serializers import (
+    FacultySerializer, FacultyValuesSerializer, StudentSerializer, StudentValuesSerializer,
+)
+
+
+class UsersQueryCountTests(QueryCountTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.refresh = str(RefreshToken.for_user(self.student.user))
+        PasswordResetOTP.objects.create(user=self.student.user, otp='1234')
+
+    def endpoint_calls(self):
+        email = self.student.user.email
+        student = {
+            'student_id': 'NEW001', 'name': 'New Student', 'email': 'new.student@test.edu',
+            'password': PASSWORD, 'major': 'CSE', 'year': '1st', 'gpa': '0.00',
+        }
+        faculty = {
+            'faculty_id': 'NEWF01', 'name': 'New Faculty', 'email': 'new.faculty@test.edu',
+            'password': PASSWORD, 'department': 'CSE', 'specialization': 'Networks',
+            'join_date': '2024-01-01',
+        }
+        student_url = reverse('student-detail', args=['S00000'])
+        faculty_url = reverse('faculty-detail', args=['F00000'])
+        return [
+            *self.reads(reverse('student-list-create') + '?page_size=100', 'admin'),
+            *self.reads(reverse('student-list-create') + '?cursor=', 'admin'),
+            *self.reads(reverse('faculty-list-create') + '?page_size=100', 'admin'),
+            *self.reads(student_url, 'admin'),
+            *self.reads(faculty_url, 'admin'),
+            ('admin', 'POST', reverse('student-list-create'), student, 201),
+            ('admin', 'POST', reverse('student-list-create'), [
+                {**student, 'student_id': 'NEW002', 'email': 'new2@test.edu'},
+                {**student, 'student_id': 'NEW003', 'email': 'new3@test.edu', 'password': 'other123'},
+            ], 201),
+            ('admin', 'PUT', student_url, {**student, 'student_id': 'S00000'}, 200),
+            ('admin', 'DELETE', student_url, None, 200),
+            ('admin', 'POST', reverse('faculty-list-create'), faculty, 201),
+            ('admin', 'PUT', faculty_url, {**faculty, 'faculty_id': 'F00000'}, 200),
+            ('admin', 'DELETE', faculty_url, None, 200),
+            (None, 'POST', reverse('token_obtain_pair'), {'email': email, 'password': PASSWORD}, 200),
+            (None, 'POST', reverse('token_refresh'), {'refresh': self.refresh}, 200),
+            ('student', 'POST', reverse('auth_logout'), {'refresh': self.refresh}, 200),
+            (None, 'POST', reverse('forgot_password'), {'email': email}, 200),
+            (None, 'POST', reverse('verify_otp'), {'email': email, 'otp': '1234'}, 200),
+            (None, 'POST', reverse('reset_password'),
+             {'email': email, 'otp': '1234', 'new_password': 'changed123'}, 200),
+        ]
+
+    def test_query_counts_do_not_grow_with_data(self):
+        self.assertQueriesConstant()
+
+    def test_every_route_is_checked(self):
+        self.assertRoutesCovered(pattern.name for pattern in users_urls.urlpatterns)
+
+
+class CachedCountTests(QueryCountTestCase):
+
+    def get_list(self, query=''):
+        with CaptureQueriesContext(connection) as ctx:
+            body = self.client.get(reverse('student-list-create') + query, **self.headers['admin']).json()
+        return body['pagination'], len(ctx)
+
+    def test_count_is_cached_until_students_change(self):
+        cache.clear()
+        first, cold = self.get_list('?search=S0')
+        second, warm = self.get_list('?search=S0&page_size=1&page=2')
+        self.assertEqual((first['count'], first['count_exact']), (N, True))
+        self.assertEqual(second['count'], N)
+        self.assertEqual(warm, cold - 1)
+
+        Student.objects.create(
+            user=User.objects.create(username='late', email='late@test.edu', role='student'),
+            student_id='S09999', major='CSE', year='1st',
+        )
+        self.assertEqual(self.get_list('?search=S0')[0]['count'], N + 1)
+
+    @override_settings(COUNT_ESTIMATE_THRESHOLD=1)
+    def test_unfiltered_count_uses_planner_estimate(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        cache.clear()
+        pagination, _ = self.get_list()
+        self.assertFalse(pagination['count_exact'])
+        exact, _ = self.get_list('?count=exact')
+        self.assertTrue(exact['count_exact'])
+        self.assertEqual(exact['count'], Student.objects.count())
+
+
+class OnboardingTests(QueryCountTestCase):
+
+    def login(self, email, password):
+        return self.client.post(reverse('token_obtain_pair'), {'email': email, 'password': password},
+                                content_type='application/json')
+
+    def test_bulk_onboarding_and_initial_password_reset(self):
+        rows = [
+            {'faculty_id': f'BULK{i}', 'name': f'Bulk Faculty{i}', 'email': f'bulk{i}@test.edu',
+             'department': 'CSE', 'specialization': 'Networks', 'join_date': '2024-01-01'}
+            for i in range(3)
+        ]
+        rows[0]['password'] = PASSWORD
+        response = self.client.post(reverse('faculty-list-create'), rows, content_type='application/json',
+                                    **self.headers['admin'])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([row['faculty_id'] for row in response.json()['data']], ['BULK0', 'BULK1', 'BULK2'])
+        self.assertEqual(self.login('bulk0@test.edu', PASSWORD).status_code, 200)
+
+        # No password: the shared initial hash, refused until reset.
+        shared = User.objects.filter(email__in=['bulk1@test.edu', 'bulk2@test.edu'])
+        self.assertEqual({(user.password, user.must_change_password) for user in shared},
+                         {(shared[0].password, True)})
+        tokens = OutstandingToken.objects.count()
+        self.assertEqual(self.login('bulk1@test.edu', 'changeme123').status_code, 403)
+        self.assertEqual(OutstandingToken.objects.count(), tokens)
+        PasswordResetOTP.objects.create(user=shared[0], otp='4321')
+        self.client.post(reverse('reset_password'),
+                         {'email': 'bulk1@test.edu', 'otp': '4321', 'new_password': 'mine1234'},
+                         content_type='application/json')
+        self.assertEqual(self.login('bulk1@test.edu', 'mine1234').status_code, 200)
+
+        # The earlier flow: the initial password logs in as is.
+        with self.settings(ONBOARDING_REQUIRE_PASSWORD_CHANGE=False):
+            response = self.client.post(reverse('student-list-create'), {
+                'student_id': 'OLD1', 'name': 'Old Flow', 'email': 'old1@test.edu',
+                'major': 'CSE', 'year': '1st', 'gpa': '0.00',
+            }, content_type='application/json', **self.headers['admin'])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.login('old1@test.edu', 'changeme123').status_code, 200)
+
+    def test_repeated_or_taken_emails_and_ids_are_rejected(self):
+        row = lambda i, **extra: {'student_id': f'DUP{i}', 'name': f'Dup Student{i}', 'email': f'dup{i}@test.edu',
+                                  'major': 'CSE', 'year': '1st', 'gpa': '0.00', **extra}
+        url = reverse('student-list-create')
+        post = lambda data: self.client.post(url, data, content_type='application/json', **self.headers['admin'])
+        before = Student.objects.count()
+
+        response = post([row(0), row(1, email='dup0@test.edu'), row(2, student_id='DUP0')])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('dup0@test.edu', str(response.json()))
+        self.assertIn('DUP0', str(response.json()))
+
+        response = post([row(3), row(4, email=self.student.user.email), row(5, student_id=self.student.student_id)])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(self.student.user.email, str(response.json()))
+        self.assertIn(self.student.student_id, str(response.json()))
+
+        self.assertEqual(post(row(6, email=self.student.user.email)).status_code, 400)
+        self.assertEqual(Student.objects.count(), before)
+
+        # Saving a student unchanged doesn't conflict with itself.
+        response = self.client.put(reverse('student-detail', args=[self.student.student_id]), {
+            'student_id': self.student.student_id, 'name': 'Ayesha Siddiqua', 'email': self.student.user.email,
+            'major': 'CSE', 'year': '2nd', 'gpa': '3.50',
+        }, content_type='application/json', **self.headers['admin'])
+        self.assertEqual(response.status_code, 200)
+
+    def test_hash_passwords_hashes_each_distinct_password_once(self):
+        raws = ['pw-a', 'pw-b', 'pw-a', 'pw-c', 'pw-d']
+        hashes = hash_passwords(raws, workers=2)
+        self.assertEqual(list(hashes), ['pw-a', 'pw-b', 'pw-c', 'pw-d'])
+        user = User(email='x@test.edu')
+        for raw, encoded in hashes.items():
+            user.password = encoded
+            self.assertTrue(user.check_password(raw))
+
+
+class LoginTests(QueryCountTestCase):
+
+    def login(self):
+        return self.client.post(reverse('token_obtain_pair'),
+                                {'email': self.student.user.email, 'password': PASSWORD},
+                                content_type='application/json')
+
+    def test_login_reads_one_row_and_caches_the_payload(self):
+        # The user joined with both profiles, plus simplejwt's outstanding-token insert.
+        with self.assertNumQueries(2):
+            user = self.login().json()['data']['user']
+        self.assertEqual(user, {'role': 'student', 'name': 'Ayesha Siddiqua',
+                                'email': self.student.user.email, 'id': 'STU001'})
+
+        # update() sends no signal, so the cached payload is still served...
+        Student.objects.filter(pk=self.student.pk).update(student_id='STU999')
+        self.assertEqual(self.login().json()['data']['user']['id'], 'STU001')
+        # ...until a save() of the profile invalidates it.
+        self.student.student_id = 'STU999'
+        self.student.save()
+        self.assertEqual(self.login().json()['data']['user']['id'], 'STU999')
+
+
+class ThrottleTests(QueryCountTestCase):
+
+    def forgot(self, email, ip='127.0.0.1'):
+        return self.client.post(reverse('forgot_password'), {'email': email},
+                                content_type='application/json', REMOTE_ADDR=ip)
+
+    def test_otp_requests_are_limited_per_ip_and_email(self):
+        email = self.student.user.email
+        # 'otp_send' is 5/hour: five emails, then 429 until a token comes back (12 min).
+        for _ in range(5):
+            self.assertEqual(self.forgot(email).status_code, 200)
+        response = self.forgot(email)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '720')
+        self.assertEqual(len(mail.outbox), 5)
+
+        # The email's bucket is empty from any address; a fresh address can still reach other accounts.
+        self.assertEqual(self.forgot(email, ip='10.0.0.2').status_code, 429)
+        self.assertEqual(self.forgot(self.faculty.user.email, ip='10.0.0.2').status_code, 200)
+
+        with mock.patch.object(TokenBucketThrottle, 'timer', lambda throttle: time.time() + 720):
+            self.assertEqual(self.forgot(email).status_code, 200)
+
+    def test_forwarded_for_does_not_pick_the_ip_bucket(self):
+        # 'login' is 10/min per IP; a made-up X-Forwarded-For on each attempt doesn't reset it.
+        login = lambda i: self.client.post(reverse('token_obtain_pair'),
+                                           {'email': f'nobody{i}@test.edu', 'password': 'wrong'},
+                                           content_type='application/json', HTTP_X_FORWARDED_FOR=f'198.51.100.{i}')
+        self.assertEqual({login(i).status_code for i in range(10)}, {401})
+        self.assertEqual(login(10).status_code, 429)
+
+
+class ValuesSerializerParityTests(QueryCountTestCase):
+
+    def test_lists_match_the_onboarding_serializers(self):
+        # No names, no specialization and a GPA with a fractional part.
+        Student.objects.create(
+            user=User.objects.create(username='blank', email='blank@test.edu', role='student'),
+            student_id='S99999', major='CSE', year='1st', current_gpa=Decimal('3.5'),
+        )
+        Faculty.objects.create(
+            user=User.objects.create(username='blankf', email='blankf@test.edu', role='faculty'),
+            faculty_id='F99999', department='CSE', join_date=datetime.date(2021, 2, 3),
+        )
+        lists = [
+            ('student-list-create', StudentSerializer, StudentValuesSerializer,
+             Student.objects.select_related('user').order_by('student_id')),
+            ('faculty-list-create', FacultySerializer, FacultyValuesSerializer,
+             Faculty.objects.select_related('user').order_by('faculty_id')),
+        ]
+        render = JSONRenderer().render
+        for name, serializer_class, values_class, queryset in lists:
+            with self.subTest(name):
+                drf_data = serializer_class(queryset, many=True).data
+                self.assertEqual(render(values_class(values_class.project(queryset)).data), render(drf_data))
+                response = self.client.get(reverse(name) + '?page_size=100', **self.headers['admin'])
+                self.assertEqual(render(response.json()['data']), render(drf_data))
+                self.assertIn('', [row['name'] for row in drf_data])
+
+        student = StudentSerializer(Student.objects.get(student_id='S99999')).data
+        self.assertEqual(student['gpa'], '3.50')
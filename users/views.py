@@ -1,7 +1,6 @@
 from rest_framework import status, generics
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework.pagination import PageNumberPagination
 from rest_framework_simplejwt.views import TokenObtainPairView
 from django.contrib.auth import get_user_model
 from django.core.mail import send_mail
@@ -16,9 +15,13 @@ from .serializers import (
     ResetPasswordSerializer,
     StudentSerializer,
     FacultySerializer,
+    StudentValuesSerializer,
+    FacultyValuesSerializer,
 )
 from .models import Student, Faculty, PasswordResetOTP
 from .permissions import IsAdminUser
+from config.pagination import KeysetPagination
+from config.throttling import TokenBucketThrottle
 
 User = get_user_model()
 
@@ -27,6 +30,8 @@ User = get_user_model()
 
 class CustomTokenObtainPairView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scope = 'login'
 
 
 class LogoutView(generics.GenericAPIView):
@@ -44,6 +49,9 @@ class ForgotPasswordView(generics.GenericAPIView):
     """Step 1: Send 4-digit OTP to user's email."""
     serializer_class = ForgotPasswordSerializer
     permission_classes = (AllowAny,)
+    # Every request sends an email: the tightest limit.
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scope = 'otp_send'
 
     def post(self, request):
         serializer = self.serializer_class(data=request.data)
@@ -85,6 +93,9 @@ class VerifyOTPView(generics.GenericAPIView):
     """Step 2: Verify OTP is correct and not expired."""
     serializer_class = VerifyOTPSerializer
     permission_classes = (AllowAny,)
+    # 4-digit codes: also keeps guessing one well below 10k tries.
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scope = 'otp_check'
 
     def post(self, request):
         serializer = self.serializer_class(data=request.data)
@@ -98,6 +109,8 @@ class ResetPasswordView(generics.GenericAPIView):
     """Step 3: Reset password after OTP verification."""
     serializer_class = ResetPasswordSerializer
     permission_classes = (AllowAny,)
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scope = 'otp_check'
 
     def post(self, request):
         serializer = self.serializer_class(data=request.data)
@@ -110,18 +123,27 @@ class ResetPasswordView(generics.GenericAPIView):
 
 # ─── Pagination ────────────────────────────────────────────────────────────
 
-class StandardPagination(PageNumberPagination):
+class StandardPagination(KeysetPagination):
     page_size = 5
     page_size_query_param = 'page_size'
     max_page_size = 100
 
 
+class BulkCreateMixin:
+    """POST a JSON list to onboard many accounts in one request (OnboardingListSerializer)."""
+
+    def get_serializer(self, *args, **kwargs):
+        if isinstance(kwargs.get('data'), list):
+            kwargs['many'] = True
+        return super().get_serializer(*args, **kwargs)
+
+
 # ─── Student Management Views (Admin Only) ─────────────────────────────────
 
-class StudentListCreateView(generics.ListCreateAPIView):
+class StudentListCreateView(BulkCreateMixin, generics.ListCreateAPIView):
     """
-    GET  /api/users/students/?search=&page=&page_size=5
-    POST /api/users/students/
+    GET  /api/users/students/?search=&page=&page_size=5&cursor=
+    POST /api/users/students/  (one student, or a list of them)
     """
     serializer_class = StudentSerializer
     permission_classes = [IsAdminUser]
@@ -139,6 +161,11 @@ class StudentListCreateView(generics.ListCreateAPIView):
             )
         return queryset.order_by('student_id')
 
+    def list(self, request, *args, **kwargs):
+        rows = StudentValuesSerializer.project(self.get_queryset())
+        page = self.paginate_queryset(rows)
+        return self.get_paginated_response(StudentValuesSerializer(page).data)
+
 
 class StudentDetailView(generics.RetrieveUpdateDestroyAPIView):
     """
@@ -162,10 +189,10 @@ class StudentDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 # ─── Faculty Management Views (Admin Only) ─────────────────────────────────
 
-class FacultyListCreateView(generics.ListCreateAPIView):
+class FacultyListCreateView(BulkCreateMixin, generics.ListCreateAPIView):
     """
-    GET  /api/users/faculty/?search=&page=&page_size=5
-    POST /api/users/faculty/
+    GET  /api/users/faculty/?search=&page=&page_size=5&cursor=
+    POST /api/users/faculty/  (one faculty member, or a list of them)
     """
     serializer_class = FacultySerializer
     permission_classes = [IsAdminUser]
@@ -184,6 +211,11 @@ class FacultyListCreateView(generics.ListCreateAPIView):
             )
         return queryset.order_by('faculty_id')
 
+    def list(self, request, *args, **kwargs):
+        rows = FacultyValuesSerializer.project(self.get_queryset())
+        page = self.paginate_queryset(rows)
+        return self.get_paginated_response(FacultyValuesSerializer(page).data)
+
 
 class FacultyDetailView(generics.RetrieveUpdateDestroyAPIView):
     """